@@ -0,0 +1,353 @@
+"""
+Local stand-in for the Exchange Rate API used by the benchmarks.
+
+The server speaks HTTP/1.1 with keep-alive so that connection reuse on the
+client side is actually measurable. HTTPS is enabled with a throwaway
+self-signed certificate generated through the ``openssl`` command line tool.
+
+It answers the v6 endpoints under ``/v6/{api_key}/...`` and the open access
+endpoint under ``/open/v6/latest/{base_code}`` with real-sized payloads, a rate
+for every bundled currency. A fixed latency and a share of failing responses can
+be injected to measure the client under a slow or degraded upstream, and bodies can
+be gzip compressed for clients that accept it.
+"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from typing import Dict, Optional, Tuple
+
+import gzip
+
+import json
+
+import os
+
+import random
+
+import shutil
+
+import ssl
+
+import subprocess
+
+import tempfile
+
+import threading
+
+import time
+
+from exchange_rate_api_client._currencies import BUNDLED_CURRENCIES
+
+
+RATES = {
+    code: 1.0 if code == "USD" else round(0.5 + i * 0.731, 4)
+    for i, code in enumerate(sorted(BUNDLED_CURRENCIES))
+}
+
+_UPDATE_FIELDS = {
+    "time_last_update_unix": 1585267200,
+    "time_last_update_utc": "Fri, 27 Mar 2020 00:00:00 +0000",
+    "time_next_update_unix": 1585353600,
+    "time_next_update_utc": "Sat, 28 Mar 2020 00:00:00 +0000",
+}
+
+LATEST_PAYLOAD = {
+    "result": "success",
+    **_UPDATE_FIELDS,
+    "base_code": "USD",
+    "conversion_rates": RATES,
+}
+
+CODES_PAYLOAD = {
+    "result": "success",
+    "supported_codes": [[code, name] for code, name in BUNDLED_CURRENCIES.items()],
+}
+
+QUOTA_PAYLOAD = {
+    "result": "success",
+    "plan_quota": 30000,
+    "requests_remaining": 25623,
+    "refresh_day_of_month": 17,
+}
+
+# Status codes the API uses for each error type
+ERROR_STATUS = {
+    "unsupported-code": 404,
+    "malformed-request": 400,
+    "invalid-key": 403,
+    "inactive-account": 403,
+    "quota-reached": 429,
+    "plan-upgrade-required": 403,
+    "no-data-available": 404,
+}
+
+
+def _rates_for(base_code: str, amount: float = 1) -> Dict[str, float]:
+    base_rate = RATES[base_code]
+    return {code: rate / base_rate * amount for code, rate in RATES.items()}
+
+
+def _target_data(code: str) -> dict:
+    return {
+        "locale": code,
+        "two_letter_code": code[:2],
+        "currency_name": BUNDLED_CURRENCIES[code],
+        "currency_name_short": BUNDLED_CURRENCIES[code].split()[-1],
+        "display_symbol": "0024",
+        "flag_url": f"https://www.exchangerate-api.com/img/docs/{code[:2]}.gif",
+    }
+
+
+def route(path: str) -> Tuple[int, dict]:
+    """Return the status code and payload the API would answer for a path."""
+    parts = path.strip("/").split("/")
+
+    if parts[:3] == ["open", "v6", "latest"] and len(parts) == 4:
+        base_code = parts[3]
+        if base_code not in RATES:
+            return 404, {"result": "error", "error-type": "unsupported-code"}
+        return 200, {
+            "result": "success",
+            **_UPDATE_FIELDS,
+            "time_eol_unix": 0,
+            "base_code": base_code,
+            "rates": _rates_for(base_code),
+        }
+
+    if len(parts) < 3 or parts[0] != "v6":
+        return 404, {"result": "error", "error-type": "malformed-request"}
+
+    endpoint, params = parts[2], parts[3:]
+
+    for code in params:
+        if code.isalpha() and code.isupper() and code not in RATES:
+            return 404, {"result": "error", "error-type": "unsupported-code"}
+
+    if endpoint == "codes":
+        return 200, CODES_PAYLOAD
+
+    if endpoint == "quota":
+        return 200, QUOTA_PAYLOAD
+
+    if endpoint == "latest" and len(params) == 1:
+        if params[0] == "USD":
+            return 200, LATEST_PAYLOAD
+        return 200, {
+            "result": "success",
+            **_UPDATE_FIELDS,
+            "base_code": params[0],
+            "conversion_rates": _rates_for(params[0]),
+        }
+
+    if endpoint in ("pair", "enriched") and len(params) >= 2:
+        base_code, target_code = params[:2]
+        rate = RATES[target_code] / RATES[base_code]
+        payload = {
+            "result": "success",
+            **_UPDATE_FIELDS,
+            "base_code": base_code,
+            "target_code": target_code,
+            "conversion_rate": rate,
+        }
+        if endpoint == "enriched":
+            payload["target_data"] = _target_data(target_code)
+        elif len(params) == 3:
+            payload["conversion_result"] = rate * float(params[2])
+        return 200, payload
+
+    if endpoint == "history" and len(params) >= 4:
+        base_code, year, month, day = params[:4]
+        amount = float(params[4]) if len(params) == 5 else 1
+        return 200, {
+            "result": "success",
+            "year": int(year),
+            "month": int(month),
+            "day": int(day),
+            "base_code": base_code,
+            "requested_amount": amount,
+            "conversion_amounts": _rates_for(base_code, amount),
+        }
+
+    return 400, {"result": "error", "error-type": "malformed-request"}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        server: "_StandInHTTPServer" = self.server
+
+        if server.latency:
+            time.sleep(server.latency)
+
+        encoding = None
+        if server.should_fail():
+            status, body = server.error_response()
+        elif server.compress and "gzip" in self.headers.get("Accept-Encoding", ""):
+            status, body = server.response_for(self.path, compressed=True)
+            encoding = "gzip"
+        else:
+            status, body = server.response_for(self.path)
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _StandInHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    latency = 0.0
+    error_rate = 0.0
+    error_type: Optional[str] = None
+    compress = False
+
+    def __init__(self, *args, seed: Optional[int] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        # Bodies are encoded once so that the server adds little work per request
+        self._bodies: Dict[Tuple[str, bool], Tuple[int, bytes]] = {}
+
+    def should_fail(self) -> bool:
+        if not self.error_rate:
+            return False
+        with self._lock:
+            return self._random.random() < self.error_rate
+
+    def error_response(self) -> Tuple[int, bytes]:
+        if self.error_type is None:
+            return 500, b'{"result": "error"}'
+        body = json.dumps({"result": "error", "error-type": self.error_type})
+        return ERROR_STATUS.get(self.error_type, 400), body.encode()
+
+    def response_for(self, path: str, compressed: bool = False) -> Tuple[int, bytes]:
+        response = self._bodies.get((path, compressed))
+        if response is None:
+            status, payload = route(path)
+            body = json.dumps(payload).encode()
+            if compressed:
+                body = gzip.compress(body)
+            response = self._bodies[(path, compressed)] = (status, body)
+        return response
+
+
+def _generate_certificate(directory: str):
+    if shutil.which("openssl") is None:
+        raise RuntimeError("The openssl command is required to run the HTTPS stand-in")
+
+    certfile = os.path.join(directory, "cert.pem")
+    keyfile = os.path.join(directory, "key.pem")
+
+    subprocess.run(
+        [
+            "openssl",
+            "req",
+            "-x509",
+            "-newkey",
+            "rsa:2048",
+            "-nodes",
+            "-days",
+            "1",
+            "-subj",
+            "/CN=localhost",
+            "-addext",
+            "subjectAltName=DNS:localhost,IP:127.0.0.1",
+            "-keyout",
+            keyfile,
+            "-out",
+            certfile,
+        ],
+        check=True,
+        capture_output=True,
+    )
+
+    return certfile, keyfile
+
+
+class StandInServer:
+    """
+    Run the stand-in on a random local port in a background thread.
+
+    Args:
+        tls (bool): Serve HTTPS with a self-signed certificate.
+        latency (float): Seconds to wait before answering each request.
+        error_rate (float): Share of requests, between 0 and 1, answered with an error.
+        error_type (Optional[str]): The API error type of injected errors, such as
+            ``quota-reached``. None injects 500 responses.
+        seed (Optional[int]): Seed of the error injection, for reproducible runs.
+        compress (bool): Gzip the bodies of clients that accept it.
+
+    Example:
+        ```python
+        with StandInServer(tls=True, latency=0.02) as server:
+            session.verify = server.certfile
+            session.get(f"{server.url}/v6/key/latest/USD")
+        ```
+    """
+
+    def __init__(
+        self,
+        tls: bool = True,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        error_type: Optional[str] = None,
+        seed: Optional[int] = None,
+        compress: bool = False,
+    ):
+        self.tls = tls
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_type = error_type
+        self.seed = seed
+        self.compress = compress
+        self.certfile = None
+        self._tmpdir = None
+        self._httpd = None
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        scheme = "https" if self.tls else "http"
+        host, port = self._httpd.server_address[:2]
+        return f"{scheme}://localhost:{port}"
+
+    def start(self):
+        self._httpd = _StandInHTTPServer(("127.0.0.1", 0), _Handler, seed=self.seed)
+        self._httpd.latency = self.latency
+        self._httpd.error_rate = self.error_rate
+        self._httpd.error_type = self.error_type
+        self._httpd.compress = self.compress
+
+        if self.tls:
+            self._tmpdir = tempfile.mkdtemp()
+            self.certfile, keyfile = _generate_certificate(self._tmpdir)
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            context.load_cert_chain(self.certfile, keyfile)
+            self._httpd.socket = context.wrap_socket(
+                self._httpd.socket, server_side=True
+            )
+
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._tmpdir:
+            shutil.rmtree(self._tmpdir, ignore_errors=True)
+
+    def __enter__(self) -> "StandInServer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
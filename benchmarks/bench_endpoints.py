@@ -0,0 +1,264 @@
+"""
+Benchmark every public method of the clients, and the open access
+``fetch_exchange_rates``, against the local stand-in of the Exchange Rate API.
+
+Each method reports its throughput, p50/p99 latency and the peak memory it
+allocates per call. Results can be saved as JSON and compared with a previous
+run to spot performance changes.
+
+Run from the repository root:
+
+    python benchmarks/bench_endpoints.py --calls 200 --json after.json --baseline before.json
+    python benchmarks/bench_endpoints.py --latency 0.02 --error-rate 0.1 --error-type quota-reached
+    python benchmarks/bench_endpoints.py --filter async
+    python benchmarks/bench_endpoints.py --compress
+
+Allocations are measured with tracemalloc while the stand-in runs in the same
+process, so they include its share of the work, which stays the same from run to
+run.
+"""
+
+from typing import Any, Callable, Dict, List, NamedTuple
+
+import argparse
+
+import asyncio
+
+import json
+
+import os
+
+import statistics
+
+import sys
+
+import time
+
+import tracemalloc
+
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from _server import StandInServer  # noqa: E402
+
+from exchange_rate_api_client import (  # noqa: E402
+    AsyncExchangeRateApiV6Client,
+    BUNDLED_CURRENCY_CODES,
+    ExchangeRateApiV6Client,
+    fetch_exchange_rates,
+)
+
+from exchange_rate_api_client import _open  # noqa: E402
+
+
+class Case(NamedTuple):
+    name: str
+    call: Callable[[], Any]
+
+
+def _sync_cases(client: ExchangeRateApiV6Client) -> List[Case]:
+    bases = ["USD", "EUR", "GBP", "JPY", "CHF"] * 2000
+    targets = ["EUR", "JPY", "USD", "CAD", "AUD"] * 2000
+    amounts = list(range(len(bases)))
+
+    return [
+        Case("fetch_exchange_rates", lambda: client.fetch_exchange_rates("USD")),
+        Case("pair_conversion", lambda: client.pair_conversion("USD", "EUR", 100)),
+        Case("fetch_enriched_data", lambda: client.fetch_enriched_data("USD", "JPY")),
+        Case(
+            "fetch_historical_data",
+            lambda: client.fetch_historical_data("USD", date(2020, 3, 27), 100),
+        ),
+        Case(
+            "fetch_historical_range (7 days)",
+            lambda: client.fetch_historical_range(
+                "USD", date(2020, 3, 21), date(2020, 3, 27)
+            ),
+        ),
+        Case("fetch_cross_rates", lambda: client.fetch_cross_rates("USD")),
+        Case(
+            "convert_many (10k rows)",
+            lambda: client.convert_many(amounts, bases, targets),
+        ),
+        Case("fetch_quota_info", lambda: client.fetch_quota_info()),
+    ]
+
+
+def _async_cases(
+    client: AsyncExchangeRateApiV6Client, loop: asyncio.AbstractEventLoop
+) -> List[Case]:
+    def run(coroutine_function):
+        return lambda: loop.run_until_complete(coroutine_function())
+
+    return [
+        Case(
+            "async fetch_exchange_rates",
+            run(lambda: client.fetch_exchange_rates("USD")),
+        ),
+        Case(
+            "async pair_conversion",
+            run(lambda: client.pair_conversion("USD", "EUR", 100)),
+        ),
+        Case(
+            "async fetch_enriched_data",
+            run(lambda: client.fetch_enriched_data("USD", "JPY")),
+        ),
+        Case(
+            "async fetch_historical_data",
+            run(lambda: client.fetch_historical_data("USD", date(2020, 3, 27), 100)),
+        ),
+        Case("async fetch_quota_info", run(lambda: client.fetch_quota_info())),
+    ]
+
+
+def _measure(case: Case, calls: int, warmup: int, alloc_calls: int) -> Dict[str, Any]:
+    errors = 0
+
+    def call():
+        nonlocal errors
+        try:
+            case.call()
+        except Exception:
+            errors += 1
+
+    for _ in range(warmup):
+        call()
+    errors = 0
+
+    samples = []
+    started = time.perf_counter()
+    for _ in range(calls):
+        start = time.perf_counter()
+        call()
+        samples.append(time.perf_counter() - start)
+    elapsed = time.perf_counter() - started
+
+    peaks = []
+    tracemalloc.start()
+    try:
+        for _ in range(alloc_calls):
+            tracemalloc.reset_peak()
+            current = tracemalloc.get_traced_memory()[0]
+            call()
+            peaks.append(tracemalloc.get_traced_memory()[1] - current)
+    finally:
+        tracemalloc.stop()
+
+    samples.sort()
+    return {
+        "calls_per_second": calls / elapsed,
+        "p50_ms": statistics.median(samples) * 1000,
+        "p99_ms": samples[max(0, int(len(samples) * 0.99) - 1)] * 1000,
+        "peak_kib_per_call": statistics.median(peaks) / 1024 if peaks else 0.0,
+        "error_rate": errors / (calls + alloc_calls),
+    }
+
+
+def _print_header():
+    print(
+        f"{'method':<34} {'calls/s':>9} {'p50 ms':>9} {'p99 ms':>9} "
+        f"{'KiB/call':>9} {'errors':>7}"
+    )
+
+
+def _print_result(name: str, result: Dict[str, Any], baseline: Dict[str, Any]):
+    line = (
+        f"{name:<34} {result['calls_per_second']:9.1f} {result['p50_ms']:9.3f} "
+        f"{result['p99_ms']:9.3f} {result['peak_kib_per_call']:9.1f} "
+        f"{result['error_rate']:7.1%}"
+    )
+    previous = baseline.get(name)
+    if previous:
+        change = result["p50_ms"] / previous["p50_ms"] - 1
+        line += f"   p50 {change:+.1%} vs baseline"
+    print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--alloc-calls", type=int, default=20)
+    parser.add_argument("--tls", action="store_true", help="Serve the stand-in over HTTPS")
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-type", default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--compress", action="store_true", help="Gzip the bodies of the stand-in"
+    )
+    parser.add_argument("--filter", default="", help="Only run methods containing this")
+    parser.add_argument("--json", help="Save the results to this file")
+    parser.add_argument("--baseline", help="Compare with results saved by --json")
+    args = parser.parse_args()
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+
+    server = StandInServer(
+        tls=args.tls,
+        latency=args.latency,
+        error_rate=args.error_rate,
+        error_type=args.error_type,
+        seed=args.seed,
+        compress=args.compress,
+    )
+
+    results = {}
+    with server:
+        os.environ["NO_PROXY"] = "localhost,127.0.0.1"
+        if args.tls:
+            # Trusted by requests.get, pooled sessions and httpx alike
+            os.environ["REQUESTS_CA_BUNDLE"] = server.certfile
+            os.environ["SSL_CERT_FILE"] = server.certfile
+
+        client = ExchangeRateApiV6Client(
+            "bench-key",
+            codes_snapshot=BUNDLED_CURRENCY_CODES,
+            codes_refresh_interval=None,
+        )
+        client._EXCHANGE_RATE_API_V6_URL = f"{server.url}/v6"
+
+        loop = asyncio.new_event_loop()
+        async_client = AsyncExchangeRateApiV6Client("bench-key")
+        async_client._EXCHANGE_RATE_API_V6_URL = f"{server.url}/v6"
+
+        _open._OPEN_EXCHANGE_RATE_API_URL = f"{server.url}/open/v6"
+
+        cases = _sync_cases(client)
+        cases.append(Case("open fetch_exchange_rates", lambda: fetch_exchange_rates("USD")))
+        cases.extend(_async_cases(async_client, loop))
+
+        _print_header()
+        try:
+            for case in cases:
+                if args.filter not in case.name:
+                    continue
+                result = _measure(case, args.calls, args.warmup, args.alloc_calls)
+                results[case.name] = result
+                _print_result(case.name, result, baseline)
+        finally:
+            stats = client.transfer_stats
+            if stats.responses:
+                print(
+                    f"\nsync client bodies: {stats.compressed_bytes / 1024:.0f} KiB on the "
+                    f"wire, {stats.uncompressed_bytes / 1024:.0f} KiB decoded "
+                    f"({stats.encodings})"
+                )
+            client.close()
+            loop.run_until_complete(async_client.aclose())
+            loop.close()
+
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
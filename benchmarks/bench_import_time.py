@@ -0,0 +1,78 @@
+"""
+Measure how long importing the package takes with ``python -X importtime``, for the
+bare package and for the first access of its main entry points.
+
+Run from the repository root:
+
+    python benchmarks/bench_import_time.py --runs 5
+
+Pass ``--max-ms`` to exit with an error when the bare package import regresses past
+a budget, for example in CI.
+"""
+
+import argparse
+
+import os
+
+import statistics
+
+import subprocess
+
+import sys
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PACKAGE = "exchange_rate_api_client"
+
+SCENARIOS = {
+    "import package": f"import {PACKAGE}",
+    "ExchangeRateApiV6Client": f"from {PACKAGE} import ExchangeRateApiV6Client",
+    "AsyncExchangeRateApiV6Client": f"from {PACKAGE} import AsyncExchangeRateApiV6Client",
+    "CrossRateMatrix": f"from {PACKAGE} import CrossRateMatrix",
+}
+
+
+def _import_time_us(code: str) -> int:
+    """Cumulative microseconds spent in the package's own imports."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=ROOT,
+    )
+
+    total = 0
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        parts = line.split("|")
+        if len(parts) != 3 or not parts[0].startswith("import time:"):
+            continue
+        name = parts[2]
+        depth = len(name) - len(name.lstrip())
+        # Top-level imports triggered by the code, including the package's submodules
+        if depth == 1 and name.strip().startswith(PACKAGE):
+            total += int(parts[1])
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--max-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    medians = {}
+    for label, code in SCENARIOS.items():
+        samples = [_import_time_us(code) / 1000 for _ in range(args.runs)]
+        medians[label] = statistics.median(samples)
+        print(f"{label:<32} {medians[label]:8.2f} ms")
+
+    if args.max_ms is not None and medians["import package"] > args.max_ms:
+        print(f"Importing the package exceeds the {args.max_ms} ms budget")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Compare building response models with full pydantic validation against the trusted
+``model_construct`` fast path, on payloads with a rate for every bundled currency.
+
+Run from the repository root:
+
+    python benchmarks/bench_model_construct.py --iterations 20000
+"""
+
+import argparse
+
+import os
+
+import sys
+
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from exchange_rate_api_client import BUNDLED_CURRENCY_CODES  # noqa: E402
+
+from exchange_rate_api_client._base import construct_trusted  # noqa: E402
+
+from exchange_rate_api_client.commons import (  # noqa: E402
+    ExclusiveExchangeRates,
+    HistoricalData,
+)
+
+
+def _rates():
+    return {code: 1 + i / 7 for i, code in enumerate(sorted(BUNDLED_CURRENCY_CODES))}
+
+
+LATEST_PAYLOAD = {
+    "result": "success",
+    "time_last_update_unix": 1585267200,
+    "time_last_update_utc": "Fri, 27 Mar 2020 00:00:00 +0000",
+    "time_next_update_unix": 1585353700,
+    "time_next_update_utc": "Sat, 28 Mar 2020 00:00:00 +0000",
+    "base_code": "USD",
+    "conversion_rates": _rates(),
+}
+
+HISTORICAL_PAYLOAD = {
+    "result": "success",
+    "year": 2015,
+    "month": 2,
+    "day": 22,
+    "base_code": "USD",
+    "requested_amount": 4,
+    "conversion_amounts": _rates(),
+}
+
+
+def _bench(label: str, func, iterations: int) -> float:
+    per_call = min(timeit.repeat(func, number=iterations, repeat=5)) / iterations
+    print(f"{label:<42} {per_call * 1e6:8.2f} us/call")
+    return per_call
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    print(f"{len(LATEST_PAYLOAD['conversion_rates'])} rates per payload\n")
+
+    for model, payload in (
+        (ExclusiveExchangeRates, LATEST_PAYLOAD),
+        (HistoricalData, HISTORICAL_PAYLOAD),
+    ):
+        validated = _bench(
+            f"{model.__name__}.model_validate",
+            lambda: model.model_validate(payload),
+            args.iterations,
+        )
+        trusted = _bench(
+            f"construct_trusted({model.__name__})",
+            lambda: construct_trusted(model, payload),
+            args.iterations,
+        )
+        print(f"{'speedup':<42} {validated / trusted:8.1f}x\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Compare per-request latency of one-shot ``requests.get`` calls against the
+pooled keep-alive session owned by ``ExchangeRateApiV6Client``.
+
+Run from the repository root:
+
+    python benchmarks/bench_session_pool.py --requests 200
+"""
+
+import argparse
+
+import os
+
+import statistics
+
+import sys
+
+import time
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from _server import StandInServer  # noqa: E402
+
+from exchange_rate_api_client import ExchangeRateApiV6Client  # noqa: E402
+
+
+def _summarize(label: str, samples):
+    samples = sorted(samples)
+    p50 = statistics.median(samples) * 1000
+    p99 = samples[int(len(samples) * 0.99) - 1] * 1000
+    print(f"{label:<24} p50={p50:8.3f} ms   p99={p99:8.3f} ms")
+    return p50
+
+
+def bench_one_shot(url: str, certfile: str, n: int):
+    samples = []
+    for _ in range(n):
+        start = time.perf_counter()
+        requests.get(url, timeout=10, verify=certfile).json()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def bench_pooled(server: StandInServer, n: int):
+    client = ExchangeRateApiV6Client("bench-key")
+    client._EXCHANGE_RATE_API_V6_URL = f"{server.url}/v6"
+    client.session.trust_env = False  # Keep REQUESTS_CA_BUNDLE from overriding verify
+    client.session.verify = server.certfile
+
+    samples = []
+    with client:
+        client.fetch_exchange_rates("USD")  # Warm up codes cache and connection
+        for _ in range(n):
+            start = time.perf_counter()
+            client.fetch_exchange_rates("USD")
+            samples.append(time.perf_counter() - start)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    with StandInServer(tls=True) as server:
+        url = f"{server.url}/v6/bench-key/latest/USD"
+
+        one_shot = _summarize(
+            "requests.get (new TLS)", bench_one_shot(url, server.certfile, args.requests)
+        )
+        pooled = _summarize("pooled session", bench_pooled(server, args.requests))
+
+    print(f"speedup at p50: {one_shot / pooled:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
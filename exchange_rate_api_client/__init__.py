@@ -5,25 +5,136 @@ __all__ = [
     "TargetData",
     "EnrichedData",
     "HistoricalData",
+    "HistoricalRange",
     "APIQuotaStatus",
-    "Currency",
     "ExchangeRateApiV6Client",
+    "AsyncExchangeRateApiV6Client",
+    "create_session",
+    "create_async_session",
+    "LatestRatesCache",
+    "CrossRateMatrix",
+    "BatchConversion",
+    "HistoricalStore",
+    "HistoricalRateArchive",
+    "BUNDLED_CURRENCIES",
+    "BUNDLED_CURRENCY_CODES",
+    "RequestCoalescer",
+    "AsyncRequestCoalescer",
+    "TokenBucket",
+    "QuotaGovernor",
+    "RetryPolicy",
+    "CircuitBreaker",
+    "RatesPrefetcher",
+    "MultiKeyExchangeRateApiV6Client",
+    "KeyStatus",
+    "RequestEvent",
+    "LatencyHistogram",
     "exceptions",
+    "OpenExchangeRateClient",
     "fetch_exchange_rates",
 ]
 
 
-from .commons import (
-    ExclusiveExchangeRates,
-    PairConversion,
-    TargetData,
-    EnrichedData,
-    HistoricalData,
-    APIQuotaStatus,
-)
+from typing import TYPE_CHECKING, Any
 
-from ._client import ExchangeRateApiV6Client
+import importlib
 
 from . import exceptions
 
-from ._open import fetch_exchange_rates
+
+# Submodules are imported on first attribute access, so that importing the package
+# does not load requests, pydantic, httpx or numpy until they are needed
+_LAZY_ATTRIBUTES = {
+    "ExclusiveExchangeRates": ".commons",
+    "ExchangeRates": ".commons",
+    "PairConversion": ".commons",
+    "TargetData": ".commons",
+    "EnrichedData": ".commons",
+    "HistoricalData": ".commons",
+    "HistoricalRange": ".commons",
+    "APIQuotaStatus": ".commons",
+    "ExchangeRateApiV6Client": "._client",
+    "AsyncExchangeRateApiV6Client": "._async_client",
+    "create_async_session": "._async_client",
+    "create_session": "._session",
+    "LatestRatesCache": "._cache",
+    "CrossRateMatrix": "._cross_rates",
+    "BatchConversion": "._batch",
+    "HistoricalStore": "._historical_store",
+    "HistoricalRateArchive": "._archive",
+    "BUNDLED_CURRENCIES": "._currencies",
+    "BUNDLED_CURRENCY_CODES": "._currencies",
+    "RequestCoalescer": "._coalesce",
+    "AsyncRequestCoalescer": "._coalesce",
+    "TokenBucket": "._rate_limit",
+    "QuotaGovernor": "._rate_limit",
+    "RetryPolicy": "._resilience",
+    "CircuitBreaker": "._resilience",
+    "RatesPrefetcher": "._prefetch",
+    "MultiKeyExchangeRateApiV6Client": "._key_pool",
+    "KeyStatus": "._key_pool",
+    "RequestEvent": "._instrumentation",
+    "LatencyHistogram": "._instrumentation",
+    "OpenExchangeRateClient": "._open",
+    "fetch_exchange_rates": "._open",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache the attribute so that later accesses skip this function
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+if TYPE_CHECKING:
+    from .commons import (
+        ExclusiveExchangeRates,
+        ExchangeRates,
+        PairConversion,
+        TargetData,
+        EnrichedData,
+        HistoricalData,
+        HistoricalRange,
+        APIQuotaStatus,
+    )
+
+    from ._client import ExchangeRateApiV6Client
+
+    from ._async_client import AsyncExchangeRateApiV6Client, create_async_session
+
+    from ._session import create_session
+
+    from ._cache import LatestRatesCache
+
+    from ._cross_rates import CrossRateMatrix
+
+    from ._batch import BatchConversion
+
+    from ._historical_store import HistoricalStore
+
+    from ._archive import HistoricalRateArchive
+
+    from ._currencies import BUNDLED_CURRENCIES, BUNDLED_CURRENCY_CODES
+
+    from ._coalesce import RequestCoalescer, AsyncRequestCoalescer
+
+    from ._rate_limit import TokenBucket, QuotaGovernor
+
+    from ._resilience import RetryPolicy, CircuitBreaker
+
+    from ._prefetch import RatesPrefetcher
+
+    from ._key_pool import MultiKeyExchangeRateApiV6Client, KeyStatus
+
+    from ._instrumentation import RequestEvent, LatencyHistogram
+
+    from ._open import OpenExchangeRateClient, fetch_exchange_rates
@@ -0,0 +1,318 @@
+from typing import Dict, Iterable, Optional, Tuple
+
+from .commons import HistoricalData
+
+from ._cross_rates import np, _require_numpy
+
+from datetime import date
+
+import json
+
+import os
+
+
+class HistoricalRateArchive:
+    """
+    Columnar on-disk archive of historical rates for one base currency.
+
+    Rates are kept as a dense float64 matrix of dates × currency ordinals in a ``.npy``
+    file, next to a sorted date index and a currency index. Opening an archive memory
+    maps the files, so queries such as one currency over ten years are array slices
+    without copying or building model objects. Cells of currencies that were not
+    reported on a day are NaN. Stored rates are per one unit of the base currency.
+
+    Example:
+        ```python
+        with HistoricalRateArchive("usd-history", base_code="USD", writable=True) as archive:
+            archive.extend(client.fetch_historical_range("USD", start, end).data)
+
+        archive = HistoricalRateArchive("usd-history")
+        eur = archive.column("EUR", date(2015, 1, 1), date(2024, 12, 31))
+        ```
+    """
+
+    _META_FILE = "meta.json"
+    _RATES_FILE = "rates.npy"
+    _DATES_FILE = "dates.npy"
+
+    def __init__(
+        self,
+        directory: str,
+        base_code: Optional[str] = None,
+        writable: bool = False,
+        initial_capacity: Tuple[int, int] = (366, 256),
+    ):
+        """
+        Args:
+            directory (str): Directory holding the archive files.
+            base_code (Optional[str]): Base currency of the archive. Required to create a
+                new archive, checked against the stored one otherwise.
+            writable (bool): Open for appending. A missing archive is created.
+            initial_capacity (Tuple[int, int]): Preallocated dates and currencies of a new
+                archive. Files grow by doubling when full.
+
+        Raises:
+            ImportError: If numpy is not installed.
+            ValueError: If one of the given arguments is invalid
+            FileNotFoundError: If the archive does not exist and is opened read only.
+        """
+        _require_numpy()
+
+        self._directory = directory
+        self._writable = writable
+
+        meta_path = os.path.join(directory, self._META_FILE)
+
+        if os.path.exists(meta_path):
+            with open(meta_path) as meta_file:
+                meta = json.load(meta_file)
+            if base_code is not None and base_code != meta["base_code"]:
+                raise ValueError(
+                    f"The archive base code is {meta['base_code']}, not {base_code}"
+                )
+        elif writable:
+            if not isinstance(base_code, str):
+                raise ValueError("A base code is required to create an archive")
+            os.makedirs(directory, exist_ok=True)
+            meta = {"base_code": base_code, "currencies": [], "length": 0}
+            self._allocate(initial_capacity)
+            self._write_meta(meta)
+        else:
+            raise FileNotFoundError(f"No historical rate archive in {directory}")
+
+        self._base_code: str = meta["base_code"]
+        self._currencies = list(meta["currencies"])
+        self._ordinals: Dict[str, int] = {
+            code: ordinal for ordinal, code in enumerate(self._currencies)
+        }
+        self._length: int = meta["length"]
+        self._load()
+
+    @property
+    def base_code(self) -> str:
+        return self._base_code
+
+    @property
+    def currencies(self) -> Tuple[str, ...]:
+        """Currency codes ordered by ordinal."""
+        return tuple(self._currencies)
+
+    @property
+    def dates(self) -> "np.ndarray":
+        """Sorted ``datetime64[D]`` index of the archived days."""
+        return self._dates[: self._length]
+
+    @property
+    def rates(self) -> "np.ndarray":
+        """Memory mapped dates × currencies rate matrix."""
+        return self._rates[: self._length, : len(self._currencies)]
+
+    def __len__(self) -> int:
+        return self._length
+
+    def date_slice(
+        self, start_date: Optional[date] = None, end_date: Optional[date] = None
+    ) -> slice:
+        """
+        Row slice covering the archived days between two dates, both inclusive.
+        """
+        dates = self.dates
+        start = 0
+        stop = self._length
+        if start_date is not None:
+            start = int(np.searchsorted(dates, np.datetime64(start_date, "D"), "left"))
+        if end_date is not None:
+            stop = int(np.searchsorted(dates, np.datetime64(end_date, "D"), "right"))
+        return slice(start, stop)
+
+    def column(
+        self,
+        code: str,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> "np.ndarray":
+        """
+        View of the rates of one currency between two dates, both inclusive.
+
+        Raises:
+            KeyError: If the currency is not archived.
+        """
+        return self.rates[self.date_slice(start_date, end_date), self._ordinals[code]]
+
+    def row(self, date_obj: date) -> "np.ndarray":
+        """
+        View of the rates of every currency on one day, ordered as `currencies`.
+
+        Raises:
+            KeyError: If the day is not archived.
+        """
+        day = np.datetime64(date_obj, "D")
+        position = int(np.searchsorted(self.dates, day))
+        if position == self._length or self._dates[position] != day:
+            raise KeyError(f"{date_obj} is not archived")
+        return self.rates[position]
+
+    def append(self, data: HistoricalData):
+        """
+        Write the rates of one day. An already archived day is overwritten.
+        """
+        self.extend([data])
+
+    def extend(self, items: Iterable[HistoricalData]):
+        """
+        Write the rates of several days, updating the index files once.
+
+        Raises:
+            ValueError: If the archive is read only, or an item has another base code or a
+                requested amount of 0.
+        """
+        if not self._writable:
+            raise ValueError("The archive was opened read only")
+
+        # Check every item first, so that an invalid one does not leave half a batch
+        days: Dict["np.datetime64", HistoricalData] = {}
+        for data in items:
+            self._check_day(data)
+            # A later item for the same day wins, as if written one after the other
+            days[np.datetime64(date(data.year, data.month, data.day), "D")] = data
+
+        try:
+            self._write_days(days)
+        finally:
+            self._rates.flush()
+            self._dates.flush()
+            self._write_meta(
+                {
+                    "base_code": self._base_code,
+                    "currencies": self._currencies,
+                    "length": self._length,
+                }
+            )
+
+    def flush(self):
+        if self._writable:
+            self._rates.flush()
+            self._dates.flush()
+
+    def close(self):
+        self.flush()
+        self._rates = None
+        self._dates = None
+
+    def __enter__(self) -> "HistoricalRateArchive":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _check_day(self, data: HistoricalData):
+        if data.base_code != self._base_code:
+            raise ValueError(
+                f"Cannot archive {data.base_code} data in a {self._base_code} archive"
+            )
+
+        if data.requested_amount == 0:
+            raise ValueError("Cannot archive data requested with an amount of 0")
+
+    def _write_days(self, days: Dict["np.datetime64", HistoricalData]):
+        for data in days.values():
+            for code in data.conversion_amounts:
+                if code not in self._ordinals:
+                    self._ordinals[code] = len(self._currencies)
+                    self._currencies.append(code)
+
+        rows, columns = self._rates.shape
+        if len(self._currencies) > columns:
+            self._allocate((rows, max(columns * 2, len(self._currencies))))
+            self._load()
+
+        # Archived days are overwritten in place, new ones are appended at the end
+        length = self._length
+        new_days = []
+        for day in sorted(days):
+            position = int(np.searchsorted(self._dates[:length], day))
+            if position < length and self._dates[position] == day:
+                self._write_row(position, days[day])
+            else:
+                new_days.append(day)
+
+        if not new_days:
+            return
+
+        end = length + len(new_days)
+        rows = self._rates.shape[0]
+        if end > rows:
+            self._allocate((max(rows * 2, end), self._rates.shape[1]))
+            self._load()
+
+        for position, day in enumerate(new_days, length):
+            self._dates[position] = day
+            self._write_row(position, days[day])
+
+        # Both runs are sorted, so one stable argsort merges them. Only the rows from
+        # the first new day on move, and appending later days moves none.
+        first = int(np.searchsorted(self._dates[:length], new_days[0]))
+        if first < length:
+            order = np.argsort(self._dates[first:end], kind="stable")
+            self._rates[first:end] = self._rates[first:end][order]
+            self._dates[first:end] = self._dates[first:end][order]
+
+        self._length = end
+
+    def _write_row(self, position: int, data: HistoricalData):
+        ordinals = [self._ordinals[code] for code in data.conversion_amounts]
+        values = np.fromiter(
+            data.conversion_amounts.values(),
+            dtype=np.float64,
+            count=len(ordinals),
+        )
+
+        self._rates[position] = np.nan
+        self._rates[position, ordinals] = values / data.requested_amount
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self._directory, name)
+
+    def _allocate(self, shape: Tuple[int, int]):
+        rows, columns = shape
+        old_rates = getattr(self, "_rates", None)
+        old_dates = getattr(self, "_dates", None)
+
+        rates = np.lib.format.open_memmap(
+            self._path(self._RATES_FILE + ".tmp"),
+            mode="w+",
+            dtype=np.float64,
+            shape=(rows, columns),
+        )
+        rates[:] = np.nan
+        dates = np.lib.format.open_memmap(
+            self._path(self._DATES_FILE + ".tmp"),
+            mode="w+",
+            dtype="datetime64[D]",
+            shape=(rows,),
+        )
+
+        if old_rates is not None:
+            old_rows, old_columns = old_rates.shape
+            rates[:old_rows, :old_columns] = old_rates
+            dates[:old_rows] = old_dates
+
+        rates.flush()
+        dates.flush()
+        del rates, dates, old_rates, old_dates
+        self._rates = None
+        self._dates = None
+
+        os.replace(self._path(self._RATES_FILE + ".tmp"), self._path(self._RATES_FILE))
+        os.replace(self._path(self._DATES_FILE + ".tmp"), self._path(self._DATES_FILE))
+
+    def _load(self):
+        mode = "r+" if self._writable else "r"
+        self._rates = np.load(self._path(self._RATES_FILE), mmap_mode=mode)
+        self._dates = np.load(self._path(self._DATES_FILE), mmap_mode=mode)
+
+    def _write_meta(self, meta: dict):
+        tmp_path = self._path(self._META_FILE + ".tmp")
+        with open(tmp_path, "w") as meta_file:
+            json.dump(meta, meta_file)
+        os.replace(tmp_path, self._path(self._META_FILE))
@@ -0,0 +1,411 @@
+from typing import Optional, Any, Callable
+
+from .commons import (
+    ExclusiveExchangeRates,
+    PairConversion,
+    EnrichedData,
+    HistoricalData,
+    APIQuotaStatus,
+)
+
+from .exceptions import (
+    UnsupportedCode,
+    RequestTimeout,
+    ConnectionFailed,
+    ServerError,
+)
+
+from ._error_handlers import ErrorDispatch, raise_for_error_type
+
+from ._base import BaseExchangeRateApiV6Client
+
+from ._json import decode_response
+
+from ._coalesce import AsyncRequestCoalescer
+
+from ._resilience import RetryPolicy, CircuitBreaker
+
+from ._compression import TransferStats, accept_encoding
+
+import asyncio
+
+import time
+
+from datetime import date
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - exercised only without the extra
+    httpx = None
+
+if httpx is not None:
+
+    class _ConnectionFailed(ConnectionFailed, httpx.TransportError):
+        """
+        Raised by the async client, so that handlers written for the
+        `httpx.TransportError` it used to raise keep catching it.
+        """
+
+
+def _require_httpx():
+    if httpx is None:
+        raise ImportError(
+            "The async client requires httpx. "
+            "Install it with: pip install exchange-rate-api-client[async]"
+        )
+
+
+def create_async_session(
+    max_connections: int = 100,
+    max_keepalive_connections: int = 20,
+    keepalive_expiry: float = 5.0,
+) -> "httpx.AsyncClient":
+    """
+    Create a pooled async HTTP client that can be shared between async API clients.
+
+    Like `create_session`, it asks for compressed responses with every codec installed.
+
+    Args:
+        max_connections (int): Maximum number of concurrent connections.
+        max_keepalive_connections (int): Maximum number of idle connections kept alive.
+        keepalive_expiry (float): Seconds an idle connection is kept in the pool.
+
+    Returns:
+        httpx.AsyncClient: A pooled client.
+
+    Raises:
+        ImportError: If httpx is not installed.
+        ValueError: If one of the given arguments is invalid
+    """
+    _require_httpx()
+
+    if not isinstance(max_connections, int) or max_connections < 1:
+        raise ValueError("Max connections must be an integer greater than 0")
+
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+    )
+
+    # httpx decodes brotli and zstd only when their optional codecs are installed
+    decoders = getattr(
+        getattr(httpx, "_decoders", None), "SUPPORTED_DECODERS", ("gzip", "deflate")
+    )
+
+    return httpx.AsyncClient(
+        limits=limits, headers={"Accept-Encoding": accept_encoding(decoders)}
+    )
+
+
+class AsyncExchangeRateApiV6Client(BaseExchangeRateApiV6Client):
+    def __init__(
+        self,
+        api_key: str,
+        session: Optional["httpx.AsyncClient"] = None,
+        timeout: float = BaseExchangeRateApiV6Client._DEFAULT_TIMEOUT,
+        max_concurrency: int = 100,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        coalescer: Optional[AsyncRequestCoalescer] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        strict_validation: bool = False,
+    ):
+        """
+        Create an asyncio client bound to an API key.
+
+        Args:
+            api_key (str): The Exchange Rate API key.
+            session (Optional[httpx.AsyncClient]): A pooled client to share with other
+                clients. When given, the pool options below are ignored and the session
+                is not closed by this client.
+            timeout (float): Seconds to wait for the API before giving up.
+            max_concurrency (int): Maximum number of requests in flight at once.
+                Further calls wait for a free slot.
+            max_connections (int): Maximum number of concurrent connections.
+            max_keepalive_connections (int): Maximum number of idle connections kept alive.
+            coalescer (Optional[AsyncRequestCoalescer]): Coalesces identical in-flight
+                requests into one upstream call. Can be shared between clients of the same key.
+            retry_policy (Optional[RetryPolicy]): Retries timeouts, connection errors and 5xx
+                responses with backoff, waiting with `asyncio.sleep`.
+            circuit_breaker (Optional[CircuitBreaker]): Fails fast with `CircuitOpen` on
+                endpoints that keep failing. Can be shared between clients.
+            strict_validation (bool): Validate every value of the API responses. By default
+                well-formed responses are trusted and built without validating the rates,
+                which is much faster. Useful to debug unexpected payloads.
+
+        Raises:
+            ImportError: If httpx is not installed.
+            ValueError: If one of the given arguments is invalid
+
+        Example:
+            ```python
+            async with AsyncExchangeRateApiV6Client("your_api_key") as client:
+                conversion = await client.pair_conversion("USD", "EUR", 100)
+            ```
+        """
+        _require_httpx()
+
+        if not isinstance(max_concurrency, int) or max_concurrency < 1:
+            raise ValueError("Max concurrency must be an integer greater than 0")
+
+        self._api_key = api_key
+        self._timeout = timeout
+        self._owns_session = session is None
+        if session is None:
+            session = create_async_session(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            )
+        self._session = session
+        self._max_concurrency = max_concurrency
+        self._semaphore = None
+        self._supported_codes_lock = None
+        self._supported_codes_cache = None
+        self._cache_timestamp = 0
+        self._coalescer = coalescer
+        self._retry_policy = retry_policy
+        self._circuit_breaker = circuit_breaker
+        self._strict_validation = strict_validation
+        self._transfer_stats = TransferStats()
+
+    @property
+    def session(self) -> "httpx.AsyncClient":
+        """The pooled async client used by this client. Can be passed to other clients."""
+        return self._session
+
+    @property
+    def transfer_stats(self) -> TransferStats:
+        """Compressed and uncompressed byte counts of the responses received."""
+        return self._transfer_stats
+
+    async def aclose(self):
+        """
+        Release the pooled connections if the session is owned by this client.
+        Shared sessions passed to the constructor are left open.
+        """
+        if self._owns_session:
+            await self._session.aclose()
+
+    async def __aenter__(self) -> "AsyncExchangeRateApiV6Client":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def fetch_exchange_rates(self, base_code: str) -> ExclusiveExchangeRates:
+        """
+        Fetch the latest exchange rates for a given base currency.
+
+        Same as `ExchangeRateApiV6Client.fetch_exchange_rates` without blocking the event loop.
+        """
+        if not isinstance(base_code, str):
+            raise ValueError("Base code must be a str")
+
+        if not await self._is_supported_code(base_code):
+            raise UnsupportedCode(f"Base code {base_code} is not supported")
+
+        url = self._build_endpoint_url("latest", base_code)
+
+        obj = await self._request_model(
+            url, "latest", self._model_builder(ExclusiveExchangeRates)
+        )
+
+        return obj
+
+    async def pair_conversion(
+        self,
+        base_code: str,
+        target_code: str,
+        amount: Optional[float] = None,
+    ) -> PairConversion:
+        """
+        Convert an amount from one currency to another using the latest exchange rate.
+
+        Same as `ExchangeRateApiV6Client.pair_conversion` without blocking the event loop.
+        """
+        if not isinstance(base_code, str) or not isinstance(target_code, str):
+            raise ValueError("Base code and target code must be a str")
+
+        if amount is not None and not isinstance(amount, (int, float)):
+            raise ValueError("Amount must be an integer or float")
+
+        if not await self._is_supported_code(base_code):
+            raise UnsupportedCode(f"Base code {base_code} is not supported")
+
+        if not await self._is_supported_code(target_code):
+            raise UnsupportedCode(f"Target code {target_code} is not supported")
+
+        if amount is not None and amount < 0:
+            raise ValueError("Amount must be a greater than or equal to 0")
+
+        url = self._build_endpoint_url("pair", base_code, target_code, amount)
+
+        obj = await self._request_model(
+            url, "pair", self._model_builder(PairConversion)
+        )
+
+        return obj
+
+    async def fetch_enriched_data(
+        self, base_code: str, target_code: str
+    ) -> EnrichedData:
+        """
+        Fetch enriched exchange rate data for a pair of currencies.
+
+        Same as `ExchangeRateApiV6Client.fetch_enriched_data` without blocking the event loop.
+        """
+        if not isinstance(base_code, str) or not isinstance(target_code, str):
+            raise ValueError("Base code and target code must be a str")
+
+        if not await self._is_supported_code(base_code):
+            raise UnsupportedCode(f"Base code {base_code} is not supported")
+
+        if not await self._is_supported_code(target_code):
+            raise UnsupportedCode(f"Target code {target_code} is not supported")
+
+        url = self._build_endpoint_url("enriched", base_code, target_code)
+
+        obj = await self._request_model(url, "enriched", self._build_enriched_data)
+
+        return obj
+
+    async def fetch_historical_data(
+        self, base_code: str, date_obj: date, amount: float
+    ) -> HistoricalData:
+        """
+        Fetch historical exchange rates for a specific date.
+
+        Same as `ExchangeRateApiV6Client.fetch_historical_data` without blocking the event loop.
+        """
+        if not isinstance(base_code, str):
+            raise ValueError("Base code must be a str")
+
+        if not isinstance(date_obj, date):
+            raise ValueError("Data must be a datetime.date instance")
+
+        if not isinstance(amount, (int, float)):
+            raise ValueError("Amount must be an integer or a float")
+
+        if not await self._is_supported_code(base_code):
+            raise UnsupportedCode(f"Base code {base_code} is not supported")
+
+        year, month, day = (date_obj.year, date_obj.month, date_obj.day)
+
+        url = self._build_endpoint_url("history", base_code, year, month, day, amount)
+
+        obj = await self._request_model(
+            url, "historical", self._model_builder(HistoricalData)
+        )
+
+        return obj
+
+    async def fetch_quota_info(self) -> APIQuotaStatus:
+        """
+        Fetch the API quota status to determine the number of requests remaining.
+
+        Same as `ExchangeRateApiV6Client.fetch_quota_info` without blocking the event loop.
+        """
+        url = self._build_endpoint_url("quota")
+
+        obj = await self._request_model(
+            url, "quota", self._model_builder(APIQuotaStatus)
+        )
+
+        return obj
+
+    async def _request_model(
+        self, url: str, endpoint: str, build: Callable[[Any], Any]
+    ):
+        async def attempt():
+            if self._circuit_breaker is not None:
+                self._circuit_breaker.before_request(endpoint)
+            try:
+                response = await self._make_request(
+                    url, self._ENDPOINT_ERRORS[endpoint]
+                )
+                result = build(response)
+            except BaseException as e:
+                if self._circuit_breaker is not None:
+                    self._circuit_breaker.record_outcome(endpoint, e)
+                raise
+            if self._circuit_breaker is not None:
+                self._circuit_breaker.record_outcome(endpoint, None)
+            return result
+
+        async def request():
+            if self._retry_policy is None:
+                return await attempt()
+
+            attempt_number = 1
+            while True:
+                try:
+                    return await attempt()
+                except Exception as e:
+                    if not self._retry_policy.should_retry(e, attempt_number):
+                        raise
+                await asyncio.sleep(self._retry_policy.delay(attempt_number))
+                attempt_number += 1
+
+        if self._coalescer is None:
+            return await request()
+
+        return await self._coalescer.run(url, request)
+
+    async def _make_request(
+        self, url: str, errors: ErrorDispatch
+    ) -> "httpx.Response":
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async with self._semaphore:
+            try:
+                response = await self._session.get(url, timeout=self._timeout)
+            except httpx.TimeoutException:
+                raise RequestTimeout("The request to the Exchange Rate API timed out")
+            except httpx.TransportError as e:
+                raise _ConnectionFailed(
+                    "Could not connect to the Exchange Rate API"
+                ) from e
+
+        self._transfer_stats.record(response)
+
+        if response.status_code >= 500:
+            raise ServerError(
+                f"The Exchange Rate API failed with status {response.status_code}"
+            )
+
+        if not (200 <= response.status_code <= 299):
+            data = decode_response(response)
+            raise_for_error_type(errors, data.get("error-type"))
+
+        return response
+
+    async def _is_supported_code(self, code: str) -> bool:
+        if self._is_supported_codes_cache_stale():
+            if self._supported_codes_lock is None:
+                self._supported_codes_lock = asyncio.Lock()
+
+            async with self._supported_codes_lock:
+                # Another task may have refreshed the cache while we were waiting
+                if self._is_supported_codes_cache_stale():
+                    await self._udpate_supported_codes_cache()
+
+        return code in self._supported_codes_cache
+
+    def _is_supported_codes_cache_stale(self) -> bool:
+        return (
+            self._supported_codes_cache is None
+            or time.time() - self._cache_timestamp > self._CACHE_TIMEOUT
+        )
+
+    async def _udpate_supported_codes_cache(self):
+        url = self._build_endpoint_url("codes")
+
+        supported_codes = await self._request_model(
+            url, "codes", self._parse_supported_codes
+        )
+
+        self._supported_codes_cache = set(supported_codes)
+        self._cache_timestamp = time.time()
@@ -0,0 +1,237 @@
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from .commons import (
+    BaseResponseModel,
+    EnrichedData,
+    TargetData,
+    HistoricalData,
+    HistoricalRange,
+)
+
+from .exceptions import NoDataAvailable
+
+from ._json import decode_response, raw_body
+
+from ._error_handlers import ENDPOINT_ERRORS, ErrorDispatch
+
+import functools
+
+from concurrent.futures import ThreadPoolExecutor
+
+from datetime import date, timedelta
+
+
+M = TypeVar("M", bound=BaseResponseModel)
+
+# The value types each scalar annotation accepts without validation
+_SCALAR_TYPES = {
+    int: (int,),
+    float: (int, float),
+    str: (str,),
+    type(None): (type(None),),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _required_fields(model: Type[BaseResponseModel]) -> FrozenSet[str]:
+    return frozenset(
+        name for name, field in model.model_fields.items() if field.is_required()
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _scalar_fields(model: Type[BaseResponseModel]) -> Dict[str, Tuple[type, ...]]:
+    fields = {}
+    for name, field in model.model_fields.items():
+        annotation = field.annotation
+        args = (
+            get_args(annotation) if get_origin(annotation) is Union else (annotation,)
+        )
+        if all(arg in _SCALAR_TYPES for arg in args):
+            fields[name] = tuple(
+                value_type for arg in args for value_type in _SCALAR_TYPES[arg]
+            )
+    return fields
+
+
+@functools.lru_cache(maxsize=None)
+def _int_fields(model: Type[BaseResponseModel]) -> FrozenSet[str]:
+    return frozenset(
+        name
+        for name, field in model.model_fields.items()
+        if field.annotation in (int, Optional[int])
+    )
+
+
+def construct_trusted(model: Type[M], data: Any) -> M:
+    """
+    Build a response model from a well-formed upstream payload without validating its
+    values, which skips checking every entry of the rates dicts. Payloads missing a
+    required field or with a mistyped scalar field are validated instead, so that they
+    raise a `ValidationError` or are coerced.
+    """
+    if not isinstance(data, dict) or not _required_fields(model).issubset(data):
+        return model.model_validate(data)
+
+    values = dict(data)
+    int_fields = _int_fields(model)
+    for name, value_types in _scalar_fields(model).items():
+        if name not in values or type(values[name]) in value_types:
+            continue
+
+        value = values[name]
+        # Whole floats such as a year of 2015.0 are coerced like validation does
+        if name in int_fields and type(value) is float and value.is_integer():
+            values[name] = int(value)
+        else:
+            return model.model_validate(data)
+
+    return model.model_construct(**values)
+
+
+def historical_range_dates(
+    base_code: str,
+    start_date: date,
+    end_date: date,
+    amount: float,
+    max_in_flight: int,
+) -> List[date]:
+    """
+    Check the arguments of `fetch_historical_range` and return every day of the range.
+
+    Raises:
+        ValueError: If one of the given arguments is invalid
+    """
+    if not isinstance(base_code, str):
+        raise ValueError("Base code must be a str")
+
+    if not isinstance(start_date, date) or not isinstance(end_date, date):
+        raise ValueError("Start date and end date must be datetime.date instances")
+
+    if start_date > end_date:
+        raise ValueError("Start date must be before or equal to end date")
+
+    if not isinstance(amount, (int, float)):
+        raise ValueError("Amount must be an integer or a float")
+
+    if not isinstance(max_in_flight, int) or max_in_flight < 1:
+        raise ValueError("Max in flight must be an integer greater than 0")
+
+    return [
+        start_date + timedelta(days=offset)
+        for offset in range((end_date - start_date).days + 1)
+    ]
+
+
+def fetch_historical_days(
+    fetch: Callable[[date], HistoricalData],
+    dates: List[date],
+    max_in_flight: int,
+) -> Dict[date, Optional[HistoricalData]]:
+    """
+    Fetch the data of every day concurrently, with None for days without data.
+    """
+
+    def fetch_day(date_obj: date) -> Optional[HistoricalData]:
+        try:
+            return fetch(date_obj)
+        except NoDataAvailable:
+            return None
+
+    if len(dates) == 1:
+        return {dates[0]: fetch_day(dates[0])}
+
+    with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+        return dict(zip(dates, executor.map(fetch_day, dates)))
+
+
+def historical_range(
+    dates: List[date], results: Dict[date, Optional[HistoricalData]]
+) -> HistoricalRange:
+    """The data of every day of `dates` with data, in order, and the days without."""
+    return HistoricalRange(
+        data=[
+            results[date_obj] for date_obj in dates if results[date_obj] is not None
+        ],
+        missing=[date_obj for date_obj in dates if results[date_obj] is None],
+    )
+
+
+class BaseExchangeRateApiV6Client:
+    """
+    Behaviour shared by the synchronous and asynchronous V6 clients that does not
+    depend on how requests are sent.
+    """
+
+    _EXCHANGE_RATE_API_V6_URL = "https://v6.exchangerate-api.com/v6"
+    _CACHE_TIMEOUT = 3600
+    _DEFAULT_TIMEOUT = 10
+    _ENDPOINT_ERRORS: Dict[str, ErrorDispatch] = ENDPOINT_ERRORS
+
+    _api_key: str
+    _strict_validation: bool = False
+
+    def _build_endpoint_url(self, endpoint: str, *params):
+        url = f"{self._build_api_key_url()}/{endpoint}"
+        present_params = filter(lambda p: p is not None, params)
+        if params:
+            url = f"{url}/{'/'.join([str(param) for param in present_params])}"
+        return url
+
+    def _build_api_key_url(self) -> str:
+        return f"{self._EXCHANGE_RATE_API_V6_URL}/{self._api_key}"
+
+    def _model_builder(self, model: Type[M]) -> Callable[[Any], M]:
+        return functools.partial(self._build_model, model)
+
+    def _build_model(self, model: Type[M], response: Any) -> M:
+        if self._strict_validation:
+            content = raw_body(response)
+            if content is not None:
+                return model.model_validate_json(content)
+
+        return self._build_payload(model, decode_response(response))
+
+    def _build_payload(self, model: Type[M], data: Any) -> M:
+        if self._strict_validation:
+            return model.model_validate(data)
+
+        return construct_trusted(model, data)
+
+    def _build_enriched_data(self, response: Any) -> EnrichedData:
+        data = decode_response(response)
+
+        if self._strict_validation:
+            target_data = TargetData(**data["target_data"])
+        else:
+            target_data = construct_trusted(TargetData, data["target_data"])
+
+        data_without_target = {
+            key: value for key, value in data.items() if key != "target_data"
+        }
+
+        if self._strict_validation:
+            return EnrichedData(target_data=target_data, **data_without_target)
+
+        return construct_trusted(
+            EnrichedData, {"target_data": target_data, **data_without_target}
+        )
+
+    @staticmethod
+    def _parse_supported_codes(response: Any) -> List[str]:
+        supported_codes = decode_response(response).get("supported_codes", [])
+
+        return [code for code, _ in supported_codes]
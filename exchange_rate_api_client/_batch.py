@@ -0,0 +1,159 @@
+from typing import Callable, Dict, NamedTuple, Sequence, Tuple, Union
+
+from .commons import ExclusiveExchangeRates
+
+from .exceptions import UnsupportedCode
+
+from ._cross_rates import np, _require_numpy
+
+
+RateBlock = Callable[[Sequence[str], Sequence[str]], "np.ndarray"]
+
+CodeColumn = Union[str, Sequence[str], "np.ndarray"]
+
+
+class BatchConversion(NamedTuple):
+    """
+    Result of `ExchangeRateApiV6Client.convert_many`.
+
+    Attributes:
+        results (np.ndarray): Converted amounts, in the order of the input rows.
+        time_last_update_unix (Dict[str, int]): Last update time of every rate table used,
+            keyed by the table's base code.
+        time_next_update_unix (Dict[str, int]): Next update time of every rate table used,
+            keyed by the table's base code.
+    """
+
+    results: "np.ndarray"
+    time_last_update_unix: Dict[str, int]
+    time_next_update_unix: Dict[str, int]
+
+
+def tables_rate_block(
+    tables: Sequence[ExclusiveExchangeRates], target_codes: Sequence[str]
+) -> "np.ndarray":
+    """
+    Rates of every table's base code to every target code, one row per table.
+
+    Raises:
+        UnsupportedCode: If a target code is missing from one of the tables.
+    """
+    block = np.empty((len(tables), len(target_codes)), dtype=np.float64)
+
+    for row, table in enumerate(tables):
+        rates = table.conversion_rates
+        for column, target_code in enumerate(target_codes):
+            rate = rates.get(target_code)
+            if rate is None:
+                raise UnsupportedCode(f"Target code {target_code} is not supported")
+            block[row, column] = rate
+
+    return block
+
+
+def _factorize(
+    codes: Union[str, "np.ndarray"], start: int, stop: int
+) -> Tuple["np.ndarray", Union[int, "np.ndarray"]]:
+    if isinstance(codes, str):
+        return np.array([codes]), 0
+    return np.unique(codes[start:stop], return_inverse=True)
+
+
+def _as_code_column(codes: CodeColumn, length: int) -> Union[str, "np.ndarray"]:
+    if isinstance(codes, str):
+        return codes
+    codes = np.asarray(codes)
+    if codes.shape != (length,):
+        raise ValueError("Bases and targets must be a str or match the amounts length")
+    return codes
+
+
+def convert_many(
+    amounts: Union[Sequence[float], "np.ndarray"],
+    bases: CodeColumn,
+    targets: CodeColumn,
+    rate_block: RateBlock,
+    chunk_size: int,
+) -> "np.ndarray":
+    """
+    Convert every row with a gather-and-multiply over a small rate block per chunk.
+
+    ``rate_block(base_codes, target_codes)`` must return the rates of every base code to
+    every target code seen in a chunk. Only one chunk of indices is alive at a time, so
+    memory is bounded by the chunk size besides the input and output arrays.
+    """
+    _require_numpy()
+
+    if not isinstance(chunk_size, int) or chunk_size < 1:
+        raise ValueError("Chunk size must be an integer greater than 0")
+
+    amounts = np.asarray(amounts, dtype=np.float64)
+    if amounts.ndim != 1:
+        raise ValueError("Amounts must be a one dimensional sequence")
+
+    if np.any(amounts < 0):
+        raise ValueError("Amounts must be greater than or equal to 0")
+
+    length = amounts.shape[0]
+    bases = _as_code_column(bases, length)
+    targets = _as_code_column(targets, length)
+
+    results = np.empty(length, dtype=np.float64)
+
+    for start in range(0, length, chunk_size):
+        stop = min(start + chunk_size, length)
+
+        base_codes, base_index = _factorize(bases, start, stop)
+        target_codes, target_index = _factorize(targets, start, stop)
+
+        block = rate_block(base_codes.tolist(), target_codes.tolist())
+
+        np.multiply(
+            amounts[start:stop],
+            block[base_index, target_index],
+            out=results[start:stop],
+        )
+
+    return results
+
+
+def batch_conversion(
+    results: "np.ndarray", tables: Dict[str, ExclusiveExchangeRates]
+) -> BatchConversion:
+    """Wrap converted amounts with the update times of the tables they were made with."""
+    return BatchConversion(
+        results=results,
+        time_last_update_unix={
+            code: table.time_last_update_unix for code, table in tables.items()
+        },
+        time_next_update_unix={
+            code: table.time_next_update_unix for code, table in tables.items()
+        },
+    )
+
+
+def convert_with_tables(
+    amounts: Union[Sequence[float], "np.ndarray"],
+    bases: CodeColumn,
+    targets: CodeColumn,
+    fetch_table: Callable[[str], ExclusiveExchangeRates],
+    chunk_size: int,
+) -> BatchConversion:
+    """
+    Convert every row with the latest table of its base code. ``fetch_table(base_code)``
+    is called once per distinct base code.
+    """
+    tables: Dict[str, ExclusiveExchangeRates] = {}
+
+    def rate_block(base_codes, target_codes):
+        for base_code in base_codes:
+            if base_code not in tables:
+                tables[base_code] = fetch_table(base_code)
+
+        return tables_rate_block(
+            [tables[base_code] for base_code in base_codes], target_codes
+        )
+
+    results = convert_many(amounts, bases, targets, rate_block, chunk_size)
+
+    return batch_conversion(results, tables)
@@ -0,0 +1,153 @@
+from typing import Callable, Dict, NamedTuple, Optional, Union
+
+from .commons import ExclusiveExchangeRates, ExchangeRates
+
+import threading
+
+import time
+
+
+# Latest tables of the v6 and open access APIs
+RatesTable = Union[ExclusiveExchangeRates, ExchangeRates]
+
+
+class CachedTable(NamedTuple):
+    """A cached latest table and the validators to revalidate it with upstream."""
+
+    snapshot: RatesTable
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+class _Entry(NamedTuple):
+    table: CachedTable
+    expires: float
+
+
+class LatestRatesCache:
+    """
+    In-memory cache of latest rate tables keyed by base code.
+
+    A table is served until the upstream ``time_next_update_unix`` plus an optional
+    slack has passed. Expired tables are kept with their ETag and Last-Modified
+    validators, so the next request can be conditional: if upstream has not published a
+    new table, the cached one is revalidated and served for `revalidate_interval` more
+    seconds. The cache is safe to share between threads and clients.
+
+    Example:
+        ```python
+        cache = LatestRatesCache(slack=60)
+        client = ExchangeRateApiV6Client("your_api_key", rates_cache=cache)
+        client.fetch_exchange_rates("USD")  # Network
+        client.fetch_exchange_rates("USD")  # Memory
+        print(cache.hits, cache.misses)  # Output: 1 1
+        ```
+    """
+
+    def __init__(
+        self,
+        slack: float = 0,
+        revalidate_interval: float = 300,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Args:
+            slack (float): Extra seconds to keep serving a table after its next update time.
+            revalidate_interval (float): Seconds to keep serving a revalidated table before
+                checking upstream again.
+            clock (Callable[[], float]): Returns the current unix time. Meant for tests.
+
+        Raises:
+            ValueError: If one of the given arguments is invalid
+        """
+        if not isinstance(slack, (int, float)) or slack < 0:
+            raise ValueError("Slack must be a number greater than or equal to 0")
+
+        if not isinstance(revalidate_interval, (int, float)) or revalidate_interval <= 0:
+            raise ValueError("Revalidate interval must be a number greater than 0")
+
+        self._slack = slack
+        self._revalidate_interval = revalidate_interval
+        self._clock = clock
+        self._entries: Dict[str, _Entry] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._revalidations = 0
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def revalidations(self) -> int:
+        """Number of expired tables reused because upstream had no new table."""
+        return self._revalidations
+
+    def get(self, base_code: str) -> Optional[RatesTable]:
+        """
+        Return the cached table for a base code, or None if it is missing or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(base_code)
+            if entry is None or self._clock() >= entry.expires:
+                self._misses += 1
+                return None
+            self._hits += 1
+            return entry.table.snapshot
+
+    def get_stale(self, base_code: str) -> Optional[CachedTable]:
+        """
+        Return the cached table of a base code and its validators, even if it expired.
+        """
+        with self._lock:
+            entry = self._entries.get(base_code)
+            return None if entry is None else entry.table
+
+    def put(
+        self,
+        snapshot: RatesTable,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ):
+        """
+        Store a table, replacing the previous one for the same base code.
+
+        Args:
+            snapshot (Union[ExclusiveExchangeRates, ExchangeRates]): The table.
+            etag (Optional[str]): The ETag header of the response it came from.
+            last_modified (Optional[str]): The Last-Modified header of that response.
+        """
+        with self._lock:
+            self._entries[snapshot.base_code] = _Entry(
+                CachedTable(snapshot, etag, last_modified),
+                snapshot.time_next_update_unix + self._slack,
+            )
+
+    def revalidate(self, snapshot: RatesTable):
+        """
+        Keep serving a cached table that upstream confirmed is still the latest one,
+        for `revalidate_interval` seconds. Ignored if the table was replaced meanwhile.
+        """
+        with self._lock:
+            entry = self._entries.get(snapshot.base_code)
+            if entry is None or entry.table.snapshot is not snapshot:
+                return
+            self._entries[snapshot.base_code] = entry._replace(
+                expires=max(entry.expires, self._clock() + self._revalidate_interval)
+            )
+            self._revalidations += 1
+
+    def invalidate(self, base_code: Optional[str] = None):
+        """
+        Drop the table of a base code, or every table if no base code is given.
+        """
+        with self._lock:
+            if base_code is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(base_code, None)
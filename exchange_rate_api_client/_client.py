@@ -1,96 +1,341 @@
-from typing import Optional, List, Any
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+    List,
+    Any,
+    Union,
+    Dict,
+    Sequence,
+    Iterable,
+    Callable,
+)
 
 from .commons import (
     ExclusiveExchangeRates,
     PairConversion,
-    TargetData,
     EnrichedData,
     HistoricalData,
+    HistoricalRange,
     APIQuotaStatus,
 )
 
 from .exceptions import (
     UnsupportedCode,
+    QuotaReached,
+    RequestTimeout,
+    ServerError,
+)
+
+from ._error_handlers import ErrorDispatch, raise_for_error_type
+
+from ._base import (
+    BaseExchangeRateApiV6Client,
+    historical_range_dates,
+    fetch_historical_days,
+    historical_range,
 )
 
-from ._error_handlers import (
-    ResponseErrorHandler,
-    handle_unsupported_code,
-    handle_invalid_key,
-    handle_inactive_account,
-    handle_quota_reached,
-    handle_required_plan_upgrade,
-    handle_malformed_request,
-    handle_no_data,
+from ._session import create_session, RequestsConnectionFailed
+
+from ._json import decode_response, peek_int
+
+from ._cache import LatestRatesCache, CachedTable
+
+from ._compression import TransferStats
+
+from ._historical_store import HistoricalStore
+
+from ._codes_cache import SupportedCodesCache
+
+from ._coalesce import RequestCoalescer
+
+from ._rate_limit import TokenBucket, QuotaGovernor
+
+from ._resilience import RetryPolicy, CircuitBreaker
+
+from ._prefetch import RatesPrefetcher
+
+from ._instrumentation import (
+    RequestEvent,
+    RequestHook,
+    RequestTrace,
+    DecodedResponse,
+    emit,
 )
 
+if TYPE_CHECKING:
+    # numpy is imported by these modules, so they are only loaded when used
+    from ._cross_rates import CrossRateMatrix
+
+    from ._batch import BatchConversion, CodeColumn
+
 import requests
 
+from urllib3.util.retry import Retry
+
+import functools
+
+import math
+
 import time
 
 from datetime import date
 
 
-class ExchangeRateApiV6Client:
-    _EXCHANGE_RATE_API_V6_URL = "https://v6.exchangerate-api.com/v6"
-    _CACHE_TIMEOUT = 3600
+class ExchangeRateApiV6Client(BaseExchangeRateApiV6Client):
+    def __init__(
+        self,
+        api_key: str,
+        session: Optional[requests.Session] = None,
+        timeout: float = BaseExchangeRateApiV6Client._DEFAULT_TIMEOUT,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        max_retries: Union[int, Retry] = 0,
+        keep_alive: bool = True,
+        rates_cache: Optional[LatestRatesCache] = None,
+        local_pair_conversion: bool = False,
+        cross_rate_anchor: Optional[str] = None,
+        historical_store: Optional[HistoricalStore] = None,
+        codes_snapshot: Optional[Iterable[str]] = None,
+        codes_refresh_interval: Optional[
+            float
+        ] = BaseExchangeRateApiV6Client._CACHE_TIMEOUT,
+        coalescer: Optional[RequestCoalescer] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        quota_governor: Optional[QuotaGovernor] = None,
+        low_priority: bool = False,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        strict_validation: bool = False,
+        request_hooks: Optional[Iterable[RequestHook]] = None,
+    ):
+        """
+        Create a client bound to an API key.
+
+        Args:
+            api_key (str): The Exchange Rate API key.
+            session (Optional[requests.Session]): A session to share with other clients.
+                When given, the pool options below are ignored and the session is not
+                closed by this client.
+            timeout (float): Seconds to wait for the API before giving up.
+            pool_connections (int): Number of per-host connection pools to keep.
+            pool_maxsize (int): Maximum number of connections kept alive per host.
+            max_retries (Union[int, Retry]): Retry configuration for the transport adapter.
+            keep_alive (bool): Whether to reuse connections between requests.
+            rates_cache (Optional[LatestRatesCache]): Cache for latest rate tables. When given,
+                `fetch_exchange_rates` serves tables from memory until their next update.
+            local_pair_conversion (bool): Answer `pair_conversion` from the cached latest
+                table of the base code instead of calling the pair endpoint. A rates cache
+                is created if none is given.
+            cross_rate_anchor (Optional[str]): Answer `pair_conversion` by triangulating
+                through the cached latest table of this currency, so a single table serves
+                every pair. Requires numpy. A rates cache is created if none is given.
+            historical_store (Optional[HistoricalStore]): Persistent store checked by
+                `fetch_historical_data` before the network and written through on a miss.
+            codes_snapshot (Optional[Iterable[str]]): Supported codes used for validation
+                right away, such as `BUNDLED_CURRENCY_CODES`. The live `/codes` list is then
+                only fetched in the background. Without a snapshot, the first call blocks
+                on `/codes`.
+            codes_refresh_interval (Optional[float]): Seconds between refreshes of the live
+                supported codes. None never requests `/codes` and requires a snapshot.
+            coalescer (Optional[RequestCoalescer]): Coalesces identical in-flight requests
+                into one upstream call. Can be shared between clients of the same key.
+            rate_limiter (Optional[TokenBucket]): Paces the requests sent by this client.
+                Can be shared between clients to pace them together.
+            quota_governor (Optional[QuotaGovernor]): Counts requests against the API quota,
+                seeded from `fetch_quota_info`, and refuses them before it runs out.
+            low_priority (bool): Whether the requests of this client are refused by the
+                quota governor once only its reserve is left.
+            retry_policy (Optional[RetryPolicy]): Retries timeouts, connection errors and 5xx
+                responses with backoff. Typed API errors are never retried.
+            circuit_breaker (Optional[CircuitBreaker]): Fails fast with `CircuitOpen` on
+                endpoints that keep failing. Can be shared between clients.
+            strict_validation (bool): Validate every value of the API responses. By default
+                well-formed responses are trusted and built without validating the rates,
+                which is much faster. Useful to debug unexpected payloads.
+            request_hooks (Optional[Iterable[Callable[[RequestEvent], None]]]): Called
+                after every request with its `RequestEvent`, in the requesting thread.
+                See `add_request_hook`.
+
+        Example:
+            ```python
+            with ExchangeRateApiV6Client("your_api_key", pool_maxsize=20) as client:
+                client.fetch_exchange_rates("USD")
+            ```
+        """
+        if codes_snapshot is None and codes_refresh_interval is None:
+            raise ValueError("A codes snapshot is required to disable codes refreshes")
 
-    def __init__(self, api_key: str):
         self._api_key = api_key
-        self._supported_codes_cache = None
-        self._cache_timestamp = 0
-        self._response_error_handlers = {
-            "latest": [
-                handle_unsupported_code("The base code is not supported"),
-                handle_malformed_request,
-                handle_invalid_key,
-                handle_inactive_account,
-                handle_quota_reached,
-            ],
-            "pair": [
-                handle_unsupported_code("One or both codes are not supported"),
-                handle_malformed_request,
-                handle_invalid_key,
-                handle_inactive_account,
-                handle_quota_reached,
-            ],
-            "enriched": [
-                handle_unsupported_code("One or both codes are not supported"),
-                handle_malformed_request,
-                handle_invalid_key,
-                handle_inactive_account,
-                handle_quota_reached,
-                handle_required_plan_upgrade,
-            ],
-            "historical": [
-                handle_no_data(
-                    "The database doesn't have any exchange rates for the specific date supplied"
-                ),
-                handle_unsupported_code("The base code is not supported"),
-                handle_malformed_request,
-                handle_invalid_key,
-                handle_inactive_account,
-                handle_quota_reached,
-                handle_required_plan_upgrade,
-            ],
-            "quota": [
-                handle_invalid_key,
-                handle_inactive_account,
-                handle_quota_reached,
-            ],
-            "codes": [
-                handle_invalid_key,
-                handle_inactive_account,
-                handle_quota_reached,
-            ],
-        }
-
-    def fetch_exchange_rates(self, base_code: str) -> ExclusiveExchangeRates:
+        self._timeout = timeout
+        self._owns_session = session is None
+        if session is None:
+            session = create_session(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                max_retries=max_retries,
+                keep_alive=keep_alive,
+            )
+        self._session = session
+        self._supported_codes = SupportedCodesCache(
+            self._fetch_supported_codes,
+            math.inf if codes_refresh_interval is None else codes_refresh_interval,
+            seed=codes_snapshot,
+        )
+        if (local_pair_conversion or cross_rate_anchor) and rates_cache is None:
+            rates_cache = LatestRatesCache()
+        self._rates_cache = rates_cache
+        self._local_pair_conversion = local_pair_conversion or bool(cross_rate_anchor)
+        self._cross_rate_anchor = cross_rate_anchor
+        self._cross_rates: Dict[str, "CrossRateMatrix"] = {}
+        self._historical_store = historical_store
+        self._coalescer = coalescer
+        self._rate_limiter = rate_limiter
+        self._quota_governor = quota_governor
+        self._low_priority = low_priority
+        self._retry_policy = retry_policy
+        self._circuit_breaker = circuit_breaker
+        self._strict_validation = strict_validation
+        self._prefetcher: Optional[RatesPrefetcher] = None
+        self._request_hooks: List[RequestHook] = list(request_hooks or ())
+        self._transfer_stats = TransferStats()
+
+    @property
+    def session(self) -> requests.Session:
+        """The pooled session used by this client. Can be passed to other clients."""
+        return self._session
+
+    @property
+    def rates_cache(self) -> Optional[LatestRatesCache]:
+        """The cache of latest rate tables, if any."""
+        return self._rates_cache
+
+    @property
+    def historical_store(self) -> Optional[HistoricalStore]:
+        """The persistent store of historical data, if any."""
+        return self._historical_store
+
+    @property
+    def transfer_stats(self) -> TransferStats:
+        """Compressed and uncompressed byte counts of the responses received."""
+        return self._transfer_stats
+
+    @property
+    def prefetcher(self) -> Optional[RatesPrefetcher]:
+        """The background prefetcher started with `start_prefetching`, if any."""
+        return self._prefetcher
+
+    def start_prefetching(
+        self,
+        base_codes: Iterable[str] = (),
+        observe: bool = True,
+        delay: float = 5,
+        retry_interval: float = 60,
+    ) -> RatesPrefetcher:
+        """
+        Start a background thread that refreshes the latest tables of hot base codes
+        just after their upstream update, so that `fetch_exchange_rates` and local
+        `pair_conversion` keep being served from memory.
+
+        A rates cache is created if the client has none, with enough slack to keep
+        serving a table until its refresh. A cache given to the constructor should have
+        a slack of at least `delay` for the same effect.
+
+        Args:
+            base_codes (Iterable[str]): Base codes refreshed from the start.
+            observe (bool): Also refresh every base code fetched by this client.
+            delay (float): Seconds to wait after the upstream update before refreshing.
+            retry_interval (float): Seconds to wait before retrying a refresh.
+
+        Returns:
+            RatesPrefetcher: The running prefetcher, stopped by `close`.
+
+        Raises:
+            ValueError: If one of the given arguments is invalid
+
+        Example:
+            ```python
+            with ExchangeRateApiV6Client("your_api_key") as client:
+                client.start_prefetching(["USD", "EUR"])
+                client.fetch_exchange_rates("USD")  # Memory once warmed
+            ```
+        """
+        if self._prefetcher is not None:
+            raise ValueError("Prefetching is already started")
+
+        if self._rates_cache is None:
+            self._rates_cache = LatestRatesCache(slack=delay + retry_interval)
+
+        self._prefetcher = RatesPrefetcher(
+            lambda code: self.fetch_exchange_rates(code, force_refresh=True),
+            base_codes=base_codes,
+            observe=observe,
+            delay=delay,
+            retry_interval=retry_interval,
+        )
+
+        return self._prefetcher.start()
+
+    def add_request_hook(self, hook: RequestHook):
+        """
+        Call a function after every request with a `RequestEvent` describing it: the
+        endpoint, the status, the error type, whether it was served from memory, the
+        bytes received and the time spent in each phase.
+
+        Hooks are called in the requesting thread, so they should be quick. Timings are
+        only measured while at least one hook is registered.
+
+        Args:
+            hook (Callable[[RequestEvent], None]): The function to call.
+
+        Example:
+            ```python
+            histogram = LatencyHistogram()
+            client.add_request_hook(histogram)
+            client.fetch_exchange_rates("USD")
+            print(histogram.percentile(50, "latest"))
+            ```
+        """
+        self._request_hooks.append(hook)
+
+    def remove_request_hook(self, hook: RequestHook):
+        """
+        Stop calling a function registered with `add_request_hook`.
+
+        Raises:
+            ValueError: If the function is not registered.
+        """
+        self._request_hooks.remove(hook)
+
+    def close(self):
+        """
+        Stop the prefetcher, if any, and release the pooled connections if the session
+        is owned by this client. Shared sessions passed to the constructor are left open.
+        """
+        if self._prefetcher is not None:
+            self._prefetcher.stop()
+        if self._owns_session:
+            self._session.close()
+
+    def __enter__(self) -> "ExchangeRateApiV6Client":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def fetch_exchange_rates(
+        self, base_code: str, force_refresh: bool = False
+    ) -> ExclusiveExchangeRates:
         """
         Fetch the latest exchange rates for a given base currency.
 
+        If the client has a rates cache, a table is served from memory until its
+        next update time. After that the request is conditional, and if upstream has
+        not published a new table, the cached one is reused without being parsed again.
+
         Args:
             base_code (str): The ISO 4217 currency code for the base currency.
+            force_refresh (bool): Skip the rates cache and fetch a new table.
 
         Returns:
             ExclusiveExchangeRates: An object containing the latest exchange rate data, including:
@@ -118,16 +363,45 @@ class ExchangeRateApiV6Client:
         if not isinstance(base_code, str):
             raise ValueError("Base code must be a str")
 
-        if not self._is_supported_code(base_code):
-            raise UnsupportedCode(f"Base code {base_code} is not supported")
+        if self._rates_cache is not None and not force_refresh:
+            start = time.perf_counter() if self._request_hooks else 0.0
+            cached = self._rates_cache.get(base_code)
+            if cached is not None:
+                if self._prefetcher is not None:
+                    self._prefetcher.observe(cached)
+                if self._request_hooks:
+                    self._emit_cache_hit("latest", start)
+                return cached
+
+        codes_check = self._check_supported_codes(base_code)
 
         url = self._build_endpoint_url("latest", base_code)
 
-        data = self._make_request_and_get_data(
-            url, self._response_error_handlers["latest"]
+        # Read once, as start_prefetching may install a cache meanwhile
+        rates_cache = self._rates_cache
+        stale = None if rates_cache is None else rates_cache.get_stale(base_code)
+
+        # Always a CachedTable, so that a coalescer shared with clients with or
+        # without a rates cache hands every caller the same type
+        table = self._request_model(
+            url,
+            "latest",
+            functools.partial(self._build_latest_table, stale),
+            cache_hit=None if rates_cache is None else False,
+            headers=self._conditional_headers(stale),
+            codes_check=codes_check,
         )
 
-        obj = ExclusiveExchangeRates(**data)
+        if rates_cache is not None:
+            if table is stale:
+                rates_cache.revalidate(table.snapshot)
+            else:
+                rates_cache.put(*table)
+
+        obj = table.snapshot
+
+        if self._prefetcher is not None:
+            self._prefetcher.observe(obj)
 
         return obj
 
@@ -140,6 +414,11 @@ class ExchangeRateApiV6Client:
         """
         Convert an amount from one currency to another using the latest exchange rate.
 
+        If the client was created with `local_pair_conversion=True`, the conversion is
+        computed from the cached latest table of the base code, and the network is only
+        used when that table is stale. With `cross_rate_anchor`, the table of the anchor
+        currency is used for every pair instead.
+
         Args:
             base_code (str): The ISO 4217 currency code for the base currency.
             target_code (str): The ISO 4217 currency code for the target currency.
@@ -173,23 +452,23 @@ class ExchangeRateApiV6Client:
         if amount is not None and not isinstance(amount, (int, float)):
             raise ValueError("Amount must be an integer or float")
 
-        if not self._is_supported_code(base_code):
-            raise UnsupportedCode(f"Base code {base_code} is not supported")
+        if self._local_pair_conversion:
+            return self._convert_from_latest_table(base_code, target_code, amount)
 
-        if not self._is_supported_code(target_code):
-            raise UnsupportedCode(f"Target code {target_code} is not supported")
+        codes_check = self._check_supported_codes(base_code, target_code)
 
         if amount is not None and amount < 0:
             raise ValueError("Amount must be a greater than or equal to 0")
 
         url = self._build_endpoint_url("pair", base_code, target_code, amount)
 
-        data = self._make_request_and_get_data(
-            url, self._response_error_handlers["pair"]
+        obj = self._request_model(
+            url,
+            "pair",
+            self._model_builder(PairConversion),
+            codes_check=codes_check,
         )
 
-        obj = PairConversion(**data)
-
         return obj
 
     def fetch_enriched_data(self, base_code: str, target_code: str) -> EnrichedData:
@@ -226,26 +505,14 @@ class ExchangeRateApiV6Client:
         if not isinstance(base_code, str) or not isinstance(target_code, str):
             raise ValueError("Base code and target code must be a str")
 
-        if not self._is_supported_code(base_code):
-            raise UnsupportedCode(f"Base code {base_code} is not supported")
-
-        if not self._is_supported_code(target_code):
-            raise UnsupportedCode(f"Target code {target_code} is not supported")
+        codes_check = self._check_supported_codes(base_code, target_code)
 
         url = self._build_endpoint_url("enriched", base_code, target_code)
 
-        data = self._make_request_and_get_data(
-            url, self._response_error_handlers["enriched"]
+        obj = self._request_model(
+            url, "enriched", self._build_enriched_data, codes_check=codes_check
         )
 
-        target_data = TargetData(**data["target_data"])
-
-        data_without_target = {
-            key: value for key, value in data.items() if key != "target_data"
-        }
-
-        obj = EnrichedData(target_data=target_data, **data_without_target)
-
         return obj
 
     def fetch_historical_data(
@@ -254,6 +521,9 @@ class ExchangeRateApiV6Client:
         """
         Fetch historical exchange rates for a specific date.
 
+        If the client has a historical store, days already stored are served from it
+        without a request, and fetched past days are written to it.
+
         Args:
             base_code (str): The base currency code.
             date_obj (date): The date for which historical data is requested.
@@ -282,21 +552,221 @@ class ExchangeRateApiV6Client:
         if not isinstance(amount, (int, float)):
             raise ValueError("Amount must be an integer or a float")
 
-        if not self._is_supported_code(base_code):
-            raise UnsupportedCode(f"Base code {base_code} is not supported")
+        if self._historical_store is not None:
+            start = time.perf_counter() if self._request_hooks else 0.0
+            stored = self._historical_store.get(
+                base_code,
+                date_obj,
+                amount,
+                functools.partial(self._build_payload, HistoricalData),
+            )
+            if stored is not None:
+                if self._request_hooks:
+                    self._emit_cache_hit("historical", start)
+                return stored
+
+        codes_check = self._check_supported_codes(base_code)
 
         year, month, day = (date_obj.year, date_obj.month, date_obj.day)
 
         url = self._build_endpoint_url("history", base_code, year, month, day, amount)
 
-        data = self._make_request_and_get_data(
-            url, self._response_error_handlers["historical"]
+        obj = self._request_model(
+            url,
+            "historical",
+            self._model_builder(HistoricalData),
+            cache_hit=None if self._historical_store is None else False,
+            codes_check=codes_check,
         )
 
-        obj = HistoricalData(**data)
+        if self._historical_store is not None:
+            self._historical_store.put(obj)
 
         return obj
 
+    def fetch_historical_range(
+        self,
+        base_code: str,
+        start_date: date,
+        end_date: date,
+        amount: float = 1,
+        max_in_flight: int = 8,
+    ) -> HistoricalRange:
+        """
+        Fetch historical exchange rates for every day of a date range, concurrently.
+
+        Days already in the historical store are not requested. Days without data are
+        collected in `missing` instead of aborting the whole range. For the requests to
+        reuse connections, keep `max_in_flight` at or below the client's `pool_maxsize`.
+
+        Args:
+            base_code (str): The base currency code.
+            start_date (date): The first day of the range.
+            end_date (date): The last day of the range, inclusive.
+            amount (float): The amount of the base currency to convert.
+            max_in_flight (int): Maximum number of concurrent requests.
+
+        Returns:
+            HistoricalRange: The data of every day with data, in date order, and the days
+            without data.
+
+        Raises:
+            ValueError: If one of the given arguments is invalid
+            UnsupportedCode: If the base currency code is not supported.
+            MalformedRequest: If the request structure does not follow the expected format.
+            InvalidKey: If the API key provided is invalid.
+            InactiveAccount: If the account associated with the API key is not active.
+            QuotaReached: If the request exceeds the number of allowed API requests for the account's plan.
+            PlanUpgradeRequired: If the current plan does not support the requested data.
+
+        Example:
+            ```python
+            client = ExchangeRateV6Client(api_key="your_api_key")
+            history = client.fetch_historical_range("USD", date(2023, 1, 1), date(2023, 12, 31))
+            print(len(history.data))  # Output: 365
+            print(history.missing)  # Output: []
+            ```
+        """
+        dates = historical_range_dates(
+            base_code, start_date, end_date, amount, max_in_flight
+        )
+
+        results: Dict[date, Optional[HistoricalData]] = {}
+
+        if self._historical_store is not None:
+            for date_obj in dates:
+                stored = self._historical_store.get(
+                base_code,
+                date_obj,
+                amount,
+                functools.partial(self._build_payload, HistoricalData),
+            )
+                if stored is not None:
+                    results[date_obj] = stored
+
+        pending = [date_obj for date_obj in dates if date_obj not in results]
+
+        if pending:
+            # Validate once up front instead of letting every worker race on /codes
+            if not self._is_supported_code(base_code):
+                raise UnsupportedCode(f"Base code {base_code} is not supported")
+
+            def fetch(date_obj: date) -> HistoricalData:
+                return self.fetch_historical_data(base_code, date_obj, amount)
+
+            results.update(fetch_historical_days(fetch, pending, max_in_flight))
+
+        return historical_range(dates, results)
+
+    def fetch_cross_rates(
+        self, anchor_code: Optional[str] = None
+    ) -> "CrossRateMatrix":
+        """
+        Derive the cross rates between every supported currency from one latest table.
+
+        The latest table of the anchor currency goes through the rates cache, and the
+        derived matrix is reused for as long as that table is.
+
+        Args:
+            anchor_code (Optional[str]): The currency whose latest table is used. Defaults
+                to the client's `cross_rate_anchor`, or USD.
+
+        Returns:
+            CrossRateMatrix: Cross rates indexed by currency ordinal.
+
+        Raises:
+            ImportError: If numpy is not installed.
+            ValueError: If one of the given arguments is invalid
+            UnsupportedCode: If the anchor code is not a supported currency code.
+            MalformedRequest: If the request is malformed and cannot be processed by the API.
+            InvalidKey: If the provided API key is invalid.
+            InactiveAccount: If the account associated with the API key is inactive.
+            QuotaReached: If the API quota has been exceeded.
+
+        Example:
+            ```python
+            client = ExchangeRateV6Client(api_key="your_api_key")
+            cross_rates = client.fetch_cross_rates("USD")
+            print(cross_rates.rate("EUR", "JPY"))  # Output: EUR to JPY rate
+            ```
+        """
+        from ._cross_rates import CrossRateMatrix
+
+        if anchor_code is None:
+            anchor_code = self._cross_rate_anchor or "USD"
+
+        snapshot = self.fetch_exchange_rates(anchor_code)
+
+        cross_rates = self._cross_rates.get(anchor_code)
+        if cross_rates is None or cross_rates.snapshot is not snapshot:
+            cross_rates = CrossRateMatrix.from_snapshot(snapshot)
+            self._cross_rates[anchor_code] = cross_rates
+
+        return cross_rates
+
+    def convert_many(
+        self,
+        amounts: Sequence[float],
+        bases: "CodeColumn",
+        targets: "CodeColumn",
+        chunk_size: int = 1_000_000,
+    ) -> "BatchConversion":
+        """
+        Convert many amounts at once with the latest exchange rates.
+
+        Only the latest tables needed are fetched, once per call and through the rates
+        cache: one per distinct base code, or just the anchor table if the client has a
+        `cross_rate_anchor`. The conversion itself is a vectorized NumPy gather and
+        multiply done in chunks, so memory stays bounded for large inputs.
+
+        Args:
+            amounts (Sequence[float]): The amounts to convert.
+            bases (Union[str, Sequence[str]]): The base code of every amount, or one code for all.
+            targets (Union[str, Sequence[str]]): The target code of every amount, or one code for all.
+            chunk_size (int): Number of rows converted at a time.
+
+        Returns:
+            BatchConversion: The converted amounts in input order, and the update times of the
+            tables used.
+
+        Raises:
+            ImportError: If numpy is not installed.
+            ValueError: If one of the given arguments is invalid
+            UnsupportedCode: If a base or target code is not a supported currency code.
+            MalformedRequest: If the request is malformed and cannot be processed by the API.
+            InvalidKey: If the provided API key is invalid.
+            InactiveAccount: If the account associated with the API key is inactive.
+            QuotaReached: If the API quota has been exceeded.
+
+        Example:
+            ```python
+            client = ExchangeRateV6Client(api_key="your_api_key")
+            batch = client.convert_many([10, 20, 30], ["USD", "EUR", "USD"], "JPY")
+            print(batch.results)  # Output: array of JPY amounts
+            print(batch.time_last_update_unix)  # Output: {"USD": ..., "EUR": ...}
+            ```
+        """
+        from ._batch import batch_conversion, convert_many, convert_with_tables
+
+        if not self._cross_rate_anchor:
+            return convert_with_tables(
+                amounts, bases, targets, self.fetch_exchange_rates, chunk_size
+            )
+
+        # Fetched with the first chunk, so that invalid arguments are raised first
+        cross_rates: List["CrossRateMatrix"] = []
+
+        def rate_block(base_codes, target_codes):
+            if not cross_rates:
+                cross_rates.append(self.fetch_cross_rates())
+            return cross_rates[0].block(base_codes, target_codes)
+
+        results = convert_many(amounts, bases, targets, rate_block, chunk_size)
+
+        return batch_conversion(
+            results, {matrix.anchor_code: matrix.snapshot for matrix in cross_rates}
+        )
+
     def fetch_quota_info(self) -> APIQuotaStatus:
         """
         Fetch the API quota status to determine the number of requests remaining.
@@ -312,62 +782,272 @@ class ExchangeRateApiV6Client:
         """
         url = self._build_endpoint_url("quota")
 
-        data = self._make_request_and_get_data(
-            url, [handle_invalid_key, handle_inactive_account, handle_quota_reached]
+        obj = self._request_model(url, "quota", self._model_builder(APIQuotaStatus))
+
+        return obj
+
+    def _convert_from_latest_table(
+        self, base_code: str, target_code: str, amount: Optional[float]
+    ) -> PairConversion:
+        if amount is not None and amount < 0:
+            raise ValueError("Amount must be a greater than or equal to 0")
+
+        if self._cross_rate_anchor:
+            return self.fetch_cross_rates().pair_conversion(
+                base_code, target_code, amount
+            )
+
+        table = self.fetch_exchange_rates(base_code)
+
+        conversion_rate = table.conversion_rates.get(target_code)
+        if conversion_rate is None:
+            raise UnsupportedCode(f"Target code {target_code} is not supported")
+
+        return PairConversion(
+            time_last_update_unix=table.time_last_update_unix,
+            time_last_update_utc=table.time_last_update_utc,
+            time_next_update_unix=table.time_next_update_unix,
+            time_next_update_utc=table.time_next_update_utc,
+            base_code=base_code,
+            target_code=target_code,
+            conversion_rate=conversion_rate,
+            conversion_result=None if amount is None else amount * conversion_rate,
         )
 
-        obj = APIQuotaStatus(**data)
+    def _request_model(
+        self,
+        url: str,
+        endpoint: str,
+        build: Callable[[Any], Any],
+        cache_hit: Optional[bool] = None,
+        headers: Optional[Dict[str, str]] = None,
+        codes_check: float = 0.0,
+    ):
+        if self._request_hooks:
+            # The codes check of the call is reported with its first attempt only
+            pending_codes_check = [codes_check]
+
+            def attempt():
+                return self._traced_attempt(
+                    url,
+                    endpoint,
+                    build,
+                    cache_hit,
+                    headers,
+                    pending_codes_check.pop() if pending_codes_check else 0.0,
+                )
+
+        else:
+            attempt = functools.partial(self._attempt, url, endpoint, build, headers)
+
+        def request():
+            if self._circuit_breaker is None:
+                guarded = attempt
+            else:
+                guarded = functools.partial(
+                    self._circuit_breaker.call, endpoint, attempt
+                )
+
+            if self._retry_policy is None:
+                return guarded()
+
+            return self._retry_policy.call(guarded)
+
+        if self._coalescer is None:
+            return request()
+
+        return self._coalescer.run(url, request)
+
+    def _attempt(
+        self,
+        url: str,
+        endpoint: str,
+        build: Callable[[Any], Any],
+        headers: Optional[Dict[str, str]],
+        trace: Optional[RequestTrace] = None,
+    ):
+        """
+        One try of `_request_model`. With a trace, each phase is timed for the request
+        hooks.
+        """
+        start = time.perf_counter() if trace is not None else 0.0
+        self._acquire_request_budget(endpoint)
+        if trace is not None:
+            trace.add("budget", time.perf_counter() - start)
+
+        try:
+            response = self._make_request(
+                url, self._ENDPOINT_ERRORS[endpoint], trace, headers
+            )
+        except QuotaReached:
+            if self._quota_governor is not None:
+                self._quota_governor.exhaust()
+            raise
+
+        if trace is None:
+            return build(response)
+
+        if not self._strict_validation and response.status_code != 304:
+            start = time.perf_counter()
+            response = DecodedResponse.decode(response)
+            trace.add("decode", time.perf_counter() - start)
+
+        start = time.perf_counter()
+        obj = build(response)
+        trace.add("validate", time.perf_counter() - start)
 
         return obj
 
-    def _build_endpoint_url(self, endpoint: str, *params):
-        url = f"{self._build_api_key_url()}/{endpoint}"
-        present_params = filter(lambda p: p is not None, params)
-        if params:
-            url = f"{url}/{'/'.join([str(param) for param in present_params])}"
-        return url
+    def _traced_attempt(
+        self,
+        url: str,
+        endpoint: str,
+        build: Callable[[Any], Any],
+        cache_hit: Optional[bool],
+        headers: Optional[Dict[str, str]],
+        codes_check: float,
+    ):
+        """`_attempt` with a trace, whose event is emitted to the request hooks."""
+        trace = RequestTrace(endpoint, cache_hit)
+        started = time.perf_counter()
+
+        if codes_check:
+            trace.add("codes_check", codes_check)
 
-    def _make_request_and_get_data(
-        self, url: str, error_handlers: List[ResponseErrorHandler]
-    ) -> Any:
         try:
-            response = requests.get(url, timeout=10)
+            return self._attempt(url, endpoint, build, headers, trace)
+        except Exception as e:
+            if trace.error_type is None:
+                trace.error_type = type(e).__name__
+            raise
+        finally:
+            trace.add("total", time.perf_counter() - started + codes_check)
+            emit(self._request_hooks, trace.event())
+
+    def _emit_cache_hit(self, endpoint: str, start: float):
+        event = RequestEvent(
+            endpoint=endpoint,
+            status=None,
+            error_type=None,
+            cache_hit=True,
+            bytes_received=0,
+            phases={"total": time.perf_counter() - start},
+        )
+        emit(self._request_hooks, event)
 
-            data = response.json()
+    def _acquire_request_budget(self, endpoint: str):
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire()
 
-            if not (200 <= response.status_code <= 299):
-                error_type = data.get("error-type")
-                if error_type:
-                    for error_handler in error_handlers:
-                        error_handler(response)
-                raise Exception("Unknown error ocurred")
+        # Quota requests are not counted against the quota
+        if self._quota_governor is not None and endpoint != "quota":
+            self._quota_governor.ensure_seeded(self.fetch_quota_info)
+            self._quota_governor.acquire(self._low_priority)
 
-            return data
+    def _make_request(
+        self,
+        url: str,
+        errors: ErrorDispatch,
+        trace: Optional[RequestTrace] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> requests.Response:
+        start = time.perf_counter() if trace is not None else 0.0
+        try:
+            if headers:
+                response = self._session.get(
+                    url, timeout=self._timeout, headers=headers
+                )
+            else:
+                response = self._session.get(url, timeout=self._timeout)
         except requests.exceptions.Timeout:
-            raise Exception("The request to the Exchange Rate API timed out")
-        except Exception as e:
-            raise e
+            raise RequestTimeout("The request to the Exchange Rate API timed out")
+        except requests.exceptions.ConnectionError as e:
+            raise RequestsConnectionFailed(
+                "Could not connect to the Exchange Rate API"
+            ) from e
+
+        if trace is not None:
+            trace.record_response(response, time.perf_counter() - start)
+
+        self._transfer_stats.record(response)
+
+        if response.status_code >= 500:
+            raise ServerError(
+                f"The Exchange Rate API failed with status {response.status_code}"
+            )
+
+        # Not modified, answered to conditional requests
+        if response.status_code == 304:
+            return response
+
+        if not (200 <= response.status_code <= 299):
+            data = decode_response(response)
+            if trace is not None:
+                trace.error_type = data.get("error-type")
+            raise_for_error_type(errors, data.get("error-type"))
+
+        return response
+
+    def _build_latest_table(
+        self, stale: Optional[CachedTable], response: Any
+    ) -> CachedTable:
+        # The stale table itself is returned when upstream has no new one
+        if stale is not None:
+            if response.status_code == 304:
+                return stale
+
+            last_update = peek_int(response, "time_last_update_unix")
+            if last_update == stale.snapshot.time_last_update_unix:
+                return stale
+
+        return CachedTable(
+            self._build_model(ExclusiveExchangeRates, response),
+            self._response_header(response, "ETag"),
+            self._response_header(response, "Last-Modified"),
+        )
+
+    @staticmethod
+    def _conditional_headers(
+        stale: Optional[CachedTable],
+    ) -> Optional[Dict[str, str]]:
+        if stale is None:
+            return None
+
+        headers = {}
+        if stale.etag:
+            headers["If-None-Match"] = stale.etag
+        if stale.last_modified:
+            headers["If-Modified-Since"] = stale.last_modified
+
+        return headers or None
+
+    @staticmethod
+    def _response_header(response: Any, name: str) -> Optional[str]:
+        value = getattr(response, "headers", {}).get(name)
+        return value if isinstance(value, str) else None
 
     def _is_supported_code(self, code: str) -> bool:
-        if (
-            self._supported_codes_cache is None
-            or time.time() - self._cache_timestamp > self._CACHE_TIMEOUT
-        ):
-            self._udpate_supported_codes_cache()
+        return code in self._supported_codes
 
-        return code in self._supported_codes_cache
+    def _check_supported_codes(
+        self, base_code: str, target_code: Optional[str] = None
+    ) -> float:
+        """
+        Raise `UnsupportedCode` unless the codes of a call are supported. Returns the
+        seconds the check took when request hooks are registered, or 0 otherwise, to be
+        reported with the request of that call.
+        """
+        start = time.perf_counter() if self._request_hooks else 0.0
 
-    def _udpate_supported_codes_cache(self):
-        url = self._build_endpoint_url("codes")
+        if not self._is_supported_code(base_code):
+            raise UnsupportedCode(f"Base code {base_code} is not supported")
 
-        data = self._make_request_and_get_data(
-            url, self._response_error_handlers["codes"]
-        )
+        if target_code is not None and not self._is_supported_code(target_code):
+            raise UnsupportedCode(f"Target code {target_code} is not supported")
 
-        supported_codes = data.get("supported_codes", [])
+        return time.perf_counter() - start if self._request_hooks else 0.0
 
-        self._supported_codes_cache = {code for code, _ in supported_codes}
-        self._cache_timestamp = time.time()
+    def _fetch_supported_codes(self) -> List[str]:
+        url = self._build_endpoint_url("codes")
 
-    def _build_api_key_url(self) -> str:
-        return f"{self._EXCHANGE_RATE_API_V6_URL}/{self._api_key}"
+        return self._request_model(url, "codes", self._parse_supported_codes)
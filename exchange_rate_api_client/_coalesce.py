@@ -0,0 +1,117 @@
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+import asyncio
+
+import functools
+
+import threading
+
+
+T = TypeVar("T")
+
+
+class _InFlightCall:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class _CoalescerStats:
+    _calls: int
+    _coalesced: int
+
+    @property
+    def calls(self) -> int:
+        """Number of calls made through the coalescer."""
+        return self._calls
+
+    @property
+    def coalesced(self) -> int:
+        """Number of calls that waited on another identical call instead of running."""
+        return self._coalesced
+
+
+class RequestCoalescer(_CoalescerStats):
+    """
+    Coalesce identical concurrent calls made from several threads.
+
+    The first call for a key runs, and calls for the same key made while it is in flight
+    wait for it and get its result, or its exception, instead of running again.
+
+    Example:
+        ```python
+        coalescer = RequestCoalescer()
+        client = ExchangeRateApiV6Client("your_api_key", coalescer=coalescer)
+        # Threads calling client.fetch_exchange_rates("USD") at once share one request
+        print(coalescer.calls, coalescer.coalesced)
+        ```
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, _InFlightCall] = {}
+        self._calls = 0
+        self._coalesced = 0
+
+    def run(self, key: str, func: Callable[[], T]) -> T:
+        with self._lock:
+            self._calls += 1
+            call = self._in_flight.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = self._in_flight[key] = _InFlightCall()
+            else:
+                self._coalesced += 1
+
+        if not is_leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+            call.done.set()
+
+
+class AsyncRequestCoalescer(_CoalescerStats):
+    """
+    Coalesce identical concurrent calls made from several asyncio tasks of one event loop.
+
+    Same behaviour as `RequestCoalescer`. The shared call runs in a task of its own, so
+    cancelling any of the calling tasks, the first one included, does not cancel it for
+    the others.
+    """
+
+    def __init__(self):
+        self._in_flight: Dict[str, "asyncio.Future"] = {}
+        self._calls = 0
+        self._coalesced = 0
+
+    async def run(self, key: str, func: Callable[[], Awaitable[T]]) -> T:
+        self._calls += 1
+
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._in_flight[key] = task
+            task.add_done_callback(functools.partial(self._done, key))
+        else:
+            self._coalesced += 1
+
+        return await asyncio.shield(task)
+
+    def _done(self, key: str, task: "asyncio.Future"):
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved in case every caller was cancelled
+            task.exception()
@@ -0,0 +1,120 @@
+from typing import Callable, FrozenSet, Iterable, Optional
+
+import logging
+
+import math
+
+import threading
+
+import time
+
+
+logger = logging.getLogger(__name__)
+
+
+class SupportedCodesCache:
+    """
+    Thread-safe cache of the supported currency codes.
+
+    The first load blocks and raises on failure, with concurrent callers waiting on a
+    single fetch. Once loaded, an expired set keeps being served while one background
+    thread refreshes it. A failed refresh keeps the previous set and is retried after
+    `retry_interval` seconds.
+
+    A cache created with a `seed` never blocks: the seed is served right away and the
+    live list is fetched in the background on first use.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[], Iterable[str]],
+        timeout: float,
+        retry_interval: float = 60,
+        clock: Callable[[], float] = time.time,
+        seed: Optional[Iterable[str]] = None,
+    ):
+        """
+        Args:
+            fetch (Callable[[], Iterable[str]]): Loads the supported codes.
+            timeout (float): Seconds after which a loaded set is refreshed. Use
+                ``math.inf`` to never refresh a seeded cache.
+            retry_interval (float): Seconds to wait before retrying a failed refresh.
+            clock (Callable[[], float]): Returns the current unix time. Meant for tests.
+            seed (Optional[Iterable[str]]): Codes served until the first fetch succeeds.
+        """
+        self._fetch = fetch
+        self._timeout = timeout
+        self._retry_interval = retry_interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._codes: Optional[FrozenSet[str]] = None
+        self._timestamp = 0.0
+        if seed is not None:
+            self._codes = frozenset(seed)
+            # Stale from the start so the live list is reconciled on first use
+            self._timestamp = -math.inf
+        self._refreshing = False
+        self._refresh_thread: Optional[threading.Thread] = None
+
+    def get(self) -> FrozenSet[str]:
+        """
+        Return the supported codes, loading them on first use.
+
+        Raises:
+            Exception: Whatever `fetch` raises on the first load.
+        """
+        codes = self._codes
+
+        if codes is None:
+            with self._lock:
+                # Another thread may have loaded the codes while we were waiting
+                if self._codes is None:
+                    self._store(self._fetch())
+                return self._codes
+
+        if self._clock() - self._timestamp > self._timeout:
+            self._start_refresh()
+
+        return codes
+
+    def __contains__(self, code: str) -> bool:
+        return code in self.get()
+
+    def wait_for_refresh(self, timeout: Optional[float] = None):
+        """Block until a running background refresh finishes. Meant for tests."""
+        thread = self._refresh_thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def _start_refresh(self):
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+
+        self._refresh_thread = threading.Thread(
+            target=self._refresh, name="supported-codes-refresh", daemon=True
+        )
+        self._refresh_thread.start()
+
+    def _refresh(self):
+        try:
+            codes = self._fetch()
+        except Exception:
+            logger.warning(
+                "Refreshing the supported codes failed, keeping the previous set",
+                exc_info=True,
+            )
+            with self._lock:
+                self._timestamp = (
+                    self._clock() - self._timeout + self._retry_interval
+                )
+        else:
+            with self._lock:
+                self._store(codes)
+        finally:
+            self._refreshing = False
+
+    def _store(self, codes: Iterable[str]):
+        self._codes = frozenset(codes)
+        self._timestamp = self._clock()
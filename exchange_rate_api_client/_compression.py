@@ -0,0 +1,116 @@
+from typing import Any, Dict, Iterable, Optional
+
+import threading
+
+from ._json import raw_body
+
+
+# Best compression ratio first. Rate tables are repetitive JSON maps of currency codes,
+# so the dictionary based codecs shrink them the most.
+_PREFERRED_ENCODINGS = ("zstd", "br", "gzip", "deflate")
+
+
+def accept_encoding(supported: Iterable[str]) -> str:
+    """
+    Build an Accept-Encoding header value listing the codecs that can be decoded,
+    most preferred first.
+
+    Args:
+        supported (Iterable[str]): The encodings the HTTP library can decode, which
+            depends on the optional codecs installed (brotli, zstandard).
+    """
+    supported = {encoding.strip().lower() for encoding in supported}
+    return ", ".join(
+        encoding for encoding in _PREFERRED_ENCODINGS if encoding in supported
+    )
+
+
+def _wire_bytes(response: Any, content: bytes) -> int:
+    # httpx counts the bytes read from the network before decoding
+    downloaded = getattr(response, "num_bytes_downloaded", None)
+    if isinstance(downloaded, int):
+        return downloaded
+
+    # urllib3 counts them in the raw response of requests
+    tell = getattr(getattr(response, "raw", None), "tell", None)
+    if tell is not None:
+        position = tell()
+        if isinstance(position, int):
+            return position
+
+    return len(content)
+
+
+class TransferStats:
+    """
+    Thread-safe counters of the response bytes received by a client, as sent over the
+    network (compressed) and after decoding (uncompressed).
+
+    Example:
+        ```python
+        client.fetch_exchange_rates("USD")
+        stats = client.transfer_stats
+        print(stats.compressed_bytes, stats.uncompressed_bytes, stats.encodings)
+        ```
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._responses = 0
+        self._compressed_bytes = 0
+        self._uncompressed_bytes = 0
+        self._encodings: Dict[str, int] = {}
+
+    @property
+    def responses(self) -> int:
+        """Number of response bodies received."""
+        return self._responses
+
+    @property
+    def compressed_bytes(self) -> int:
+        """Body bytes received over the network, before decoding."""
+        return self._compressed_bytes
+
+    @property
+    def uncompressed_bytes(self) -> int:
+        """Body bytes after decoding."""
+        return self._uncompressed_bytes
+
+    @property
+    def compression_ratio(self) -> Optional[float]:
+        """Compressed bytes per uncompressed byte, or None before any response."""
+        if not self._uncompressed_bytes:
+            return None
+        return self._compressed_bytes / self._uncompressed_bytes
+
+    @property
+    def encodings(self) -> Dict[str, int]:
+        """Number of responses per content encoding, "identity" for uncompressed ones."""
+        with self._lock:
+            return dict(self._encodings)
+
+    def record(self, response: Any):
+        """Count the body of a requests or httpx response that was read in full."""
+        content = raw_body(response)
+        if content is None:
+            return
+
+        encoding = getattr(response, "headers", {}).get("Content-Encoding")
+        if not isinstance(encoding, str):
+            encoding = "identity"
+
+        wire_bytes = _wire_bytes(response, content)
+
+        with self._lock:
+            self._responses += 1
+            self._compressed_bytes += wire_bytes
+            self._uncompressed_bytes += len(content)
+            self._encodings[encoding] = self._encodings.get(encoding, 0) + 1
+
+    def reset(self):
+        """Set every counter back to zero."""
+        with self._lock:
+            self._responses = 0
+            self._compressed_bytes = 0
+            self._uncompressed_bytes = 0
+            self._encodings.clear()
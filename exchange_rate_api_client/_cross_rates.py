@@ -0,0 +1,155 @@
+from typing import Dict, Optional, Sequence, Tuple
+
+from .commons import ExclusiveExchangeRates, PairConversion
+
+from .exceptions import UnsupportedCode
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without the extra
+    np = None
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError(
+            "Cross rates require numpy. "
+            "Install it with: pip install exchange-rate-api-client[numpy]"
+        )
+
+
+class CrossRateMatrix:
+    """
+    Dense matrix of cross rates between every pair of currencies of one snapshot.
+
+    ``matrix[i, j]`` is the rate to convert one unit of ``codes[i]`` into ``codes[j]``.
+    All rates are triangulated through the anchor currency of the snapshot, so one
+    `/latest/{anchor}` table is enough to answer any pair.
+
+    Example:
+        ```python
+        snapshot = client.fetch_exchange_rates("USD")
+        cross = CrossRateMatrix.from_snapshot(snapshot)
+        print(cross.rate("EUR", "JPY"))  # Output: EUR to JPY rate
+        print(cross.row("EUR"))  # Output: EUR to every currency, ordered as cross.codes
+        ```
+    """
+
+    def __init__(
+        self,
+        codes: Sequence[str],
+        matrix: "np.ndarray",
+        snapshot: ExclusiveExchangeRates,
+    ):
+        _require_numpy()
+
+        if matrix.shape != (len(codes), len(codes)):
+            raise ValueError("Matrix must be square and match the number of codes")
+
+        self._codes: Tuple[str, ...] = tuple(codes)
+        self._ordinals: Dict[str, int] = {
+            code: ordinal for ordinal, code in enumerate(self._codes)
+        }
+        self._matrix = matrix
+        self._matrix.setflags(write=False)
+        self._snapshot = snapshot
+
+    @classmethod
+    def from_snapshot(cls, snapshot: ExclusiveExchangeRates) -> "CrossRateMatrix":
+        """
+        Derive every cross rate from a latest table.
+
+        Args:
+            snapshot (ExclusiveExchangeRates): The latest table of the anchor currency.
+
+        Returns:
+            CrossRateMatrix: The cross rates of every currency in the table.
+
+        Raises:
+            ImportError: If numpy is not installed.
+            ValueError: If the table contains a rate that is not greater than 0.
+        """
+        _require_numpy()
+
+        codes = tuple(snapshot.conversion_rates)
+        anchor_rates = np.fromiter(
+            snapshot.conversion_rates.values(), dtype=np.float64, count=len(codes)
+        )
+
+        if not np.all(anchor_rates > 0):
+            raise ValueError("Conversion rates must be greater than 0")
+
+        # anchor->j divided by anchor->i is the i->j rate
+        matrix = np.outer(1.0 / anchor_rates, anchor_rates)
+
+        return cls(codes, matrix, snapshot)
+
+    @property
+    def codes(self) -> Tuple[str, ...]:
+        """Currency codes ordered by ordinal."""
+        return self._codes
+
+    @property
+    def matrix(self) -> "np.ndarray":
+        """Read-only cross rate matrix indexed by currency ordinals."""
+        return self._matrix
+
+    @property
+    def snapshot(self) -> ExclusiveExchangeRates:
+        """The latest table the matrix was derived from."""
+        return self._snapshot
+
+    @property
+    def anchor_code(self) -> str:
+        return self._snapshot.base_code
+
+    def ordinal(self, code: str) -> int:
+        """
+        Return the row/column index of a currency code.
+
+        Raises:
+            UnsupportedCode: If the code is not part of the snapshot.
+        """
+        ordinal = self._ordinals.get(code)
+        if ordinal is None:
+            raise UnsupportedCode(f"Code {code} is not supported")
+        return ordinal
+
+    def rate(self, base_code: str, target_code: str) -> float:
+        """Rate to convert one unit of base_code into target_code."""
+        return float(self._matrix[self.ordinal(base_code), self.ordinal(target_code)])
+
+    def row(self, base_code: str) -> "np.ndarray":
+        """View of the rates from base_code to every currency, ordered as `codes`."""
+        return self._matrix[self.ordinal(base_code)]
+
+    def column(self, target_code: str) -> "np.ndarray":
+        """View of the rates from every currency to target_code, ordered as `codes`."""
+        return self._matrix[:, self.ordinal(target_code)]
+
+    def block(
+        self, base_codes: Sequence[str], target_codes: Sequence[str]
+    ) -> "np.ndarray":
+        """Rates from every base code to every target code, as a new array."""
+        rows = [self.ordinal(code) for code in base_codes]
+        columns = [self.ordinal(code) for code in target_codes]
+        return self._matrix[np.ix_(rows, columns)]
+
+    def pair_conversion(
+        self, base_code: str, target_code: str, amount: Optional[float] = None
+    ) -> PairConversion:
+        """
+        Build the same result as `ExchangeRateApiV6Client.pair_conversion` without a request.
+        """
+        conversion_rate = self.rate(base_code, target_code)
+
+        return PairConversion(
+            time_last_update_unix=self._snapshot.time_last_update_unix,
+            time_last_update_utc=self._snapshot.time_last_update_utc,
+            time_next_update_unix=self._snapshot.time_next_update_unix,
+            time_next_update_utc=self._snapshot.time_next_update_utc,
+            base_code=base_code,
+            target_code=target_code,
+            conversion_rate=conversion_rate,
+            conversion_result=None if amount is None else amount * conversion_rate,
+        )
@@ -1,4 +1,13 @@
-from typing import Callable, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Optional,
+    Dict,
+    Tuple,
+    Type,
+    Union,
+)
 
 from .exceptions import (
     UnsupportedCode,
@@ -8,78 +17,152 @@ from .exceptions import (
     PlanUpgradeRequired,
     NoDataAvailable,
     MalformedRequest,
+    UnknownError,
 )
 
-import requests
+if TYPE_CHECKING:
+    import requests
+
+
+ErrorPayload = Union["requests.Response", Dict[str, Any]]
 
 
-ResponseErrorHandler = Callable[[requests.Response], None]
+ResponseErrorHandler = Callable[[ErrorPayload], None]
 
 
 ErrorTypeHandler = Callable[[str], None]
 
 
+ErrorDispatch = Dict[str, Tuple[Type[Exception], str]]
+
+
+UNKNOWN_ERROR_MESSAGE = "Unknown error ocurred"
+
+
+ERROR_TYPES: ErrorDispatch = {
+    "unsupported-code": (UnsupportedCode, "The supplied code is not supported"),
+    "invalid-key": (InvalidKey, "The api key is not valid"),
+    "inactive-account": (InactiveAccount, "The account's email wasn't confirmed"),
+    "quota-reached": (
+        QuotaReached,
+        "Reached the number of requests allowed in the plan",
+    ),
+    "plan-upgrade-required": (
+        PlanUpgradeRequired,
+        "The account plan doesn't support this type of request",
+    ),
+    "malformed-request": (
+        MalformedRequest,
+        "Invalid request structure. May be an invalid API key or another request argument",
+    ),
+    "no-data-available": (NoDataAvailable, "No data available"),
+}
+
+
+def error_dispatch(*error_types: str, **messages: str) -> ErrorDispatch:
+    """
+    Build the error-type to exception mapping of an endpoint.
+
+    Messages given as keyword arguments, with underscores in place of dashes, replace
+    the default message of their error type.
+    """
+    dispatch = {}
+    for error_type in error_types:
+        exception, message = ERROR_TYPES[error_type]
+        dispatch[error_type] = (
+            exception,
+            messages.get(error_type.replace("-", "_"), message),
+        )
+    return dispatch
+
+
+def raise_for_error_type(dispatch: ErrorDispatch, error_type: Optional[str]):
+    """
+    Raise the exception mapped to an error type, or `UnknownError` if there is none.
+    """
+    entry = dispatch.get(error_type) if error_type else None
+    if entry is None:
+        raise UnknownError(UNKNOWN_ERROR_MESSAGE)
+
+    exception, message = entry
+    raise exception(message)
+
+
 def error_type_handler(func: ErrorTypeHandler) -> ResponseErrorHandler:
-    def handler(response: requests.Response):
-        data = response.json()
+    def handler(payload: ErrorPayload):
+        data = payload if isinstance(payload, dict) else payload.json()
         if data and "error-type" in data:
             func(data["error-type"])
 
     return handler
 
 
-def handle_unsupported_code(
-    error_message: Optional[str] = None,
-) -> ResponseErrorHandler:
+def _handle(error_type: str, error_message: Optional[str] = None):
+    exception, message = ERROR_TYPES[error_type]
+
     @error_type_handler
-    def handler(error_type: str):
-        if error_type == "unsupported-code":
-            if error_message:
-                raise UnsupportedCode(error_message)
-            else:
-                raise UnsupportedCode("The supplied code is not supported")
+    def handler(received_error_type: str):
+        if received_error_type == error_type:
+            raise exception(error_message or message)
 
     return handler
 
 
-@error_type_handler
-def handle_invalid_key(error_type: str):
-    if error_type == "invalid-key":
-        raise InvalidKey("The api key is not valid")
+def handle_unsupported_code(
+    error_message: Optional[str] = None,
+) -> ResponseErrorHandler:
+    return _handle("unsupported-code", error_message)
 
 
-@error_type_handler
-def handle_inactive_account(error_type: str):
-    if error_type == "inactive-account":
-        raise InactiveAccount("The account's email wasn't confirmed")
+handle_invalid_key = _handle("invalid-key")
 
+handle_inactive_account = _handle("inactive-account")
 
-@error_type_handler
-def handle_quota_reached(error_type: str):
-    if error_type == "quota-reached":
-        raise QuotaReached("Reached the number of requests allowed in the plan")
+handle_quota_reached = _handle("quota-reached")
 
+handle_required_plan_upgrade = _handle("plan-upgrade-required")
 
-@error_type_handler
-def handle_required_plan_upgrade(error_type: str):
-    if error_type == "plan-upgrade-required":
-        raise PlanUpgradeRequired(
-            "The account plan doesn't support this type of request"
-        )
-
-
-@error_type_handler
-def handle_malformed_request(error_type: str):
-    if error_type == "malformed-request":
-        raise MalformedRequest(
-            "Invalid request structure. May be an invalid API key or another request argument"
-        )
+handle_malformed_request = _handle("malformed-request")
 
 
 def handle_no_data(error_message: str) -> ResponseErrorHandler:
-    @error_type_handler
-    def handler(error_type: str):
-        if error_type == "no-data-available":
-            raise NoDataAvailable(error_message)
-
-    return handler
+    return _handle("no-data-available", error_message)
+
+
+_ACCOUNT_ERRORS = ("invalid-key", "inactive-account", "quota-reached")
+
+
+ENDPOINT_ERRORS: Dict[str, ErrorDispatch] = {
+    "latest": error_dispatch(
+        "unsupported-code",
+        "malformed-request",
+        *_ACCOUNT_ERRORS,
+        unsupported_code="The base code is not supported",
+    ),
+    "pair": error_dispatch(
+        "unsupported-code",
+        "malformed-request",
+        *_ACCOUNT_ERRORS,
+        unsupported_code="One or both codes are not supported",
+    ),
+    "enriched": error_dispatch(
+        "unsupported-code",
+        "malformed-request",
+        "plan-upgrade-required",
+        *_ACCOUNT_ERRORS,
+        unsupported_code="One or both codes are not supported",
+    ),
+    "historical": error_dispatch(
+        "no-data-available",
+        "unsupported-code",
+        "malformed-request",
+        "plan-upgrade-required",
+        *_ACCOUNT_ERRORS,
+        no_data_available=(
+            "The database doesn't have any exchange rates for the specific date supplied"
+        ),
+        unsupported_code="The base code is not supported",
+    ),
+    "quota": error_dispatch(*_ACCOUNT_ERRORS),
+    "codes": error_dispatch(*_ACCOUNT_ERRORS),
+}
@@ -0,0 +1,151 @@
+from typing import Any, Callable, Dict, Optional
+
+from .commons import HistoricalData
+
+from datetime import date, datetime, timezone
+
+import json
+
+import sqlite3
+
+import threading
+
+
+def _utc_today() -> date:
+    return datetime.now(timezone.utc).date()
+
+
+class HistoricalStore:
+    """
+    Persistent SQLite store for historical data, keyed by (base_code, year, month, day).
+
+    Rates of a past day never change, so entries for dates strictly before the current
+    UTC day are kept forever. Entries are stored with the amount they were requested
+    with and rescaled on read, so any amount of an already stored day is served locally.
+    The store is safe to share between threads.
+
+    Example:
+        ```python
+        with HistoricalStore("history.sqlite3") as store:
+            client = ExchangeRateApiV6Client("your_api_key", historical_store=store)
+            client.fetch_historical_data("USD", date(2020, 1, 1), 100)  # Network
+            client.fetch_historical_data("USD", date(2020, 1, 1), 250)  # Disk
+        ```
+    """
+
+    def __init__(self, path: str, today: Callable[[], date] = _utc_today):
+        """
+        Args:
+            path (str): Path of the SQLite database file. Created if it does not exist.
+            today (Callable[[], date]): Returns the current UTC date. Meant for tests.
+        """
+        self._today = today
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS historical_data (
+                    base_code TEXT NOT NULL,
+                    year INTEGER NOT NULL,
+                    month INTEGER NOT NULL,
+                    day INTEGER NOT NULL,
+                    requested_amount REAL NOT NULL,
+                    conversion_amounts TEXT NOT NULL,
+                    PRIMARY KEY (base_code, year, month, day)
+                )
+                """
+            )
+
+    def get(
+        self,
+        base_code: str,
+        date_obj: date,
+        amount: float,
+        build: Callable[[Dict[str, Any]], HistoricalData] = (
+            HistoricalData.model_validate
+        ),
+    ) -> Optional[HistoricalData]:
+        """
+        Return the stored data of a day converted for the given amount, or None if the
+        day is not stored.
+
+        Args:
+            build (Callable[[Dict[str, Any]], HistoricalData]): Builds the model from the
+                rescaled payload. Clients pass their own builder, so that their
+                validation mode applies to stored days like to fetched ones.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                """
+                SELECT requested_amount, conversion_amounts FROM historical_data
+                WHERE base_code = ? AND year = ? AND month = ? AND day = ?
+                """,
+                (base_code, date_obj.year, date_obj.month, date_obj.day),
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        stored_amount, conversion_amounts = row
+        conversion_amounts = json.loads(conversion_amounts)
+
+        if amount != stored_amount:
+            factor = amount / stored_amount
+            conversion_amounts = {
+                code: value * factor for code, value in conversion_amounts.items()
+            }
+
+        return build(
+            {
+                "year": date_obj.year,
+                "month": date_obj.month,
+                "day": date_obj.day,
+                "base_code": base_code,
+                "requested_amount": amount,
+                "conversion_amounts": conversion_amounts,
+            },
+        )
+
+    def put(self, data: HistoricalData) -> bool:
+        """
+        Store the data of a day.
+
+        Returns:
+            bool: Whether the data was stored. Days that are not strictly in the past, and
+            data requested with an amount of 0 (which cannot be rescaled), are skipped.
+        """
+        if data.requested_amount == 0:
+            return False
+
+        if date(data.year, data.month, data.day) >= self._today():
+            return False
+
+        with self._lock, self._connection:
+            self._connection.execute(
+                """
+                INSERT OR REPLACE INTO historical_data
+                (base_code, year, month, day, requested_amount, conversion_amounts)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    data.base_code,
+                    data.year,
+                    data.month,
+                    data.day,
+                    data.requested_amount,
+                    json.dumps(data.conversion_amounts),
+                ),
+            )
+
+        return True
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> "HistoricalStore":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,295 @@
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import bisect
+
+import logging
+
+import math
+
+import threading
+
+from datetime import timedelta
+
+from ._json import decode_response, raw_body
+
+
+logger = logging.getLogger(__name__)
+
+
+PHASES = (
+    "codes_check",
+    "budget",
+    "connect_wait",
+    "download",
+    "decode",
+    "validate",
+    "total",
+)
+
+
+class RequestEvent(NamedTuple):
+    """
+    What happened during one request of a client, passed to its request hooks.
+
+    `phases` maps phase names to seconds. Only the phases the request went through are
+    present:
+
+    - codes_check: Checking the codes of the call against the supported codes.
+    - budget: Waiting on the rate limiter and the quota governor.
+    - connect_wait: From sending the request to receiving the response headers,
+      connection setup included.
+    - download: Reading the response body.
+    - decode: Decoding the JSON body. Part of validate with `strict_validation=True`.
+    - validate: Building the response model.
+    - total: The whole request.
+
+    Answers served from the rates cache or the historical store are reported too, with
+    `cache_hit=True`, no status and only the total phase.
+    """
+
+    endpoint: str
+    status: Optional[int]
+    # The API error type, or the exception class name for errors without one
+    error_type: Optional[str]
+    # None when the endpoint is not cached by the client
+    cache_hit: Optional[bool]
+    bytes_received: int
+    phases: Dict[str, float]
+
+
+RequestHook = Callable[[RequestEvent], None]
+
+
+class RequestTrace:
+    """Collects the timings and outcome of a request while it is made."""
+
+    __slots__ = (
+        "endpoint",
+        "cache_hit",
+        "status",
+        "error_type",
+        "bytes_received",
+        "phases",
+    )
+
+    def __init__(self, endpoint: str, cache_hit: Optional[bool] = None):
+        self.endpoint = endpoint
+        self.cache_hit = cache_hit
+        self.status: Optional[int] = None
+        self.error_type: Optional[str] = None
+        self.bytes_received = 0
+        self.phases: Dict[str, float] = {}
+
+    def add(self, phase: str, seconds: float):
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    def record_response(self, response: Any, seconds: float):
+        """Record a received response, which took `seconds` to get in full."""
+        self.status = response.status_code
+
+        content = raw_body(response)
+        if content is not None:
+            self.bytes_received = len(content)
+
+        elapsed = getattr(response, "elapsed", None)
+        if isinstance(elapsed, timedelta):
+            # requests measures the time until the headers are parsed
+            connect_wait = min(elapsed.total_seconds(), seconds)
+            self.add("connect_wait", connect_wait)
+            self.add("download", seconds - connect_wait)
+        else:
+            self.add("connect_wait", seconds)
+
+    def event(self) -> RequestEvent:
+        return RequestEvent(
+            endpoint=self.endpoint,
+            status=self.status,
+            error_type=self.error_type,
+            cache_hit=self.cache_hit,
+            bytes_received=self.bytes_received,
+            phases=self.phases,
+        )
+
+
+class DecodedResponse:
+    """
+    Stands in for a response whose body was already decoded, so that the model builders
+    reuse the payload instead of decoding it again.
+    """
+
+    __slots__ = ("_payload", "status_code", "headers")
+
+    content = None
+
+    def __init__(self, payload: Any, status_code: int = 200, headers: Any = None):
+        self._payload = payload
+        self.status_code = status_code
+        self.headers = {} if headers is None else headers
+
+    def json(self) -> Any:
+        return self._payload
+
+    @classmethod
+    def decode(cls, response: Any) -> "DecodedResponse":
+        return cls(
+            decode_response(response),
+            response.status_code,
+            getattr(response, "headers", None),
+        )
+
+
+def emit(hooks: Sequence[RequestHook], event: RequestEvent):
+    """
+    Call every hook with the event. A failing hook is logged and skipped, so that
+    tracing never changes the outcome of the request it reports.
+    """
+    for hook in hooks:
+        try:
+            hook(event)
+        except Exception:
+            logger.warning(
+                "Request hook %r failed on a %s event",
+                hook,
+                event.endpoint,
+                exc_info=True,
+            )
+
+
+def _default_bounds() -> Tuple[float, ...]:
+    # 0.25 ms to about 16 s, doubling
+    return tuple(0.00025 * 2**i for i in range(17))
+
+
+class LatencyHistogram:
+    """
+    Thread-safe in-memory latency histogram per endpoint, to register as a request hook.
+
+    Latencies are counted in fixed buckets, so memory stays constant however many
+    requests are recorded, and percentiles are the upper bound of their bucket.
+
+    Example:
+        ```python
+        histogram = LatencyHistogram()
+        client = ExchangeRateApiV6Client("your_api_key", request_hooks=[histogram])
+        client.fetch_exchange_rates("USD")
+        print(histogram.percentile(99, "latest"))  # Output: seconds
+        ```
+    """
+
+    def __init__(
+        self,
+        phase: str = "total",
+        bounds: Optional[Sequence[float]] = None,
+        include_cache_hits: bool = False,
+    ):
+        """
+        Args:
+            phase (str): The phase of the events that is recorded.
+            bounds (Optional[Sequence[float]]): Increasing upper bounds of the buckets in
+                seconds. Defaults to doubling bounds from 0.25 ms to about 16 s. Slower
+                requests go into a last, unbounded bucket.
+            include_cache_hits (bool): Also record answers served from memory.
+
+        Raises:
+            ValueError: If one of the given arguments is invalid
+        """
+        if phase not in PHASES:
+            raise ValueError(f"Phase must be one of {', '.join(PHASES)}")
+
+        bounds = _default_bounds() if bounds is None else tuple(bounds)
+        if not bounds or any(low >= high for low, high in zip(bounds, bounds[1:])):
+            raise ValueError("Bounds must be a non-empty increasing sequence")
+
+        self._phase = phase
+        self._bounds = bounds
+        self._include_cache_hits = include_cache_hits
+        self._lock = threading.Lock()
+        self._counts: Dict[str, List[int]] = {}
+
+    @property
+    def bounds(self) -> Tuple[float, ...]:
+        """The upper bounds of the buckets in seconds."""
+        return self._bounds
+
+    def __call__(self, event: RequestEvent):
+        if event.cache_hit and not self._include_cache_hits:
+            return
+
+        seconds = event.phases.get(self._phase)
+        if seconds is None:
+            return
+
+        bucket = bisect.bisect_left(self._bounds, seconds)
+
+        with self._lock:
+            counts = self._counts.get(event.endpoint)
+            if counts is None:
+                counts = self._counts[event.endpoint] = [0] * (len(self._bounds) + 1)
+            counts[bucket] += 1
+
+    def endpoints(self) -> List[str]:
+        """The endpoints with recorded requests."""
+        with self._lock:
+            return sorted(self._counts)
+
+    def counts(self, endpoint: Optional[str] = None) -> List[int]:
+        """
+        The number of requests in each bucket, the last one being unbounded.
+
+        Args:
+            endpoint (Optional[str]): Only count requests to this endpoint.
+        """
+        totals = [0] * (len(self._bounds) + 1)
+
+        with self._lock:
+            if endpoint is None:
+                recorded = list(self._counts.values())
+            else:
+                recorded = [self._counts.get(endpoint, ())]
+
+            for counts in recorded:
+                for bucket, count in enumerate(counts):
+                    totals[bucket] += count
+
+        return totals
+
+    def count(self, endpoint: Optional[str] = None) -> int:
+        """The number of recorded requests, for one endpoint or all of them."""
+        return sum(self.counts(endpoint))
+
+    def percentile(self, q: float, endpoint: Optional[str] = None) -> Optional[float]:
+        """
+        Upper bound, in seconds, of the bucket holding the q-th percentile latency.
+
+        Args:
+            q (float): The percentile, between 0 and 100.
+            endpoint (Optional[str]): Only consider requests to this endpoint.
+
+        Returns:
+            Optional[float]: The latency, infinite if it falls in the unbounded bucket,
+            or None if no request was recorded.
+
+        Raises:
+            ValueError: If q is not between 0 and 100.
+        """
+        if not 0 <= q <= 100:
+            raise ValueError("Percentile must be between 0 and 100")
+
+        counts = self.counts(endpoint)
+        total = sum(counts)
+        if not total:
+            return None
+
+        rank = max(1, math.ceil(total * q / 100))
+        seen = 0
+        for bucket, count in enumerate(counts):
+            seen += count
+            if seen >= rank:
+                break
+
+        return self._bounds[bucket] if bucket < len(self._bounds) else math.inf
+
+    def reset(self):
+        """Forget every recorded request."""
+        with self._lock:
+            self._counts.clear()
@@ -0,0 +1,55 @@
+from typing import Any, Optional, Union
+
+import json
+
+import re
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the extra
+    orjson = None
+
+
+def loads(content: Union[bytes, str]) -> Any:
+    """Decode a JSON document with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def raw_body(response: Any) -> Optional[bytes]:
+    """The raw body of a response, or None if it is not available as bytes."""
+    content = getattr(response, "content", None)
+    return content if isinstance(content, bytes) else None
+
+
+def decode_response(response: Any) -> Any:
+    """Decode the JSON body of a requests or httpx response in a single pass."""
+    content = raw_body(response)
+    if content is None:
+        # Without the raw bytes, fall back to the response's own decoder
+        return response.json()
+    return loads(content)
+
+
+_INT_FIELD_PATTERNS = {}
+
+
+def peek_int(response: Any, field: str) -> Optional[int]:
+    """
+    Read a top-level integer field of a JSON response, without decoding the whole body
+    when its raw bytes are available.
+    """
+    content = raw_body(response)
+    if content is None:
+        value = response.json().get(field)
+        return value if isinstance(value, int) else None
+
+    pattern = _INT_FIELD_PATTERNS.get(field)
+    if pattern is None:
+        pattern = _INT_FIELD_PATTERNS[field] = re.compile(
+            rb'"' + re.escape(field.encode()) + rb'"\s*:\s*(-?\d+)\s*[,}]'
+        )
+
+    match = pattern.search(content)
+    return int(match.group(1)) if match else None
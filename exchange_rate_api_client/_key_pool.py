@@ -0,0 +1,374 @@
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+)
+
+from .commons import (
+    ExclusiveExchangeRates,
+    PairConversion,
+    EnrichedData,
+    HistoricalData,
+    HistoricalRange,
+    APIQuotaStatus,
+)
+
+from .exceptions import QuotaReached, InactiveAccount, KeyPoolExhausted
+
+from ._base import historical_range_dates, fetch_historical_days, historical_range
+
+from ._client import ExchangeRateApiV6Client
+
+from ._rate_limit import QuotaGovernor
+
+from ._session import create_session
+
+if TYPE_CHECKING:
+    from ._cross_rates import CrossRateMatrix
+
+    from ._batch import BatchConversion, CodeColumn
+
+import requests
+
+import calendar
+
+import threading
+
+import time
+
+from datetime import date, datetime, timezone
+
+
+def next_refresh(now: float, refresh_day_of_month: int) -> float:
+    """
+    Unix time of the next quota refresh: midnight UTC of the next `refresh_day_of_month`,
+    or of the last day of months that are shorter.
+    """
+    today = datetime.fromtimestamp(now, timezone.utc)
+    year, month = today.year, today.month
+
+    while True:
+        day = min(refresh_day_of_month, calendar.monthrange(year, month)[1])
+        refresh = datetime(year, month, day, tzinfo=timezone.utc).timestamp()
+        if refresh > now:
+            return refresh
+
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+
+class KeyStatus(NamedTuple):
+    """The state of one API key of a `MultiKeyExchangeRateApiV6Client`."""
+
+    active: bool
+    # Requests left according to the local count, or None before the first request
+    requests_remaining: Optional[int]
+    # Unix time at which an evicted key is put back in rotation
+    readmit_at: Optional[float]
+
+
+class _Key:
+    __slots__ = ("client", "governor", "readmit_at")
+
+    def __init__(self, client: ExchangeRateApiV6Client, governor: QuotaGovernor):
+        self.client = client
+        self.governor = governor
+        self.readmit_at: Optional[float] = None
+
+
+class MultiKeyExchangeRateApiV6Client:
+    """
+    Client that spreads requests across several API keys, to scale throughput with the
+    number of quotas.
+
+    Keys are used in turn. Each one counts its requests against its quota, seeded from
+    `fetch_quota_info` on first use. A key that reaches its quota, or whose account is
+    inactive, is taken out of rotation and the call is retried with the next key. It
+    is put back after the `refresh_day_of_month` of its quota.
+
+    Example:
+        ```python
+        with MultiKeyExchangeRateApiV6Client(
+            ["key-a", "key-b", "key-c"], codes_snapshot=BUNDLED_CURRENCY_CODES
+        ) as client:
+            client.fetch_exchange_rates("USD")
+            print(client.key_statuses())
+        ```
+    """
+
+    def __init__(
+        self,
+        api_keys: Sequence[str],
+        session: Optional[requests.Session] = None,
+        pool_maxsize: int = 10,
+        readmit_interval: float = 86400,
+        clock: Callable[[], float] = time.time,
+        **client_options: Any,
+    ):
+        """
+        Args:
+            api_keys (Sequence[str]): The Exchange Rate API keys.
+            session (Optional[requests.Session]): A session to share with other clients.
+                When given, `pool_maxsize` is ignored and the session is not closed by
+                this client.
+            pool_maxsize (int): Maximum number of connections kept alive, shared by all
+                the keys.
+            readmit_interval (float): Seconds before an evicted key is tried again when
+                its quota status, and so its refresh day, is unknown.
+            clock (Callable[[], float]): Returns the current unix time. Meant for tests.
+            **client_options: Options of `ExchangeRateApiV6Client` applied to every key,
+                such as `timeout`, `codes_snapshot` or a shared `rates_cache`.
+
+        Raises:
+            ValueError: If one of the given arguments is invalid
+        """
+        api_keys = list(api_keys)
+        if not api_keys or not all(isinstance(key, str) for key in api_keys):
+            raise ValueError("Api keys must be a non-empty sequence of str")
+
+        if len(set(api_keys)) != len(api_keys):
+            raise ValueError("Api keys must be unique")
+
+        if "quota_governor" in client_options:
+            raise ValueError("Every key has its own quota governor")
+
+        self._owns_session = session is None
+        if session is None:
+            session = create_session(pool_maxsize=pool_maxsize)
+        self._session = session
+        self._readmit_interval = readmit_interval
+        self._clock = clock
+        self._cross_rate_anchor = client_options.get("cross_rate_anchor")
+        self._lock = threading.Lock()
+        self._next = 0
+
+        self._keys: Dict[str, _Key] = {}
+        for api_key in api_keys:
+            governor = QuotaGovernor()
+            client = ExchangeRateApiV6Client(
+                api_key, session=session, quota_governor=governor, **client_options
+            )
+            self._keys[api_key] = _Key(client, governor)
+
+        self._order = api_keys
+
+    @property
+    def session(self) -> requests.Session:
+        """The pooled session shared by the clients of every key."""
+        return self._session
+
+    def key_statuses(self) -> Dict[str, KeyStatus]:
+        """The state of every key: in rotation or not, and its remaining requests."""
+        with self._lock:
+            self._readmit_due_keys()
+            return {
+                api_key: KeyStatus(
+                    active=key.readmit_at is None,
+                    requests_remaining=key.governor.remaining,
+                    readmit_at=key.readmit_at,
+                )
+                for api_key, key in self._keys.items()
+            }
+
+    def close(self):
+        """
+        Release the pooled connections if the session is owned by this client.
+        """
+        if self._owns_session:
+            self._session.close()
+
+    def __enter__(self) -> "MultiKeyExchangeRateApiV6Client":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def fetch_exchange_rates(
+        self, base_code: str, force_refresh: bool = False
+    ) -> ExclusiveExchangeRates:
+        """
+        Fetch the latest exchange rates for a given base currency with the next key.
+        See `ExchangeRateApiV6Client.fetch_exchange_rates`.
+
+        Raises:
+            KeyPoolExhausted: If every key is out of rotation.
+        """
+        return self._call("fetch_exchange_rates", base_code, force_refresh)
+
+    def pair_conversion(
+        self,
+        base_code: str,
+        target_code: str,
+        amount: Optional[float] = None,
+    ) -> PairConversion:
+        """
+        Convert an amount from one currency to another with the next key.
+        See `ExchangeRateApiV6Client.pair_conversion`.
+
+        Raises:
+            KeyPoolExhausted: If every key is out of rotation.
+        """
+        return self._call("pair_conversion", base_code, target_code, amount)
+
+    def fetch_enriched_data(self, base_code: str, target_code: str) -> EnrichedData:
+        """
+        Fetch enriched exchange rate data for a pair of currencies with the next key.
+        See `ExchangeRateApiV6Client.fetch_enriched_data`.
+
+        Raises:
+            KeyPoolExhausted: If every key is out of rotation.
+        """
+        return self._call("fetch_enriched_data", base_code, target_code)
+
+    def fetch_historical_data(
+        self, base_code: str, date_obj: date, amount: float
+    ) -> HistoricalData:
+        """
+        Fetch historical exchange rates for a specific date with the next key.
+        See `ExchangeRateApiV6Client.fetch_historical_data`.
+
+        Raises:
+            KeyPoolExhausted: If every key is out of rotation.
+        """
+        return self._call("fetch_historical_data", base_code, date_obj, amount)
+
+    def fetch_historical_range(
+        self,
+        base_code: str,
+        start_date: date,
+        end_date: date,
+        amount: float = 1,
+        max_in_flight: int = 8,
+    ) -> HistoricalRange:
+        """
+        Fetch historical exchange rates for every day of a date range, concurrently.
+        Each day is requested with the next key, so a long range is spread across the
+        quotas. See `ExchangeRateApiV6Client.fetch_historical_range`.
+
+        Raises:
+            KeyPoolExhausted: If every key is out of rotation.
+        """
+        dates = historical_range_dates(
+            base_code, start_date, end_date, amount, max_in_flight
+        )
+
+        def fetch(date_obj: date) -> HistoricalData:
+            return self._call("fetch_historical_data", base_code, date_obj, amount)
+
+        # The first day is fetched alone, so that an unsupported code or a key problem
+        # is raised before the other days are requested
+        results = fetch_historical_days(fetch, dates[:1], 1)
+        if len(dates) > 1:
+            results.update(fetch_historical_days(fetch, dates[1:], max_in_flight))
+
+        return historical_range(dates, results)
+
+    def fetch_cross_rates(
+        self, anchor_code: Optional[str] = None
+    ) -> "CrossRateMatrix":
+        """
+        Derive the cross rates between every supported currency with the next key.
+        See `ExchangeRateApiV6Client.fetch_cross_rates`.
+
+        Raises:
+            KeyPoolExhausted: If every key is out of rotation.
+        """
+        return self._call("fetch_cross_rates", anchor_code)
+
+    def convert_many(
+        self,
+        amounts: Sequence[float],
+        bases: "CodeColumn",
+        targets: "CodeColumn",
+        chunk_size: int = 1_000_000,
+    ) -> "BatchConversion":
+        """
+        Convert many amounts at once with the latest exchange rates. The table of each
+        base code is fetched with the next key. See `ExchangeRateApiV6Client.convert_many`.
+
+        Raises:
+            KeyPoolExhausted: If every key is out of rotation.
+        """
+        if self._cross_rate_anchor:
+            # Only the anchor table is needed, so one key does
+            return self._call("convert_many", amounts, bases, targets, chunk_size)
+
+        from ._batch import convert_with_tables
+
+        return convert_with_tables(
+            amounts, bases, targets, self.fetch_exchange_rates, chunk_size
+        )
+
+    def fetch_quota_info(self) -> Dict[str, APIQuotaStatus]:
+        """
+        Fetch the quota status of every key in rotation, and reseed their local count.
+
+        Returns:
+            Dict[str, APIQuotaStatus]: The quota status of each key in rotation.
+        """
+        statuses = {}
+        for api_key in self._active_keys():
+            key = self._keys[api_key]
+            try:
+                status = key.client.fetch_quota_info()
+            except (QuotaReached, InactiveAccount):
+                self._evict(api_key)
+                continue
+            key.governor.seed(status)
+            statuses[api_key] = status
+        return statuses
+
+    def _call(self, method: str, *args: Any) -> Any:
+        tried = set()
+
+        while True:
+            api_key = self._take_key(tried)
+            try:
+                return getattr(self._keys[api_key].client, method)(*args)
+            except (QuotaReached, InactiveAccount):
+                self._evict(api_key)
+                tried.add(api_key)
+
+    def _take_key(self, tried: set) -> str:
+        with self._lock:
+            self._readmit_due_keys()
+
+            for _ in range(len(self._order)):
+                api_key = self._order[self._next % len(self._order)]
+                self._next += 1
+                if api_key not in tried and self._keys[api_key].readmit_at is None:
+                    return api_key
+
+        raise KeyPoolExhausted("Every API key reached its quota or is inactive")
+
+    def _active_keys(self) -> List[str]:
+        with self._lock:
+            self._readmit_due_keys()
+            return [
+                api_key
+                for api_key in self._order
+                if self._keys[api_key].readmit_at is None
+            ]
+
+    def _evict(self, api_key: str):
+        key = self._keys[api_key]
+        status = key.governor.status
+        now = self._clock()
+
+        with self._lock:
+            if status is None:
+                key.readmit_at = now + self._readmit_interval
+            else:
+                key.readmit_at = next_refresh(now, status.refresh_day_of_month)
+
+    def _readmit_due_keys(self):
+        now = self._clock()
+        for key in self._keys.values():
+            if key.readmit_at is not None and key.readmit_at <= now:
+                key.readmit_at = None
+                # The quota was refreshed, so it is counted again from the API
+                key.governor.reset()
@@ -1,24 +1,204 @@
+from typing import Optional, Tuple, Union
+
 import requests
 
-from .exceptions import UnsupportedCode
+import threading
+
+from .exceptions import (
+    UnsupportedCode,
+    RequestTimeout,
+    ServerError,
+)
 
 from .commons import ExchangeRates
 
+from ._base import construct_trusted
+
+from ._cache import LatestRatesCache
+
+from ._json import decode_response
+
+from ._session import create_session, RequestsConnectionFailed
+
+
+_OPEN_EXCHANGE_RATE_API_URL = "https://open.er-api.com/v6"
+
+_DEFAULT_TIMEOUT = 10
+
+
+Timeout = Union[float, Tuple[float, float]]
+
+
+class OpenExchangeRateClient:
+    def __init__(
+        self,
+        session: Optional[requests.Session] = None,
+        timeout: Timeout = _DEFAULT_TIMEOUT,
+        pool_maxsize: int = 10,
+        rates_cache: Optional[LatestRatesCache] = None,
+        cache: bool = True,
+    ):
+        """
+        Create a client of the open access Exchange Rate API, which needs no API key.
+
+        Latest tables are cached per base code until their `time_next_update_unix`, as
+        the open access API only updates them once a day and rate limits clients that
+        request them more often.
+
+        Args:
+            session (Optional[requests.Session]): A session to share with other clients.
+                When given, `pool_maxsize` is ignored and the session is not closed by
+                this client.
+            timeout (Union[float, Tuple[float, float]]): Seconds to wait for the API before
+                giving up, or a (connect, read) tuple.
+            pool_maxsize (int): Maximum number of connections kept alive.
+            rates_cache (Optional[LatestRatesCache]): Cache for the latest tables. One is
+                created if none is given.
+            cache (bool): Whether to cache the latest tables at all.
+
+        Raises:
+            ValueError: If one of the given arguments is invalid
+
+        Example:
+            ```python
+            with OpenExchangeRateClient(timeout=(3, 10)) as client:
+                client.fetch_exchange_rates("USD")  # Network
+                client.fetch_exchange_rates("USD")  # Memory until the next update
+            ```
+        """
+        self._timeout = timeout
+        self._owns_session = session is None
+        if session is None:
+            # Every request goes to the same host
+            session = create_session(pool_connections=1, pool_maxsize=pool_maxsize)
+        self._session = session
+        if cache and rates_cache is None:
+            rates_cache = LatestRatesCache()
+        self._rates_cache = rates_cache if cache else None
+
+    @property
+    def session(self) -> requests.Session:
+        """The pooled session used by this client."""
+        return self._session
+
+    @property
+    def rates_cache(self) -> Optional[LatestRatesCache]:
+        """The cache of latest tables, if any."""
+        return self._rates_cache
+
+    def close(self):
+        """
+        Release the pooled connections if the session is owned by this client.
+        """
+        if self._owns_session:
+            self._session.close()
+
+    def __enter__(self) -> "OpenExchangeRateClient":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def fetch_exchange_rates(
+        self, base_code: str, force_refresh: bool = False
+    ) -> ExchangeRates:
+        """
+        Fetch the latest exchange rates for a given base currency.
+
+        Args:
+            base_code (str): The ISO 4217 currency code for the base currency.
+            force_refresh (bool): Skip the rates cache and fetch a new table.
+
+        Returns:
+            ExchangeRates: The latest rates of the base currency, and the update and end
+            of life timestamps of the open access API.
+
+        Raises:
+            ValueError: If one of the given arguments is invalid
+            UnsupportedCode: If the provided base_code is not a supported currency code.
+            RequestTimeout: If the API did not answer within the timeout.
+            ConnectionFailed: If the API could not be reached.
+            ServerError: If the API failed with a 5xx status.
+
+        Example:
+            ```python
+            client = OpenExchangeRateClient()
+            exchange_rates = client.fetch_exchange_rates("USD")
+            print(exchange_rates.rates["EUR"])
+            ```
+        """
+        if base_code is None or not isinstance(base_code, str):
+            raise ValueError("The base code must be a str")
+
+        if self._rates_cache is not None and not force_refresh:
+            cached = self._rates_cache.get(base_code)
+            if cached is not None:
+                return cached
+
+        url = f"{_OPEN_EXCHANGE_RATE_API_URL}/latest/{base_code}"
+
+        try:
+            response = self._session.get(url, timeout=self._timeout)
+        except requests.exceptions.Timeout:
+            raise RequestTimeout("The request to the open access API timed out")
+        except requests.exceptions.ConnectionError as e:
+            raise RequestsConnectionFailed(
+                "Could not connect to the open access API"
+            ) from e
+
+        if response.status_code >= 500:
+            raise ServerError(
+                f"The open access API failed with status {response.status_code}"
+            )
+
+        data = decode_response(response)
+
+        if "error-type" in data:
+            if data["error-type"] == "unsupported-code":
+                raise UnsupportedCode(f"The base code {base_code} is not supported")
+
+        obj = construct_trusted(ExchangeRates, data)
+
+        if self._rates_cache is not None:
+            self._rates_cache.put(obj)
+
+        return obj
+
+
+_default_client: Optional[OpenExchangeRateClient] = None
+
+_default_client_lock = threading.Lock()
+
+
+def _get_default_client() -> OpenExchangeRateClient:
+    global _default_client
+
+    if _default_client is None:
+        with _default_client_lock:
+            if _default_client is None:
+                _default_client = OpenExchangeRateClient()
 
-def fetch_exchange_rates(base_code: str):
-    if base_code is None or not isinstance(base_code, str):
-        raise ValueError("The base code must be a str")
+    return _default_client
 
-    url = f"https://open.er-api.com/v6/latest/{base_code}"
 
-    response = requests.get(url)
+def fetch_exchange_rates(base_code: str) -> ExchangeRates:
+    """
+    Fetch the latest exchange rates for a given base currency from the open access API.
 
-    data = response.json()
+    Uses a shared `OpenExchangeRateClient`, so connections are reused and tables are
+    cached until their next update.
 
-    if "error-type" in data:
-        if data["error-type"] == "unsupported-code":
-            raise UnsupportedCode(f"The base code {base_code} is not supported")
+    Args:
+        base_code (str): The ISO 4217 currency code for the base currency.
 
-    obj = ExchangeRates(**data)
+    Returns:
+        ExchangeRates: The latest rates of the base currency.
 
-    return obj
+    Raises:
+        ValueError: If one of the given arguments is invalid
+        UnsupportedCode: If the provided base_code is not a supported currency code.
+        RequestTimeout: If the API did not answer within the timeout.
+        ConnectionFailed: If the API could not be reached.
+        ServerError: If the API failed with a 5xx status.
+    """
+    return _get_default_client().fetch_exchange_rates(base_code)
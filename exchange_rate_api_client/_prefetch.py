@@ -0,0 +1,192 @@
+from typing import Callable, Dict, Iterable, Optional
+
+from .commons import ExclusiveExchangeRates
+
+import logging
+
+import threading
+
+import time
+
+
+logger = logging.getLogger(__name__)
+
+
+class RatesPrefetcher:
+    """
+    Background thread that refreshes the latest tables of hot base codes just after
+    their upstream update, so that foreground calls keep hitting warm memory.
+
+    Hot base codes are the configured ones plus, when `observe` is enabled, the base
+    codes fetched by the client. Each one is refreshed `delay` seconds after the
+    ``time_next_update_unix`` of its current table. A failed refresh, or one that
+    returns a table upstream has not updated yet, is retried after `retry_interval`.
+    An observed base code that was not fetched again since its previous refresh is
+    dropped instead of being refreshed, so quota is only spent on tables still read.
+
+    Prefetchers are usually created with `ExchangeRateApiV6Client.start_prefetching`.
+    """
+
+    def __init__(
+        self,
+        refresh: Callable[[str], ExclusiveExchangeRates],
+        base_codes: Iterable[str] = (),
+        observe: bool = True,
+        delay: float = 5,
+        retry_interval: float = 60,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Args:
+            refresh (Callable[[str], ExclusiveExchangeRates]): Fetches a new table for a
+                base code and stores it in the rates cache.
+            base_codes (Iterable[str]): Base codes refreshed from the start.
+            observe (bool): Whether base codes passed to `observe` become hot, for as long
+                as they keep being observed between two refreshes.
+            delay (float): Seconds to wait after the upstream update before refreshing.
+            retry_interval (float): Seconds to wait before retrying a refresh.
+            clock (Callable[[], float]): Returns the current unix time. Meant for tests.
+
+        Raises:
+            ValueError: If one of the given arguments is invalid
+        """
+        if delay < 0:
+            raise ValueError("Delay must be greater than or equal to 0")
+
+        if retry_interval <= 0:
+            raise ValueError("Retry interval must be greater than 0")
+
+        self._refresh = refresh
+        self._observe = observe
+        self._delay = delay
+        self._retry_interval = retry_interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._refreshes = 0
+        self._failures = 0
+        # Configured base codes are refreshed right away to warm the cache, and always
+        now = clock()
+        self._due: Dict[str, float] = {code: now for code in base_codes}
+        self._pinned = frozenset(self._due)
+        # Unix time of the last foreground access and of the last refresh of every
+        # observed base code
+        self._last_access: Dict[str, float] = {}
+        self._last_refresh: Dict[str, float] = {}
+
+    @property
+    def refreshes(self) -> int:
+        """Number of successful refreshes."""
+        return self._refreshes
+
+    @property
+    def failures(self) -> int:
+        """Number of failed refreshes."""
+        return self._failures
+
+    @property
+    def schedule(self) -> Dict[str, float]:
+        """Unix time of the next refresh of every hot base code."""
+        with self._lock:
+            return dict(self._due)
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> "RatesPrefetcher":
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="rates-prefetcher", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None):
+        """Stop the background thread and wait for it to exit."""
+        self._stopped.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def observe(self, snapshot: ExclusiveExchangeRates):
+        """
+        Record a foreground access to the table of a base code, and make that base code
+        hot unless it already is.
+        """
+        # Refreshes go through the client too, but are not accesses
+        if not self._observe or threading.current_thread() is self._thread:
+            return
+
+        code = snapshot.base_code
+        self._last_access[code] = self._clock()
+        if code in self._due:
+            return
+
+        with self._lock:
+            if code in self._due:
+                return
+            self._due[code] = self._next_refresh(snapshot)
+
+        self._wakeup.set()
+
+    def _next_refresh(self, snapshot: ExclusiveExchangeRates) -> float:
+        now = self._clock()
+        due = snapshot.time_next_update_unix + self._delay
+        if due <= now:
+            # Upstream has not published the announced update yet
+            return now + self._retry_interval
+        return due
+
+    def _run(self):
+        while not self._stopped.is_set():
+            with self._lock:
+                now = self._clock()
+                due = [code for code, at in self._due.items() if at <= now]
+                next_due = min(self._due.values(), default=None)
+
+            if not due:
+                timeout = None if next_due is None else next_due - now
+                self._wakeup.wait(timeout)
+                self._wakeup.clear()
+                continue
+
+            for code in due:
+                if self._stopped.is_set():
+                    return
+                self._refresh_base(code)
+
+    def _refresh_base(self, code: str):
+        with self._lock:
+            if code not in self._pinned:
+                last_refresh = self._last_refresh.get(code)
+                if last_refresh is not None and (
+                    self._last_access.get(code, 0.0) < last_refresh
+                ):
+                    # Not read since its previous refresh, so no longer hot
+                    del self._due[code]
+                    del self._last_refresh[code]
+                    self._last_access.pop(code, None)
+                    return
+
+        started = self._clock()
+        try:
+            snapshot = self._refresh(code)
+        except Exception:
+            self._failures += 1
+            logger.warning(
+                "Prefetching the latest rates of %s failed, retrying later",
+                code,
+                exc_info=True,
+            )
+            due = self._clock() + self._retry_interval
+        else:
+            self._refreshes += 1
+            due = self._next_refresh(snapshot)
+            if code not in self._pinned:
+                self._last_refresh[code] = started
+
+        with self._lock:
+            self._due[code] = due
@@ -0,0 +1,234 @@
+from typing import Callable, Optional
+
+from .commons import APIQuotaStatus
+
+from .exceptions import QuotaBudgetExhausted
+
+import threading
+
+import time
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket that paces requests to `rate` per second, allowing bursts
+    of up to `burst` requests.
+
+    Example:
+        ```python
+        limiter = TokenBucket(rate=5, burst=10)
+        client = ExchangeRateApiV6Client("your_api_key", rate_limiter=limiter)
+        ```
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Args:
+            rate (float): Tokens added per second.
+            burst (int): Maximum number of tokens held, and the initial number of tokens.
+            clock (Callable[[], float]): Monotonic clock in seconds. Meant for tests.
+            sleep (Callable[[float], None]): Sleeps for some seconds. Meant for tests.
+
+        Raises:
+            ValueError: If one of the given arguments is invalid
+        """
+        if not isinstance(rate, (int, float)) or rate <= 0:
+            raise ValueError("Rate must be a number greater than 0")
+
+        if not isinstance(burst, int) or burst < 1:
+            raise ValueError("Burst must be an integer greater than 0")
+
+        self._rate = rate
+        self._burst = burst
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._updated = clock()
+
+    def acquire(self, blocking: bool = True, timeout: Optional[float] = None) -> bool:
+        """
+        Take one token, waiting for it if needed.
+
+        Args:
+            blocking (bool): Wait for a token instead of returning False right away.
+            timeout (Optional[float]): Maximum seconds to wait. None waits as long as needed.
+
+        Returns:
+            bool: Whether a token was taken.
+        """
+        deadline = None if timeout is None else self._clock() + timeout
+
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._tokens = min(
+                    self._burst, self._tokens + (now - self._updated) * self._rate
+                )
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+
+                wait = (1 - self._tokens) / self._rate
+
+            if not blocking:
+                return False
+
+            if deadline is not None:
+                remaining = deadline - self._clock()
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+
+            self._sleep(wait)
+
+
+class QuotaGovernor:
+    """
+    Local account of the API quota that refuses requests before it runs out.
+
+    The governor is seeded from `fetch_quota_info()` and counts every request sent
+    after that. Low priority requests are refused once only `reserve` requests are
+    left, so that critical traffic keeps working until the quota is really exhausted.
+    Share one governor between all clients of an API key.
+
+    Example:
+        ```python
+        governor = QuotaGovernor(reserve=500)
+        critical = ExchangeRateApiV6Client("your_api_key", quota_governor=governor)
+        batch = ExchangeRateApiV6Client(
+            "your_api_key", quota_governor=governor, low_priority=True
+        )
+        ```
+    """
+
+    def __init__(
+        self,
+        reserve: int = 0,
+        reseed_interval: Optional[float] = 3600,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            reserve (int): Requests kept for calls that are not low priority.
+            reseed_interval (Optional[float]): Seconds after which the governor asks to be
+                seeded again to correct drift. None only seeds once.
+            clock (Callable[[], float]): Monotonic clock in seconds. Meant for tests.
+
+        Raises:
+            ValueError: If one of the given arguments is invalid
+        """
+        if not isinstance(reserve, int) or reserve < 0:
+            raise ValueError("Reserve must be an integer greater than or equal to 0")
+
+        self._reserve = reserve
+        self._reseed_interval = reseed_interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._status: Optional[APIQuotaStatus] = None
+        self._remaining = 0
+        self._seeded_at: Optional[float] = None
+        self._seeding: Optional[threading.Event] = None
+        self._sent = 0
+
+    @property
+    def remaining(self) -> Optional[int]:
+        """Requests left according to the local count, or None before seeding."""
+        return None if self._status is None else self._remaining
+
+    @property
+    def status(self) -> Optional[APIQuotaStatus]:
+        """The last quota status the governor was seeded with."""
+        return self._status
+
+    def needs_seed(self) -> bool:
+        with self._lock:
+            return self._needs_seed()
+
+    def seed(self, status: APIQuotaStatus):
+        """Reset the local count from the API quota status."""
+        with self._lock:
+            self._seed(status)
+
+    def ensure_seeded(self, fetch_status: Callable[[], APIQuotaStatus]):
+        """
+        Seed the governor from `fetch_status()` if it needs it, one call at a time.
+
+        Other threads wait for the first seed. Once seeded, they keep counting against
+        the previous status while a reseed is in flight, and requests they send
+        meanwhile are deducted from the new one.
+
+        Args:
+            fetch_status (Callable[[], APIQuotaStatus]): Fetches the API quota status.
+        """
+        while True:
+            with self._lock:
+                if not self._needs_seed():
+                    return
+                seeding = self._seeding
+                if seeding is None:
+                    self._seeding = seeding = threading.Event()
+                    sent = self._sent
+                    break
+                if self._seeded_at is not None:
+                    return
+            # Loop, since the seed may have failed and need to be claimed again
+            seeding.wait()
+
+        try:
+            status = fetch_status()
+            with self._lock:
+                self._seed(status)
+                self._remaining = max(self._remaining - (self._sent - sent), 0)
+        finally:
+            with self._lock:
+                self._seeding = None
+            seeding.set()
+
+    def _needs_seed(self) -> bool:
+        if self._seeded_at is None:
+            return True
+        if self._reseed_interval is None:
+            return False
+        return self._clock() - self._seeded_at > self._reseed_interval
+
+    def _seed(self, status: APIQuotaStatus):
+        self._status = status
+        self._remaining = status.requests_remaining
+        self._seeded_at = self._clock()
+
+    def acquire(self, low_priority: bool = False):
+        """
+        Count one request against the quota.
+
+        Raises:
+            QuotaBudgetExhausted: If the request must not be sent.
+        """
+        with self._lock:
+            floor = self._reserve if low_priority else 0
+            if self._remaining <= floor:
+                raise QuotaBudgetExhausted(
+                    "The local quota budget for this request priority is exhausted"
+                )
+            self._remaining -= 1
+            self._sent += 1
+
+    def exhaust(self):
+        """Record that the API reported the quota as reached."""
+        with self._lock:
+            self._remaining = 0
+
+    def reset(self):
+        """Forget the seeded status, so that the governor is seeded again before use."""
+        with self._lock:
+            self._status = None
+            self._remaining = 0
+            self._seeded_at = None
@@ -0,0 +1,239 @@
+from typing import Callable, Dict, Optional, TypeVar
+
+from .exceptions import TransientError, CircuitOpen
+
+import random
+
+import threading
+
+import time
+
+
+T = TypeVar("T")
+
+CircuitStateChange = Callable[[str, str, str], None]
+
+
+class RetryPolicy:
+    """
+    Retry transient failures (timeouts, connection errors and 5xx responses) with
+    exponential backoff and full jitter. Typed API errors such as `InvalidKey` or
+    `QuotaReached` are never retried.
+
+    Example:
+        ```python
+        policy = RetryPolicy(max_attempts=4, backoff=0.2, max_backoff=2)
+        client = ExchangeRateApiV6Client("your_api_key", retry_policy=policy)
+        ```
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff: float = 0.1,
+        max_backoff: float = 5.0,
+        jitter: bool = True,
+        sleep: Callable[[float], None] = time.sleep,
+        random: Callable[[], float] = random.random,
+    ):
+        """
+        Args:
+            max_attempts (int): Maximum number of attempts, including the first one.
+            backoff (float): Seconds to wait before the first retry, doubled after each retry.
+            max_backoff (float): Maximum seconds to wait between two attempts.
+            jitter (bool): Wait a random time between 0 and the backoff instead of the
+                full backoff, so that clients retrying together spread out.
+            sleep (Callable[[float], None]): Sleeps for some seconds. Meant for tests.
+            random (Callable[[], float]): Returns a float in [0, 1). Meant for tests.
+
+        Raises:
+            ValueError: If one of the given arguments is invalid
+        """
+        if not isinstance(max_attempts, int) or max_attempts < 1:
+            raise ValueError("Max attempts must be an integer greater than 0")
+
+        if backoff < 0 or max_backoff < 0:
+            raise ValueError("Backoff must be greater than or equal to 0")
+
+        self._max_attempts = max_attempts
+        self._backoff = backoff
+        self._max_backoff = max_backoff
+        self._jitter = jitter
+        self._sleep = sleep
+        self._random = random
+
+    @property
+    def max_attempts(self) -> int:
+        return self._max_attempts
+
+    def should_retry(self, error: BaseException, attempt: int) -> bool:
+        """Whether a failed attempt, counted from 1, is retried."""
+        return isinstance(error, TransientError) and attempt < self._max_attempts
+
+    def delay(self, attempt: int) -> float:
+        """Seconds to wait after a failed attempt, counted from 1."""
+        delay = min(self._max_backoff, self._backoff * 2 ** (attempt - 1))
+        if self._jitter:
+            delay *= self._random()
+        return delay
+
+    def call(self, func: Callable[[], T]) -> T:
+        attempt = 1
+        while True:
+            try:
+                return func()
+            except Exception as e:
+                if not self.should_retry(e, attempt):
+                    raise
+            self._sleep(self.delay(attempt))
+            attempt += 1
+
+
+class _Circuit:
+    def __init__(self):
+        self.state = CircuitBreaker.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.trial_in_flight = False
+
+
+class CircuitBreaker:
+    """
+    Per-endpoint circuit breaker that fails fast while upstream is unhealthy.
+
+    After `failure_threshold` consecutive transient failures of an endpoint, its circuit
+    opens and calls raise `CircuitOpen` without a request. After `recovery_timeout`
+    seconds one trial request is let through: its success closes the circuit and its
+    failure opens it again. Typed API errors count as successes since upstream answered.
+
+    Example:
+        ```python
+        def on_state_change(endpoint, old_state, new_state):
+            logger.warning("%s circuit: %s -> %s", endpoint, old_state, new_state)
+
+        breaker = CircuitBreaker(failure_threshold=5, on_state_change=on_state_change)
+        client = ExchangeRateApiV6Client("your_api_key", circuit_breaker=breaker)
+        ```
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30,
+        on_state_change: Optional[CircuitStateChange] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            failure_threshold (int): Consecutive failures that open a circuit.
+            recovery_timeout (float): Seconds a circuit stays open before a trial request.
+            on_state_change (Optional[CircuitStateChange]): Called with the endpoint, the
+                old state and the new state whenever a circuit changes state.
+            clock (Callable[[], float]): Monotonic clock in seconds. Meant for tests.
+
+        Raises:
+            ValueError: If one of the given arguments is invalid
+        """
+        if not isinstance(failure_threshold, int) or failure_threshold < 1:
+            raise ValueError("Failure threshold must be an integer greater than 0")
+
+        self._failure_threshold = failure_threshold
+        self._recovery_timeout = recovery_timeout
+        self._on_state_change = on_state_change
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._circuits: Dict[str, _Circuit] = {}
+
+    def state(self, endpoint: str) -> str:
+        """The state of the circuit of an endpoint."""
+        circuit = self._circuits.get(endpoint)
+        return self.CLOSED if circuit is None else circuit.state
+
+    def before_request(self, endpoint: str):
+        """
+        Raises:
+            CircuitOpen: If the circuit of the endpoint does not let the request through.
+        """
+        with self._lock:
+            circuit = self._circuits.setdefault(endpoint, _Circuit())
+
+            if circuit.state == self.CLOSED:
+                return
+
+            if (
+                circuit.state == self.OPEN
+                and self._clock() - circuit.opened_at >= self._recovery_timeout
+            ):
+                old_state = self._transition(circuit, self.HALF_OPEN)
+            elif circuit.state == self.HALF_OPEN and not circuit.trial_in_flight:
+                old_state = None
+            else:
+                raise CircuitOpen(
+                    f"The circuit for the {endpoint} endpoint is open, "
+                    "the Exchange Rate API is failing"
+                )
+
+            circuit.trial_in_flight = True
+
+        if old_state is not None:
+            self._notify(endpoint, old_state, self.HALF_OPEN)
+
+    def record_success(self, endpoint: str):
+        with self._lock:
+            circuit = self._circuits.setdefault(endpoint, _Circuit())
+            circuit.failures = 0
+            circuit.trial_in_flight = False
+            if circuit.state == self.CLOSED:
+                return
+            old_state = self._transition(circuit, self.CLOSED)
+
+        self._notify(endpoint, old_state, self.CLOSED)
+
+    def record_failure(self, endpoint: str):
+        with self._lock:
+            circuit = self._circuits.setdefault(endpoint, _Circuit())
+            circuit.failures += 1
+            circuit.trial_in_flight = False
+            if circuit.state == self.OPEN or (
+                circuit.state == self.CLOSED
+                and circuit.failures < self._failure_threshold
+            ):
+                return
+            circuit.opened_at = self._clock()
+            old_state = self._transition(circuit, self.OPEN)
+
+        self._notify(endpoint, old_state, self.OPEN)
+
+    def record_outcome(self, endpoint: str, error: Optional[BaseException]):
+        """Record the outcome of a request let through by `before_request`."""
+        if isinstance(error, TransientError):
+            self.record_failure(endpoint)
+        elif error is None or isinstance(error, Exception):
+            self.record_success(endpoint)
+        else:
+            # Interrupted before an answer, such as a cancelled task
+            with self._lock:
+                self._circuits[endpoint].trial_in_flight = False
+
+    def call(self, endpoint: str, func: Callable[[], T]) -> T:
+        self.before_request(endpoint)
+        try:
+            result = func()
+        except BaseException as e:
+            self.record_outcome(endpoint, e)
+            raise
+        self.record_outcome(endpoint, None)
+        return result
+
+    def _transition(self, circuit: _Circuit, state: str) -> str:
+        old_state = circuit.state
+        circuit.state = state
+        return old_state
+
+    def _notify(self, endpoint: str, old_state: str, new_state: str):
+        if self._on_state_change is not None:
+            self._on_state_change(endpoint, old_state, new_state)
@@ -0,0 +1,88 @@
+from typing import Union
+
+import requests
+
+from requests.adapters import HTTPAdapter
+
+from urllib3.util.request import ACCEPT_ENCODING as URLLIB3_ACCEPT_ENCODING
+
+from urllib3.util.retry import Retry
+
+from ._compression import accept_encoding
+
+from .exceptions import ConnectionFailed
+
+
+# The encodings urllib3 can decode with the codecs installed, brotli and zstandard
+# being optional
+ACCEPT_ENCODING = accept_encoding(URLLIB3_ACCEPT_ENCODING.split(","))
+
+
+class RequestsConnectionFailed(ConnectionFailed, requests.exceptions.ConnectionError):
+    """
+    Raised by the requests-based clients, so that handlers written for the
+    `requests.exceptions.ConnectionError` they used to raise keep catching it.
+    """
+
+
+def create_session(
+    pool_connections: int = 10,
+    pool_maxsize: int = 10,
+    max_retries: Union[int, Retry] = 0,
+    pool_block: bool = False,
+    keep_alive: bool = True,
+) -> requests.Session:
+    """
+    Create a pooled HTTP session that can be shared between clients.
+
+    The session asks for compressed responses with every codec installed: gzip and
+    deflate, plus brotli and zstd with the `compression` extra. Bodies are decompressed
+    chunk by chunk as they are read from the connection.
+
+    Args:
+        pool_connections (int): Number of per-host connection pools to keep.
+        pool_maxsize (int): Maximum number of connections kept alive per host.
+        max_retries (Union[int, Retry]): Retry configuration for the transport adapter.
+            Either a number of retries or a ``urllib3.util.retry.Retry`` instance.
+        pool_block (bool): Whether to block when a pool has no free connections
+            instead of opening a throwaway one.
+        keep_alive (bool): Whether to reuse connections between requests. If False,
+            every request is sent with ``Connection: close``.
+
+    Returns:
+        requests.Session: A session with an adapter mounted for http and https.
+
+    Raises:
+        ValueError: If one of the given arguments is invalid
+
+    Example:
+        ```python
+        session = create_session(pool_maxsize=50)
+        client_a = ExchangeRateApiV6Client("key-a", session=session)
+        client_b = ExchangeRateApiV6Client("key-b", session=session)
+        ```
+    """
+    if not isinstance(pool_connections, int) or pool_connections < 1:
+        raise ValueError("Pool connections must be an integer greater than 0")
+
+    if not isinstance(pool_maxsize, int) or pool_maxsize < 1:
+        raise ValueError("Pool max size must be an integer greater than 0")
+
+    session = requests.Session()
+
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=max_retries,
+        pool_block=pool_block,
+    )
+
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+
+    if not keep_alive:
+        session.headers["Connection"] = "close"
+
+    return session
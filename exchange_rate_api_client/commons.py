@@ -1,4 +1,6 @@
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Union
+
+from datetime import date
 
 from pydantic import BaseModel, ConfigDict
 
@@ -62,10 +64,16 @@ class HistoricalData(BaseResponseModel):
     month: int
     day: int
     base_code: str
-    requested_amount: int
+    # Echoes the requested amount, which may be fractional
+    requested_amount: Union[int, float]
     conversion_amounts: Dict[str, float]
 
 
+class HistoricalRange(BaseResponseModel):
+    data: List[HistoricalData]
+    missing: List[date]
+
+
 class APIQuotaStatus(BaseResponseModel):
     plan_quota: int
     requests_remaining: int
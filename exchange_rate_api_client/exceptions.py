@@ -24,3 +24,35 @@ class NoDataAvailable(Exception):
 
 class MalformedRequest(Exception):
     pass
+
+
+class QuotaBudgetExhausted(QuotaReached):
+    pass
+
+
+class TransientError(Exception):
+    pass
+
+
+class RequestTimeout(TransientError):
+    pass
+
+
+class ConnectionFailed(TransientError):
+    pass
+
+
+class ServerError(TransientError):
+    pass
+
+
+class CircuitOpen(Exception):
+    pass
+
+
+class UnknownError(Exception):
+    pass
+
+
+class KeyPoolExhausted(QuotaReached):
+    pass
@@ -12,6 +12,12 @@ setup(
     url="https://github.com/dfm18/exchange-rate-api-client",
     packages=["exchange_rate_api_client"],
     install_requires=["requests>=2.32", "pydantic>=2.10"],
+    extras_require={
+        "async": ["httpx>=0.27"],
+        "numpy": ["numpy>=1.21"],
+        "orjson": ["orjson>=3.8"],
+        "compression": ["brotli>=1.0", "zstandard>=0.18"],
+    },
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
@@ -0,0 +1,77 @@
+import gzip
+
+import io
+
+import json
+
+from datetime import timedelta
+
+from unittest.mock import MagicMock
+
+import requests
+
+from urllib3 import HTTPResponse
+
+
+LATEST_DATA = {
+    "result": "success",
+    "time_last_update_unix": 1585267200,
+    "time_last_update_utc": "Fri, 27 Mar 2020 00:00:00 +0000",
+    "time_next_update_unix": 1585353700,
+    "time_next_update_utc": "Sat, 28 Mar 2020 00:00:00 +0000",
+    "base_code": "USD",
+    "conversion_rates": {"USD": 1, "EUR": 0.9013},
+}
+
+
+class FakeClock:
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def json_response(data, status_code=200):
+    """A mocked response whose `json()` returns `data`."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.json.return_value = data
+    return response
+
+
+def raw_response(data=None, status_code=200, headers=None, elapsed=0.0):
+    """A `requests.Response` with `data` as its JSON body, or an empty body."""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = b"" if data is None else json.dumps(data).encode()
+    response.headers.update(headers or {})
+    response.elapsed = timedelta(seconds=elapsed)
+    return response
+
+
+def wire_response(data, compress=False):
+    """
+    A `requests.Response` read from an urllib3 body, gzipped if `compress`, and the
+    number of body bytes sent over the wire.
+    """
+    body = json.dumps(data).encode()
+    headers = {"Content-Type": "application/json"}
+    if compress:
+        body = gzip.compress(body)
+        headers["Content-Encoding"] = "gzip"
+
+    response = requests.Response()
+    response.status_code = 200
+    response.headers.update(headers)
+    response.raw = HTTPResponse(
+        body=io.BytesIO(body),
+        headers=headers,
+        status=200,
+        preload_content=False,
+        decode_content=True,
+    )
+    return response, len(body)
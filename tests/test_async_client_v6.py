@@ -0,0 +1,189 @@
+import asyncio
+
+import unittest
+
+from datetime import date
+
+from unittest.mock import patch, AsyncMock
+
+from exchange_rate_api_client._async_client import AsyncExchangeRateApiV6Client
+
+from exchange_rate_api_client.commons import (
+    ExclusiveExchangeRates,
+    PairConversion,
+    HistoricalData,
+)
+
+from exchange_rate_api_client.exceptions import (
+    UnsupportedCode,
+    QuotaReached,
+    NoDataAvailable,
+)
+
+from tests.helpers import json_response
+
+
+SUPPORTED_CODES_RESPONSE = {
+    "supported_codes": [["USD", "United States Dollar"], ["EUR", "Euro"]]
+}
+
+
+class TestAsyncExchangeRateV6Client(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.client = AsyncExchangeRateApiV6Client("mock-api-key")
+
+    async def asyncTearDown(self):
+        await self.client.aclose()
+
+    @patch(
+        "exchange_rate_api_client._async_client.httpx.AsyncClient.get",
+        new_callable=AsyncMock,
+    )
+    async def test_fetch_exchange_rates(self, mock_get: AsyncMock):
+        payload = {
+            "time_last_update_unix": 1585267200,
+            "time_last_update_utc": "Fri, 27 Mar 2020 00:00:00 +0000",
+            "time_next_update_unix": 1585353700,
+            "time_next_update_utc": "Sat, 28 Mar 2020 00:00:00 +0000",
+            "base_code": "USD",
+            "conversion_rates": {"USD": 1, "EUR": 0.9013},
+        }
+
+        mock_get.side_effect = [
+            json_response(SUPPORTED_CODES_RESPONSE),
+            json_response(payload),
+        ]
+
+        result = await self.client.fetch_exchange_rates("USD")
+
+        self.assertEqual(result.model_dump(), ExclusiveExchangeRates(**payload).model_dump())
+        mock_get.assert_any_call(
+            "https://v6.exchangerate-api.com/v6/mock-api-key/latest/USD", timeout=10
+        )
+
+    @patch(
+        "exchange_rate_api_client._async_client.httpx.AsyncClient.get",
+        new_callable=AsyncMock,
+    )
+    async def test_pair_conversion(self, mock_get: AsyncMock):
+        payload = {
+            "base_code": "USD",
+            "target_code": "EUR",
+            "conversion_rate": 0.9013,
+            "conversion_result": 90.13,
+        }
+
+        mock_get.side_effect = [
+            json_response(SUPPORTED_CODES_RESPONSE),
+            json_response(payload),
+        ]
+
+        result = await self.client.pair_conversion("USD", "EUR", 100)
+
+        self.assertEqual(result.model_dump(), PairConversion(**payload).model_dump())
+
+    @patch(
+        "exchange_rate_api_client._async_client.httpx.AsyncClient.get",
+        new_callable=AsyncMock,
+    )
+    async def test_fetch_historical_data(self, mock_get: AsyncMock):
+        payload = {
+            "year": 2020,
+            "month": 3,
+            "day": 27,
+            "base_code": "USD",
+            "requested_amount": 10,
+            "conversion_amounts": {"EUR": 9.013},
+        }
+
+        mock_get.side_effect = [
+            json_response(SUPPORTED_CODES_RESPONSE),
+            json_response(payload),
+        ]
+
+        result = await self.client.fetch_historical_data("USD", date(2020, 3, 27), 10)
+
+        self.assertEqual(result.model_dump(), HistoricalData(**payload).model_dump())
+        mock_get.assert_any_call(
+            "https://v6.exchangerate-api.com/v6/mock-api-key/history/USD/2020/3/27/10",
+            timeout=10,
+        )
+
+    @patch(
+        "exchange_rate_api_client._async_client.httpx.AsyncClient.get",
+        new_callable=AsyncMock,
+    )
+    async def test_error_handler_chains_are_shared(self, mock_get: AsyncMock):
+        mock_get.side_effect = [
+            json_response(SUPPORTED_CODES_RESPONSE),
+            json_response({"error-type": "no-data-available"}, 404),
+            json_response({"error-type": "quota-reached"}, 403),
+        ]
+
+        with self.assertRaises(NoDataAvailable):
+            await self.client.fetch_historical_data("USD", date(1900, 1, 1), 1)
+
+        with self.assertRaises(QuotaReached):
+            await self.client.fetch_exchange_rates("USD")
+
+    @patch(
+        "exchange_rate_api_client._async_client.httpx.AsyncClient.get",
+        new_callable=AsyncMock,
+    )
+    async def test_unsupported_code_raises_exception(self, mock_get: AsyncMock):
+        mock_get.return_value = json_response(SUPPORTED_CODES_RESPONSE)
+
+        with self.assertRaises(UnsupportedCode):
+            await self.client.pair_conversion("USD", "JPY")
+
+    @patch(
+        "exchange_rate_api_client._async_client.httpx.AsyncClient.get",
+        new_callable=AsyncMock,
+    )
+    async def test_concurrent_calls_share_one_supported_codes_fetch(
+        self, mock_get: AsyncMock
+    ):
+        async def fake_get(url, timeout):
+            await asyncio.sleep(0)
+            if url.endswith("/codes"):
+                return json_response(SUPPORTED_CODES_RESPONSE)
+            return json_response(
+                {"base_code": "USD", "target_code": "EUR", "conversion_rate": 0.9}
+            )
+
+        mock_get.side_effect = fake_get
+
+        await asyncio.gather(
+            *(self.client.pair_conversion("USD", "EUR") for _ in range(20))
+        )
+
+        codes_calls = [
+            call for call in mock_get.call_args_list if call.args[0].endswith("/codes")
+        ]
+        self.assertEqual(len(codes_calls), 1)
+
+    async def test_concurrency_limit(self):
+        client = AsyncExchangeRateApiV6Client("mock-api-key", max_concurrency=2)
+        in_flight = 0
+        peak = 0
+
+        async def fake_get(url, timeout):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return json_response(
+                {"plan_quota": 1, "requests_remaining": 1, "refresh_day_of_month": 1}
+            )
+
+        with patch.object(client.session, "get", side_effect=fake_get):
+            await asyncio.gather(*(client.fetch_quota_info() for _ in range(10)))
+
+        await client.aclose()
+
+        self.assertEqual(peak, 2)
+
+    def test_on_invalid_concurrency_raises_exception(self):
+        with self.assertRaises(ValueError):
+            AsyncExchangeRateApiV6Client("mock-api-key", max_concurrency=0)
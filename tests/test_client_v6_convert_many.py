@@ -0,0 +1,99 @@
+import unittest
+
+from unittest.mock import patch, Mock, MagicMock
+
+import numpy as np
+
+from exchange_rate_api_client._client import ExchangeRateApiV6Client
+
+from exchange_rate_api_client.exceptions import UnsupportedCode
+
+from tests.helpers import LATEST_DATA, json_response
+
+
+def _latest_response(base_code, conversion_rates, time_last_update_unix=1585267200):
+    return json_response(
+        dict(
+            LATEST_DATA,
+            time_last_update_unix=time_last_update_unix,
+            time_next_update_unix=4102444800,
+            base_code=base_code,
+            conversion_rates=conversion_rates,
+        )
+    )
+
+
+class TestExchangeRateV6ClientConvertMany(unittest.TestCase):
+    def setUp(self):
+        self.client = ExchangeRateApiV6Client("mock-api-key")
+
+        self.supported_codes_response = MagicMock()
+        self.supported_codes_response.status_code = 200
+        self.supported_codes_response.json.return_value = {
+            "supported_codes": [["USD", "Dollar"], ["EUR", "Euro"], ["JPY", "Yen"]]
+        }
+
+        self.usd_response = _latest_response(
+            "USD", {"USD": 1, "EUR": 0.8, "JPY": 100}
+        )
+        self.eur_response = _latest_response(
+            "EUR", {"USD": 1.25, "EUR": 1, "JPY": 125}, time_last_update_unix=1585267201
+        )
+
+    @patch("exchange_rate_api_client._client.requests.Session.get")
+    def test_convert_many_with_mixed_bases(self, mock_get: Mock):
+        mock_get.side_effect = [
+            self.supported_codes_response,
+            self.eur_response,
+            self.usd_response,
+        ]
+
+        batch = self.client.convert_many(
+            [10, 20, 30, 40],
+            ["USD", "EUR", "USD", "EUR"],
+            ["EUR", "JPY", "JPY", "USD"],
+            chunk_size=3,
+        )
+
+        np.testing.assert_allclose(batch.results, [8, 2500, 3000, 50])
+        self.assertEqual(
+            batch.time_last_update_unix, {"USD": 1585267200, "EUR": 1585267201}
+        )
+        # One table per distinct base, even across chunks
+        self.assertEqual(mock_get.call_count, 3)
+
+    @patch("exchange_rate_api_client._client.requests.Session.get")
+    def test_convert_many_with_single_codes(self, mock_get: Mock):
+        mock_get.side_effect = [self.supported_codes_response, self.usd_response]
+
+        batch = self.client.convert_many(np.arange(5, dtype=float), "USD", "JPY")
+
+        np.testing.assert_allclose(batch.results, [0, 100, 200, 300, 400])
+
+    @patch("exchange_rate_api_client._client.requests.Session.get")
+    def test_convert_many_with_cross_rate_anchor(self, mock_get: Mock):
+        mock_get.side_effect = [self.supported_codes_response, self.usd_response]
+        client = ExchangeRateApiV6Client("mock-api-key", cross_rate_anchor="USD")
+
+        batch = client.convert_many([1, 2], ["EUR", "JPY"], ["JPY", "EUR"])
+
+        np.testing.assert_allclose(batch.results, [125, 0.016])
+        self.assertEqual(list(batch.time_last_update_unix), ["USD"])
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch("exchange_rate_api_client._client.requests.Session.get")
+    def test_convert_many_on_unknown_target_raises_exception(self, mock_get: Mock):
+        mock_get.side_effect = [self.supported_codes_response, self.usd_response]
+
+        with self.assertRaises(UnsupportedCode):
+            self.client.convert_many([1], ["USD"], ["XXX"])
+
+    def test_convert_many_on_invalid_arguments_raises_exception(self):
+        with self.assertRaises(ValueError):
+            self.client.convert_many([1, 2], ["USD"], "EUR")
+
+        with self.assertRaises(ValueError):
+            self.client.convert_many([-1], "USD", "EUR")
+
+        with self.assertRaises(ValueError):
+            self.client.convert_many([1], "USD", "EUR", chunk_size=0)
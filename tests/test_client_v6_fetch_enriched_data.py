@@ -21,7 +21,7 @@ class TestExchangeRateV6Client(unittest.TestCase):
     def setUp(self):
         self.client = ExchangeRateApiV6Client("mock-api-key")
 
-    @patch("exchange_rate_api_client._client.requests.get")
+    @patch("exchange_rate_api_client._client.requests.Session.get")
     def test_fetch_enriched_data(self, mock_get: Mock):
         mock_supported_codes_response = MagicMock()
         mock_supported_codes_response.status_code = 200
@@ -86,7 +86,7 @@ class TestExchangeRateV6Client(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.client.fetch_enriched_data("USD", None)
 
-    @patch("exchange_rate_api_client._client.requests.get")
+    @patch("exchange_rate_api_client._client.requests.Session.get")
     def test_fetch_enriched_data_on_unsupported_code_raises_exception(
         self, mock_get: Mock
     ):
@@ -101,7 +101,7 @@ class TestExchangeRateV6Client(unittest.TestCase):
         with self.assertRaises(UnsupportedCode):
             result = self.client.fetch_enriched_data("GBP", "JPY")
 
-    @patch("exchange_rate_api_client._client.requests.get")
+    @patch("exchange_rate_api_client._client.requests.Session.get")
     def test_fetch_enriched_data_exceptions_by_checking_supported_codes(
         self, mock_get: Mock
     ):
@@ -154,7 +154,7 @@ class TestExchangeRateV6Client(unittest.TestCase):
 
         self.assertEqual(str(context.exception), "Unknown error ocurred")
 
-    @patch("exchange_rate_api_client._client.requests.get")
+    @patch("exchange_rate_api_client._client.requests.Session.get")
     def test_fetch_enriched_data_on_unsupported_code_in_data_response_raises_exception(
         self, mock_get: Mock
     ):
@@ -178,7 +178,7 @@ class TestExchangeRateV6Client(unittest.TestCase):
             timeout=10,
         )
 
-    @patch("exchange_rate_api_client._client.requests.get")
+    @patch("exchange_rate_api_client._client.requests.Session.get")
     def test_fetch_enriched_data_on_invalid_key_in_data_response_raises_exception(
         self, mock_get: Mock
     ):
@@ -202,7 +202,7 @@ class TestExchangeRateV6Client(unittest.TestCase):
             timeout=10,
         )
 
-    @patch("exchange_rate_api_client._client.requests.get")
+    @patch("exchange_rate_api_client._client.requests.Session.get")
     def test_fetch_enriched_data_on_inactive_account_in_data_response_raises_exception(
         self, mock_get: Mock
     ):
@@ -226,7 +226,7 @@ class TestExchangeRateV6Client(unittest.TestCase):
             timeout=10,
         )
 
-    @patch("exchange_rate_api_client._client.requests.get")
+    @patch("exchange_rate_api_client._client.requests.Session.get")
     def test_fetch_enriched_data_on_quota_reached_in_data_response_raises_exception(
         self, mock_get: Mock
     ):
@@ -250,7 +250,7 @@ class TestExchangeRateV6Client(unittest.TestCase):
             timeout=10,
         )
 
-    @patch("exchange_rate_api_client._client.requests.get")
+    @patch("exchange_rate_api_client._client.requests.Session.get")
     def test_fetch_enriched_data_on_malformed_request_in_data_response_raises_exception(
         self, mock_get: Mock
     ):
@@ -274,7 +274,7 @@ class TestExchangeRateV6Client(unittest.TestCase):
             timeout=10,
         )
 
-    @patch("exchange_rate_api_client._client.requests.get")
+    @patch("exchange_rate_api_client._client.requests.Session.get")
     def test_fetch_enriched_data_on_plan_upgrade_required_in_data_response_raises_exception(
         self, mock_get: Mock
     ):
@@ -298,7 +298,7 @@ class TestExchangeRateV6Client(unittest.TestCase):
             timeout=10,
         )
 
-    @patch("exchange_rate_api_client._client.requests.get")
+    @patch("exchange_rate_api_client._client.requests.Session.get")
     def test_fetch_enriched_data_on_unknown_error_type_in_data_response_raises_exception(
         self, mock_get: Mock
     ):
@@ -324,7 +324,7 @@ class TestExchangeRateV6Client(unittest.TestCase):
             timeout=10,
         )
 
-    @patch("exchange_rate_api_client._client.requests.get")
+    @patch("exchange_rate_api_client._client.requests.Session.get")
     def test_fetch_enriched_data_on_no_error_type_in_data_response_raises_exception(
         self, mock_get: Mock
     ):
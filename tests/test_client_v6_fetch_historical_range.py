@@ -0,0 +1,133 @@
+import os
+
+import tempfile
+
+import threading
+
+import time
+
+import unittest
+
+from datetime import date
+
+from unittest.mock import patch, Mock
+
+from exchange_rate_api_client._client import ExchangeRateApiV6Client
+
+from exchange_rate_api_client._historical_store import HistoricalStore
+
+from exchange_rate_api_client.commons import HistoricalData
+
+from exchange_rate_api_client.exceptions import QuotaReached
+
+from tests.helpers import json_response
+
+
+def _fake_api(missing_days=(), error_days=(), delay=0.0):
+    lock = threading.Lock()
+    state = {"in_flight": 0, "peak": 0, "history_calls": []}
+
+    def fake_get(url, timeout):
+        if url.endswith("/codes"):
+            return json_response({"supported_codes": [["USD", "Dollar"]]})
+
+        year, month, day, amount = (int(part) for part in url.split("/")[-4:])
+
+        with lock:
+            state["history_calls"].append(day)
+            state["in_flight"] += 1
+            state["peak"] = max(state["peak"], state["in_flight"])
+
+        time.sleep(delay)
+
+        with lock:
+            state["in_flight"] -= 1
+
+        if day in missing_days:
+            return json_response({"error-type": "no-data-available"}, 404)
+
+        if day in error_days:
+            return json_response({"error-type": "quota-reached"}, 403)
+
+        return json_response(
+            {
+                "year": year,
+                "month": month,
+                "day": day,
+                "base_code": "USD",
+                "requested_amount": amount,
+                "conversion_amounts": {"EUR": 0.9 * amount},
+            }
+        )
+
+    return fake_get, state
+
+
+class TestExchangeRateV6ClientFetchHistoricalRange(unittest.TestCase):
+    def setUp(self):
+        self.client = ExchangeRateApiV6Client("mock-api-key")
+
+    @patch("exchange_rate_api_client._client.requests.Session.get")
+    def test_results_are_in_date_order_and_missing_days_are_collected(
+        self, mock_get: Mock
+    ):
+        fake_get, state = _fake_api(missing_days={3, 7}, delay=0.01)
+        mock_get.side_effect = fake_get
+
+        history = self.client.fetch_historical_range(
+            "USD", date(2020, 1, 1), date(2020, 1, 10), amount=2, max_in_flight=4
+        )
+
+        self.assertEqual(
+            [data.day for data in history.data], [1, 2, 4, 5, 6, 8, 9, 10]
+        )
+        self.assertEqual(history.missing, [date(2020, 1, 3), date(2020, 1, 7)])
+        self.assertEqual(history.data[0].conversion_amounts, {"EUR": 1.8})
+        self.assertGreater(state["peak"], 1)
+        self.assertLessEqual(state["peak"], 4)
+
+    @patch("exchange_rate_api_client._client.requests.Session.get")
+    def test_typed_errors_abort_the_range(self, mock_get: Mock):
+        fake_get, _ = _fake_api(error_days={2})
+        mock_get.side_effect = fake_get
+
+        with self.assertRaises(QuotaReached):
+            self.client.fetch_historical_range("USD", date(2020, 1, 1), date(2020, 1, 3))
+
+    @patch("exchange_rate_api_client._client.requests.Session.get")
+    def test_days_in_the_store_are_skipped(self, mock_get: Mock):
+        fake_get, state = _fake_api()
+        mock_get.side_effect = fake_get
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with HistoricalStore(os.path.join(tmpdir, "history.sqlite3")) as store:
+                store.put(
+                    HistoricalData(
+                        year=2020,
+                        month=1,
+                        day=2,
+                        base_code="USD",
+                        requested_amount=1,
+                        conversion_amounts={"EUR": 0.5},
+                    )
+                )
+                client = ExchangeRateApiV6Client("mock-api-key", historical_store=store)
+
+                history = client.fetch_historical_range(
+                    "USD", date(2020, 1, 1), date(2020, 1, 3)
+                )
+
+        self.assertEqual(sorted(state["history_calls"]), [1, 3])
+        self.assertEqual(history.data[1].conversion_amounts, {"EUR": 0.5})
+
+    def test_on_invalid_arguments_raises_exception(self):
+        with self.assertRaises(ValueError):
+            self.client.fetch_historical_range("USD", date(2020, 1, 2), date(2020, 1, 1))
+
+        with self.assertRaises(ValueError):
+            self.client.fetch_historical_range("USD", "2020-01-01", date(2020, 1, 1))
+
+        with self.assertRaises(ValueError):
+            self.client.fetch_historical_range(
+                "USD", date(2020, 1, 1), date(2020, 1, 2), max_in_flight=0
+            )
@@ -17,7 +17,7 @@ class TestExchangeRateV6Client(unittest.TestCase):
     def setUp(self):
         self.client = ExchangeRateApiV6Client("mock-api-key")
 
-    @patch("exchange_rate_api_client._client.requests.get")
+    @patch("exchange_rate_api_client._client.requests.Session.get")
     def test_fetch_quota_info(self, mock_get: Mock):
         mock_get.return_value.status_code = 200
         mock_get.return_value.json.return_value = {
@@ -35,7 +35,7 @@ class TestExchangeRateV6Client(unittest.TestCase):
 
         self.assertEqual(result.model_dump(), expected.model_dump())
 
-    @patch("exchange_rate_api_client._client.requests.get")
+    @patch("exchange_rate_api_client._client.requests.Session.get")
     def test_fetch_quota_info_on_invalid_key_raises_exception(self, mock_get: Mock):
         mock_get.return_value.status_code = 403
         mock_get.return_value.json.return_value = {"error-type": "invalid-key"}
@@ -43,7 +43,7 @@ class TestExchangeRateV6Client(unittest.TestCase):
         with self.assertRaises(InvalidKey):
             self.client.fetch_quota_info()
 
-    @patch("exchange_rate_api_client._client.requests.get")
+    @patch("exchange_rate_api_client._client.requests.Session.get")
     def test_fetch_quota_info_on_inactive_account_raises_exception(
         self, mock_get: Mock
     ):
@@ -53,7 +53,7 @@ class TestExchangeRateV6Client(unittest.TestCase):
         with self.assertRaises(InactiveAccount):
             self.client.fetch_quota_info()
 
-    @patch("exchange_rate_api_client._client.requests.get")
+    @patch("exchange_rate_api_client._client.requests.Session.get")
     def test_fetch_quota_info_on_quota_reached_raises_exception(self, mock_get: Mock):
         mock_get.return_value.status_code = 403
         mock_get.return_value.json.return_value = {"error-type": "quota-reached"}
@@ -21,7 +21,7 @@ class TestExchangeRateV6Client(unittest.TestCase):
 
     def test_initialization(self): ...
 
-    @patch("exchange_rate_api_client._client.requests.get")
+    @patch("exchange_rate_api_client._client.requests.Session.get")
     def test_pair_conversion_with_valid_codes(self, mock_get: Mock):
         mock_supported_codes_response = MagicMock()
         mock_supported_codes_response.status_code = 200
@@ -62,7 +62,7 @@ class TestExchangeRateV6Client(unittest.TestCase):
             "https://v6.exchangerate-api.com/v6/mock-api-key/pair/EUR/USD", timeout=10
         )
 
-    @patch("exchange_rate_api_client._client.requests.get")
+    @patch("exchange_rate_api_client._client.requests.Session.get")
     def test_pair_conversion_with_amount(self, mock_get: Mock):
         mock_supported_codes_response = MagicMock()
         mock_supported_codes_response.status_code = 200
@@ -131,7 +131,7 @@ class TestExchangeRateV6Client(unittest.TestCase):
 
         self.assertIn("amount", str(context.exception).lower())
 
-    @patch("exchange_rate_api_client._client.requests.get")
+    @patch("exchange_rate_api_client._client.requests.Session.get")
     def test_pair_conversion_on_unsupported_code_raises_exception(self, mock_get: Mock):
         mock_supported_codes_response = MagicMock()
         mock_supported_codes_response.status_code = 200
@@ -152,7 +152,7 @@ class TestExchangeRateV6Client(unittest.TestCase):
 
         self.assertIn("URU", str(context.exception))
 
-    @patch("exchange_rate_api_client._client.requests.get")
+    @patch("exchange_rate_api_client._client.requests.Session.get")
     def test_pair_conversion_exceptions_by_checking_supported_codes(
         self, mock_get: Mock
     ):
@@ -205,7 +205,7 @@ class TestExchangeRateV6Client(unittest.TestCase):
 
         self.assertEqual(str(context.exception), "Unknown error ocurred")
 
-    @patch("exchange_rate_api_client._client.requests.get")
+    @patch("exchange_rate_api_client._client.requests.Session.get")
     def test_pair_conversion_on_negative_amount_raises_exception(self, mock_get: Mock):
         mock_supported_codes_response = MagicMock()
         mock_supported_codes_response.status_code = 200
@@ -218,7 +218,7 @@ class TestExchangeRateV6Client(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.client.pair_conversion("USD", "EUR", -1)
 
-    @patch("exchange_rate_api_client._client.requests.get")
+    @patch("exchange_rate_api_client._client.requests.Session.get")
     def test_pair_conversion_on_unsupported_code_in_data_response_raises_exception(
         self, mock_get: Mock
     ):
@@ -243,7 +243,7 @@ class TestExchangeRateV6Client(unittest.TestCase):
             timeout=10,
         )
 
-    @patch("exchange_rate_api_client._client.requests.get")
+    @patch("exchange_rate_api_client._client.requests.Session.get")
     def test_pair_conversion_on_invalid_key_in_data_response_raises_exception(
         self, mock_get: Mock
     ):
@@ -267,7 +267,7 @@ class TestExchangeRateV6Client(unittest.TestCase):
             timeout=10,
         )
 
-    @patch("exchange_rate_api_client._client.requests.get")
+    @patch("exchange_rate_api_client._client.requests.Session.get")
     def test_pair_conversion_on_inactive_account_in_data_response_raises_exception(
         self, mock_get: Mock
     ):
@@ -291,7 +291,7 @@ class TestExchangeRateV6Client(unittest.TestCase):
             timeout=10,
         )
 
-    @patch("exchange_rate_api_client._client.requests.get")
+    @patch("exchange_rate_api_client._client.requests.Session.get")
     def test_pair_conversion_on_quota_reached_in_data_response_raises_exception(
         self, mock_get: Mock
     ):
@@ -315,7 +315,7 @@ class TestExchangeRateV6Client(unittest.TestCase):
             timeout=10,
         )
 
-    @patch("exchange_rate_api_client._client.requests.get")
+    @patch("exchange_rate_api_client._client.requests.Session.get")
     def test_pair_conversion_on_malformed_request_in_data_response_raises_exception(
         self, mock_get: Mock
     ):
@@ -339,7 +339,7 @@ class TestExchangeRateV6Client(unittest.TestCase):
             timeout=10,
         )
 
-    @patch("exchange_rate_api_client._client.requests.get")
+    @patch("exchange_rate_api_client._client.requests.Session.get")
     def test_pair_conversion_on_unknown_error_type_in_data_response_raises_exception(
         self, mock_get: Mock
     ):
@@ -363,7 +363,7 @@ class TestExchangeRateV6Client(unittest.TestCase):
             timeout=10,
         )
 
-    @patch("exchange_rate_api_client._client.requests.get")
+    @patch("exchange_rate_api_client._client.requests.Session.get")
     def test_pair_conversion_on_no_error_type_in_data_response_raises_exception(
         self, mock_get: Mock
     ):
@@ -388,3 +388,69 @@ class TestExchangeRateV6Client(unittest.TestCase):
             "https://v6.exchangerate-api.com/v6/mock-api-key/pair/USD/EUR",
             timeout=10,
         )
+
+
+class TestExchangeRateV6ClientLocalPairConversion(unittest.TestCase):
+    def setUp(self):
+        self.client = ExchangeRateApiV6Client(
+            "mock-api-key", local_pair_conversion=True
+        )
+
+        mock_supported_codes_response = MagicMock()
+        mock_supported_codes_response.status_code = 200
+        mock_supported_codes_response.json.return_value = {
+            "supported_codes": [["USD", "United States Dollar"], ["EUR", "Euro"]]
+        }
+
+        mock_latest_response = MagicMock()
+        mock_latest_response.status_code = 200
+        mock_latest_response.json.return_value = {
+            "time_last_update_unix": 1585267200,
+            "time_last_update_utc": "Fri, 27 Mar 2020 00:00:00 +0000",
+            "time_next_update_unix": 4102444800,
+            "time_next_update_utc": "Fri, 01 Jan 2100 00:00:00 +0000",
+            "base_code": "USD",
+            "conversion_rates": {"USD": 1, "EUR": 0.9013},
+        }
+
+        self.responses = [mock_supported_codes_response, mock_latest_response]
+
+    @patch("exchange_rate_api_client._client.requests.Session.get")
+    def test_pair_conversion_is_computed_from_latest_table(self, mock_get: Mock):
+        mock_get.side_effect = self.responses
+
+        expected = PairConversion(
+            time_last_update_unix=1585267200,
+            time_last_update_utc="Fri, 27 Mar 2020 00:00:00 +0000",
+            time_next_update_unix=4102444800,
+            time_next_update_utc="Fri, 01 Jan 2100 00:00:00 +0000",
+            base_code="USD",
+            target_code="EUR",
+            conversion_rate=0.9013,
+            conversion_result=225.325,
+        )
+
+        first = self.client.pair_conversion("USD", "EUR", 100)
+        second = self.client.pair_conversion("USD", "EUR", 250)
+        without_amount = self.client.pair_conversion("USD", "EUR")
+
+        self.assertAlmostEqual(first.conversion_result, 90.13)
+        self.assertEqual(second.model_dump(), expected.model_dump())
+        self.assertIsNone(without_amount.conversion_result)
+        self.assertEqual(mock_get.call_count, 2)
+        mock_get.assert_called_with(
+            "https://v6.exchangerate-api.com/v6/mock-api-key/latest/USD", timeout=10
+        )
+
+    @patch("exchange_rate_api_client._client.requests.Session.get")
+    def test_pair_conversion_on_target_missing_from_table_raises_exception(
+        self, mock_get: Mock
+    ):
+        mock_get.side_effect = self.responses
+
+        with self.assertRaises(UnsupportedCode):
+            self.client.pair_conversion("USD", "JPY", 100)
+
+    def test_pair_conversion_on_negative_amount_raises_exception(self):
+        with self.assertRaises(ValueError):
+            self.client.pair_conversion("USD", "EUR", -1)
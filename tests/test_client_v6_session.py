@@ -0,0 +1,78 @@
+import unittest
+
+from unittest.mock import patch, Mock, MagicMock
+
+import requests
+
+from exchange_rate_api_client._client import ExchangeRateApiV6Client
+
+from exchange_rate_api_client._session import create_session
+
+
+class TestCreateSession(unittest.TestCase):
+    def test_create_session_mounts_pooled_adapter(self):
+        session = create_session(pool_connections=3, pool_maxsize=7, max_retries=2)
+
+        adapter = session.get_adapter("https://v6.exchangerate-api.com")
+
+        self.assertEqual(adapter._pool_connections, 3)
+        self.assertEqual(adapter._pool_maxsize, 7)
+        self.assertEqual(adapter.max_retries.total, 2)
+        self.assertEqual(session.headers["Connection"], "keep-alive")
+
+    def test_create_session_without_keep_alive(self):
+        session = create_session(keep_alive=False)
+
+        self.assertEqual(session.headers["Connection"], "close")
+
+    def test_create_session_on_invalid_arguments_raises_exception(self):
+        with self.assertRaises(ValueError):
+            create_session(pool_connections=0)
+
+        with self.assertRaises(ValueError):
+            create_session(pool_maxsize="10")
+
+
+class TestExchangeRateV6ClientSession(unittest.TestCase):
+    @patch("exchange_rate_api_client._client.requests.Session.get")
+    def test_requests_reuse_the_client_session(self, mock_get: Mock):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "plan_quota": 30000,
+            "requests_remaining": 25623,
+            "refresh_day_of_month": 17,
+        }
+        mock_get.return_value = mock_response
+
+        client = ExchangeRateApiV6Client("mock-api-key", timeout=2.5)
+
+        client.fetch_quota_info()
+        client.fetch_quota_info()
+
+        self.assertEqual(mock_get.call_count, 2)
+        mock_get.assert_called_with(
+            "https://v6.exchangerate-api.com/v6/mock-api-key/quota", timeout=2.5
+        )
+
+    def test_close_releases_owned_session(self):
+        with ExchangeRateApiV6Client("mock-api-key") as client:
+            session = client.session
+
+        with patch.object(session, "close") as mock_close:
+            client.close()
+
+        mock_close.assert_called_once_with()
+
+    def test_shared_session_is_not_closed(self):
+        session = MagicMock(spec=requests.Session)
+
+        first = ExchangeRateApiV6Client("key-a", session=session)
+        second = ExchangeRateApiV6Client("key-b", session=session)
+
+        self.assertIs(first.session, second.session)
+
+        with first:
+            pass
+
+        session.close.assert_not_called()
@@ -0,0 +1,100 @@
+import json
+
+import unittest
+
+from unittest.mock import patch, Mock
+
+from exchange_rate_api_client._client import ExchangeRateApiV6Client
+
+from exchange_rate_api_client._compression import TransferStats, accept_encoding
+
+from exchange_rate_api_client._currencies import BUNDLED_CURRENCY_CODES
+
+from exchange_rate_api_client._session import ACCEPT_ENCODING, create_session
+
+from tests.helpers import LATEST_DATA, wire_response
+
+
+QUOTA_DATA = {
+    "result": "success",
+    "plan_quota": 30000,
+    "requests_remaining": 25623,
+    "refresh_day_of_month": 17,
+}
+
+# Every bundled code, as small payloads do not shrink
+FULL_LATEST_DATA = dict(
+    LATEST_DATA,
+    conversion_rates={code: 1.2345 for code in sorted(BUNDLED_CURRENCY_CODES)},
+)
+
+
+class TestAcceptEncoding(unittest.TestCase):
+    def test_lists_supported_codecs_by_preference(self):
+        self.assertEqual(
+            accept_encoding(["gzip", " deflate", "br", "zstd", "identity"]),
+            "zstd, br, gzip, deflate",
+        )
+        self.assertEqual(accept_encoding(["deflate", "GZIP"]), "gzip, deflate")
+
+    def test_sessions_ask_for_compressed_responses(self):
+        session = create_session()
+
+        self.assertEqual(session.headers["Accept-Encoding"], ACCEPT_ENCODING)
+        self.assertIn("gzip", ACCEPT_ENCODING)
+
+
+class TestTransferStats(unittest.TestCase):
+    def test_counts_compressed_and_uncompressed_bytes(self):
+        stats = TransferStats()
+        response, wire_bytes = wire_response(FULL_LATEST_DATA, compress=True)
+
+        stats.record(response)
+
+        self.assertEqual(stats.responses, 1)
+        self.assertEqual(stats.compressed_bytes, wire_bytes)
+        self.assertEqual(stats.uncompressed_bytes, len(json.dumps(FULL_LATEST_DATA)))
+        self.assertLess(stats.compression_ratio, 0.5)
+        self.assertEqual(stats.encodings, {"gzip": 1})
+
+    def test_uncompressed_responses(self):
+        stats = TransferStats()
+        response, wire_bytes = wire_response(QUOTA_DATA)
+
+        stats.record(response)
+
+        self.assertEqual(stats.compressed_bytes, wire_bytes)
+        self.assertEqual(stats.uncompressed_bytes, wire_bytes)
+        self.assertEqual(stats.encodings, {"identity": 1})
+
+    def test_reset(self):
+        stats = TransferStats()
+        stats.record(wire_response(QUOTA_DATA)[0])
+
+        stats.reset()
+
+        self.assertEqual(stats.responses, 0)
+        self.assertIsNone(stats.compression_ratio)
+        self.assertEqual(stats.encodings, {})
+
+
+class TestExchangeRateV6ClientTransferStats(unittest.TestCase):
+    @patch("exchange_rate_api_client._client.requests.Session.get")
+    def test_client_decodes_and_counts_compressed_responses(self, mock_get: Mock):
+        response, wire_bytes = wire_response(QUOTA_DATA, compress=True)
+        mock_get.return_value = response
+        client = ExchangeRateApiV6Client(
+            "mock-api-key",
+            codes_snapshot=BUNDLED_CURRENCY_CODES,
+            codes_refresh_interval=None,
+        )
+
+        quota = client.fetch_quota_info()
+
+        self.assertEqual(quota.requests_remaining, 25623)
+        self.assertEqual(client.transfer_stats.compressed_bytes, wire_bytes)
+        self.assertEqual(client.transfer_stats.encodings, {"gzip": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import unittest
+
+from unittest.mock import patch, Mock, MagicMock
+
+import numpy as np
+
+from exchange_rate_api_client._client import ExchangeRateApiV6Client
+
+from exchange_rate_api_client._cross_rates import CrossRateMatrix
+
+from exchange_rate_api_client.commons import ExclusiveExchangeRates
+
+from exchange_rate_api_client.exceptions import UnsupportedCode
+
+
+LATEST_USD = {
+    "time_last_update_unix": 1585267200,
+    "time_last_update_utc": "Fri, 27 Mar 2020 00:00:00 +0000",
+    "time_next_update_unix": 4102444800,
+    "time_next_update_utc": "Fri, 01 Jan 2100 00:00:00 +0000",
+    "base_code": "USD",
+    "conversion_rates": {"USD": 1, "EUR": 0.8, "JPY": 100, "GBP": 0.5},
+}
+
+
+class TestCrossRateMatrix(unittest.TestCase):
+    def setUp(self):
+        self.cross_rates = CrossRateMatrix.from_snapshot(
+            ExclusiveExchangeRates(**LATEST_USD)
+        )
+
+    def test_rate(self):
+        self.assertEqual(self.cross_rates.codes, ("USD", "EUR", "JPY", "GBP"))
+        self.assertAlmostEqual(self.cross_rates.rate("USD", "EUR"), 0.8)
+        self.assertAlmostEqual(self.cross_rates.rate("EUR", "JPY"), 125)
+        self.assertAlmostEqual(self.cross_rates.rate("GBP", "EUR"), 1.6)
+        self.assertAlmostEqual(self.cross_rates.rate("JPY", "JPY"), 1)
+
+    def test_row_and_column_are_views(self):
+        row = self.cross_rates.row("EUR")
+        column = self.cross_rates.column("EUR")
+
+        np.testing.assert_allclose(row, [1.25, 1, 125, 0.625])
+        np.testing.assert_allclose(column, [0.8, 1, 0.008, 1.6])
+        self.assertIs(row.base, self.cross_rates.matrix)
+        self.assertFalse(self.cross_rates.matrix.flags.writeable)
+
+    def test_pair_conversion(self):
+        conversion = self.cross_rates.pair_conversion("EUR", "GBP", 10)
+
+        self.assertAlmostEqual(conversion.conversion_rate, 0.625)
+        self.assertAlmostEqual(conversion.conversion_result, 6.25)
+        self.assertEqual(conversion.time_last_update_unix, 1585267200)
+
+    def test_on_unknown_code_raises_exception(self):
+        with self.assertRaises(UnsupportedCode):
+            self.cross_rates.rate("USD", "XXX")
+
+    def test_on_non_positive_rate_raises_exception(self):
+        payload = dict(LATEST_USD, conversion_rates={"USD": 1, "EUR": 0})
+
+        with self.assertRaises(ValueError):
+            CrossRateMatrix.from_snapshot(ExclusiveExchangeRates(**payload))
+
+
+class TestExchangeRateV6ClientCrossRates(unittest.TestCase):
+    def setUp(self):
+        mock_supported_codes_response = MagicMock()
+        mock_supported_codes_response.status_code = 200
+        mock_supported_codes_response.json.return_value = {
+            "supported_codes": [[code, code] for code in LATEST_USD["conversion_rates"]]
+        }
+
+        mock_latest_response = MagicMock()
+        mock_latest_response.status_code = 200
+        mock_latest_response.json.return_value = LATEST_USD
+
+        self.responses = [mock_supported_codes_response, mock_latest_response]
+
+    @patch("exchange_rate_api_client._client.requests.Session.get")
+    def test_fetch_cross_rates_is_reused_while_table_is_fresh(self, mock_get: Mock):
+        mock_get.side_effect = self.responses
+        client = ExchangeRateApiV6Client("mock-api-key", cross_rate_anchor="USD")
+
+        first = client.fetch_cross_rates()
+        second = client.fetch_cross_rates()
+
+        self.assertIs(first, second)
+        self.assertEqual(first.anchor_code, "USD")
+
+    @patch("exchange_rate_api_client._client.requests.Session.get")
+    def test_pair_conversion_is_triangulated(self, mock_get: Mock):
+        mock_get.side_effect = self.responses
+        client = ExchangeRateApiV6Client("mock-api-key", cross_rate_anchor="USD")
+
+        eur_jpy = client.pair_conversion("EUR", "JPY", 2)
+        gbp_eur = client.pair_conversion("GBP", "EUR")
+
+        self.assertAlmostEqual(eur_jpy.conversion_result, 250)
+        self.assertAlmostEqual(gbp_eur.conversion_rate, 1.6)
+        self.assertEqual(mock_get.call_count, 2)
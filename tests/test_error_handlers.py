@@ -13,6 +13,9 @@ from exchange_rate_api_client._error_handlers import (
     handle_required_plan_upgrade,
     handle_malformed_request,
     handle_no_data,
+    ENDPOINT_ERRORS,
+    error_dispatch,
+    raise_for_error_type,
 )
 
 from exchange_rate_api_client.exceptions import (
@@ -23,6 +26,7 @@ from exchange_rate_api_client.exceptions import (
     PlanUpgradeRequired,
     MalformedRequest,
     NoDataAvailable,
+    UnknownError,
 )
 
 
@@ -54,3 +58,35 @@ class TestResponseErrorHandlers(unittest.TestCase):
                     mock_response = MagicMock()
                     mock_response.json.return_value = {"error-type": error_type}
                     error_handler(mock_response)
+
+
+class TestErrorDispatch(unittest.TestCase):
+    def test_error_type_raises_mapped_exception(self):
+        with self.assertRaises(UnsupportedCode) as context:
+            raise_for_error_type(ENDPOINT_ERRORS["latest"], "unsupported-code")
+
+        self.assertEqual(str(context.exception), "The base code is not supported")
+
+    def test_unknown_or_unmapped_error_type_raises_unknown_error(self):
+        for error_type in ("unknown", None, "plan-upgrade-required"):
+            with self.subTest(error_type=error_type):
+                with self.assertRaises(UnknownError) as context:
+                    raise_for_error_type(ENDPOINT_ERRORS["latest"], error_type)
+
+                self.assertEqual(str(context.exception), "Unknown error ocurred")
+
+    def test_error_dispatch_overrides_messages(self):
+        dispatch = error_dispatch(
+            "quota-reached", "no-data-available", no_data_available="Nothing here"
+        )
+
+        self.assertEqual(
+            dispatch,
+            {
+                "quota-reached": (
+                    QuotaReached,
+                    "Reached the number of requests allowed in the plan",
+                ),
+                "no-data-available": (NoDataAvailable, "Nothing here"),
+            },
+        )
@@ -0,0 +1,159 @@
+import os
+
+import tempfile
+
+import unittest
+
+from datetime import date
+
+import numpy as np
+
+from exchange_rate_api_client._archive import HistoricalRateArchive
+
+from exchange_rate_api_client.commons import HistoricalData
+
+
+def _historical_data(day, conversion_amounts, base_code="USD", requested_amount=2):
+    return HistoricalData(
+        year=2020,
+        month=1,
+        day=day,
+        base_code=base_code,
+        requested_amount=requested_amount,
+        conversion_amounts=conversion_amounts,
+    )
+
+
+class TestHistoricalRateArchive(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.directory = os.path.join(self.tmpdir.name, "usd")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_write_incrementally_and_read_memory_mapped(self):
+        with HistoricalRateArchive(
+            self.directory, base_code="USD", writable=True, initial_capacity=(2, 1)
+        ) as archive:
+            archive.append(_historical_data(3, {"EUR": 1.8, "JPY": 220}))
+            archive.extend(
+                [
+                    _historical_data(1, {"EUR": 1.6}),
+                    _historical_data(2, {"EUR": 1.7, "GBP": 1.5}),
+                ]
+            )
+
+        archive = HistoricalRateArchive(self.directory)
+
+        self.assertIsInstance(archive.rates, np.memmap)
+        self.assertEqual(len(archive), 3)
+        self.assertEqual(archive.currencies, ("EUR", "JPY", "GBP"))
+        np.testing.assert_array_equal(
+            archive.dates, np.array(["2020-01-01", "2020-01-02", "2020-01-03"], "M8[D]")
+        )
+        np.testing.assert_allclose(archive.column("EUR"), [0.8, 0.85, 0.9])
+        np.testing.assert_allclose(
+            archive.column("EUR", date(2020, 1, 2), date(2020, 1, 3)), [0.85, 0.9]
+        )
+        np.testing.assert_allclose(archive.row(date(2020, 1, 3)), [0.9, 110, np.nan])
+        self.assertTrue(np.isnan(archive.column("GBP")[[0, 2]]).all())
+
+    def test_column_is_a_view(self):
+        with HistoricalRateArchive(
+            self.directory, base_code="USD", writable=True
+        ) as archive:
+            archive.append(_historical_data(1, {"EUR": 1.6}))
+
+        archive = HistoricalRateArchive(self.directory)
+        column = archive.column("EUR")
+
+        self.assertTrue(np.shares_memory(column, archive.rates))
+        self.assertFalse(column.flags.writeable)
+
+    def test_existing_day_is_overwritten(self):
+        with HistoricalRateArchive(
+            self.directory, base_code="USD", writable=True
+        ) as archive:
+            archive.append(_historical_data(1, {"EUR": 1.6}))
+            archive.append(_historical_data(1, {"EUR": 2.0}))
+
+            self.assertEqual(len(archive), 1)
+            np.testing.assert_allclose(archive.column("EUR"), [1.0])
+
+    def test_backfill_is_merged_in_date_order(self):
+        with HistoricalRateArchive(
+            self.directory, base_code="USD", writable=True, initial_capacity=(2, 1)
+        ) as archive:
+            archive.extend(
+                [_historical_data(day, {"EUR": 1.0 + day / 10}) for day in (10, 20, 30)]
+            )
+            archive.extend(
+                [
+                    _historical_data(25, {"EUR": 2.5}),
+                    _historical_data(5, {"EUR": 0.5}),
+                    _historical_data(20, {"EUR": 4.0}),
+                    _historical_data(31, {"EUR": 3.1, "GBP": 2.0}),
+                    _historical_data(5, {"EUR": 0.6}),
+                ]
+            )
+
+        archive = HistoricalRateArchive(self.directory)
+
+        self.assertEqual(
+            archive.dates.astype(object).tolist(),
+            [date(2020, 1, day) for day in (5, 10, 20, 25, 30, 31)],
+        )
+        np.testing.assert_allclose(
+            archive.column("EUR"), [0.3, 1.0, 2.0, 1.25, 2.0, 1.55]
+        )
+        np.testing.assert_allclose(archive.column("GBP")[-1], 1.0)
+        self.assertTrue(np.isnan(archive.column("GBP")[:-1]).all())
+
+    def test_failed_extend_keeps_archived_days(self):
+        with HistoricalRateArchive(
+            self.directory, base_code="USD", writable=True
+        ) as archive:
+            archive.append(_historical_data(1, {"EUR": 1.6}))
+            archive.append(_historical_data(3, {"EUR": 1.8}))
+
+            with self.assertRaises(ValueError):
+                archive.extend(
+                    [
+                        _historical_data(2, {"EUR": 1.7}),
+                        _historical_data(4, {"USD": 1.1}, base_code="EUR"),
+                    ]
+                )
+
+        archive = HistoricalRateArchive(self.directory)
+
+        np.testing.assert_array_equal(
+            archive.dates, np.array(["2020-01-01", "2020-01-03"], "M8[D]")
+        )
+        np.testing.assert_allclose(archive.column("EUR"), [0.8, 0.9])
+
+    def test_on_invalid_usage_raises_exception(self):
+        with self.assertRaises(FileNotFoundError):
+            HistoricalRateArchive(self.directory)
+
+        with self.assertRaises(ValueError):
+            HistoricalRateArchive(self.directory, writable=True)
+
+        archive = HistoricalRateArchive(self.directory, base_code="USD", writable=True)
+
+        with self.assertRaises(ValueError):
+            archive.append(_historical_data(1, {"USD": 1.1}, base_code="EUR"))
+
+        with self.assertRaises(ValueError):
+            archive.append(_historical_data(1, {"EUR": 0}, requested_amount=0))
+
+        with self.assertRaises(ValueError):
+            HistoricalRateArchive(self.directory, base_code="EUR")
+
+        with self.assertRaises(ValueError):
+            HistoricalRateArchive(self.directory).append(
+                _historical_data(1, {"EUR": 1.6})
+            )
+
+        with self.assertRaises(KeyError):
+            archive.row(date(2020, 1, 1))
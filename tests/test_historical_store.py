@@ -0,0 +1,132 @@
+import os
+
+import tempfile
+
+import unittest
+
+import warnings
+
+from datetime import date
+
+from unittest.mock import patch, Mock, MagicMock
+
+from exchange_rate_api_client._client import ExchangeRateApiV6Client
+
+from exchange_rate_api_client._historical_store import HistoricalStore
+
+from exchange_rate_api_client.commons import HistoricalData
+
+
+def _historical_data(day=1, requested_amount=10):
+    return HistoricalData(
+        year=2020,
+        month=1,
+        day=day,
+        base_code="USD",
+        requested_amount=requested_amount,
+        conversion_amounts={"EUR": 9.0, "JPY": 1100.0},
+    )
+
+
+class TestHistoricalStore(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "history.sqlite3")
+        self.store = HistoricalStore(self.path, today=lambda: date(2020, 1, 2))
+
+    def tearDown(self):
+        self.store.close()
+        self.tmpdir.cleanup()
+
+    def test_put_and_get_rescales_amount(self):
+        self.assertTrue(self.store.put(_historical_data()))
+
+        same_amount = self.store.get("USD", date(2020, 1, 1), 10)
+        other_amount = self.store.get("USD", date(2020, 1, 1), 20)
+
+        self.assertEqual(same_amount.model_dump(), _historical_data().model_dump())
+        self.assertEqual(other_amount.requested_amount, 20)
+        self.assertEqual(other_amount.conversion_amounts, {"EUR": 18.0, "JPY": 2200.0})
+        self.assertIsNone(self.store.get("USD", date(2020, 1, 3), 10))
+        self.assertIsNone(self.store.get("EUR", date(2020, 1, 1), 10))
+
+    def test_get_fractional_amount(self):
+        self.store.put(_historical_data())
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            data = self.store.get("USD", date(2020, 1, 1), 2.5)
+            data.model_dump_json()
+
+        self.assertEqual(data.requested_amount, 2.5)
+        self.assertEqual(data.conversion_amounts, {"EUR": 2.25, "JPY": 275.0})
+
+    def test_entries_persist_across_instances(self):
+        self.store.put(_historical_data())
+        self.store.close()
+
+        with HistoricalStore(self.path) as store:
+            self.assertIsNotNone(store.get("USD", date(2020, 1, 1), 10))
+
+        self.store = HistoricalStore(self.path)
+
+    def test_put_skips_current_day_and_zero_amounts(self):
+        self.assertFalse(self.store.put(_historical_data(day=2)))
+        self.assertFalse(self.store.put(_historical_data(requested_amount=0)))
+
+        self.assertIsNone(self.store.get("USD", date(2020, 1, 2), 10))
+        self.assertIsNone(self.store.get("USD", date(2020, 1, 1), 10))
+
+
+class TestExchangeRateV6ClientHistoricalStore(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.store = HistoricalStore(
+            os.path.join(self.tmpdir.name, "history.sqlite3"),
+            today=lambda: date(2024, 1, 1),
+        )
+        self.client = ExchangeRateApiV6Client(
+            "mock-api-key", historical_store=self.store
+        )
+
+    def tearDown(self):
+        self.store.close()
+        self.tmpdir.cleanup()
+
+    @patch("exchange_rate_api_client._client.requests.Session.get")
+    def test_fetch_historical_data_writes_through_and_reads_back(self, mock_get: Mock):
+        mock_supported_codes_response = MagicMock()
+        mock_supported_codes_response.status_code = 200
+        mock_supported_codes_response.json.return_value = {
+            "supported_codes": [["USD", "United States Dollar"]]
+        }
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = _historical_data().model_dump()
+
+        mock_get.side_effect = [mock_supported_codes_response, mock_response]
+
+        fetched = self.client.fetch_historical_data("USD", date(2020, 1, 1), 10)
+        stored = self.client.fetch_historical_data("USD", date(2020, 1, 1), 5)
+
+        self.assertEqual(fetched.model_dump(), _historical_data().model_dump())
+        self.assertEqual(stored.conversion_amounts, {"EUR": 4.5, "JPY": 550.0})
+        self.assertEqual(mock_get.call_count, 2)
+
+    def test_stored_days_honor_strict_validation(self):
+        self.store.put(_historical_data())
+        strict_client = ExchangeRateApiV6Client(
+            "mock-api-key", historical_store=self.store, strict_validation=True
+        )
+
+        with patch.object(
+            HistoricalData, "model_validate", wraps=HistoricalData.model_validate
+        ) as validate:
+            self.client.fetch_historical_data("USD", date(2020, 1, 1), 5)
+            validate.assert_not_called()
+
+            stored = strict_client.fetch_historical_data("USD", date(2020, 1, 1), 2.5)
+            validate.assert_called_once()
+
+        self.assertEqual(stored.requested_amount, 2.5)
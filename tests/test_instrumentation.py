@@ -0,0 +1,264 @@
+import math
+
+import time
+
+import unittest
+
+from unittest.mock import patch, Mock
+
+import requests
+
+from exchange_rate_api_client._client import ExchangeRateApiV6Client
+
+from exchange_rate_api_client._cache import LatestRatesCache
+
+from exchange_rate_api_client._currencies import BUNDLED_CURRENCY_CODES
+
+from exchange_rate_api_client._instrumentation import LatencyHistogram, RequestEvent
+
+from exchange_rate_api_client.exceptions import QuotaReached, RequestTimeout
+
+from tests.helpers import LATEST_DATA, raw_response
+
+
+def latest_data():
+    # Fresh, so that the rates cache does not expire it
+    now = int(time.time())
+    return dict(
+        LATEST_DATA, time_last_update_unix=now, time_next_update_unix=now + 3600
+    )
+
+
+def event(endpoint="latest", total=0.001, cache_hit=None):
+    return RequestEvent(
+        endpoint=endpoint,
+        status=200,
+        error_type=None,
+        cache_hit=cache_hit,
+        bytes_received=0,
+        phases={"total": total},
+    )
+
+
+class TestRequestHooks(unittest.TestCase):
+    def setUp(self):
+        self.events = []
+        self.client = ExchangeRateApiV6Client(
+            "mock-api-key",
+            codes_snapshot=BUNDLED_CURRENCY_CODES,
+            codes_refresh_interval=None,
+            request_hooks=[self.events.append],
+        )
+
+    @patch("exchange_rate_api_client._client.requests.Session.get")
+    def test_successful_request_reports_every_phase(self, mock_get: Mock):
+        response = raw_response(latest_data(), elapsed=0.0)
+        mock_get.return_value = response
+
+        self.client.fetch_exchange_rates("USD")
+
+        (event,) = self.events
+        self.assertEqual(event.endpoint, "latest")
+        self.assertEqual(event.status, 200)
+        self.assertIsNone(event.error_type)
+        self.assertIsNone(event.cache_hit)
+        self.assertEqual(event.bytes_received, len(response.content))
+        self.assertEqual(
+            set(event.phases),
+            {
+                "codes_check",
+                "budget",
+                "connect_wait",
+                "download",
+                "decode",
+                "validate",
+                "total",
+            },
+        )
+        self.assertGreaterEqual(
+            event.phases["total"],
+            sum(seconds for phase, seconds in event.phases.items() if phase != "total"),
+        )
+
+    @patch("exchange_rate_api_client._client.requests.Session.get")
+    def test_api_errors_report_their_error_type(self, mock_get: Mock):
+        mock_get.return_value = raw_response(
+            {"result": "error", "error-type": "quota-reached"}, status_code=429
+        )
+
+        with self.assertRaises(QuotaReached):
+            self.client.fetch_exchange_rates("USD")
+
+        (event,) = self.events
+        self.assertEqual(event.status, 429)
+        self.assertEqual(event.error_type, "quota-reached")
+        self.assertNotIn("validate", event.phases)
+
+    @patch("exchange_rate_api_client._client.requests.Session.get")
+    def test_transport_errors_report_the_exception_name(self, mock_get: Mock):
+        mock_get.side_effect = requests.exceptions.Timeout()
+
+        with self.assertRaises(RequestTimeout):
+            self.client.fetch_exchange_rates("USD")
+
+        (event,) = self.events
+        self.assertIsNone(event.status)
+        self.assertEqual(event.error_type, "RequestTimeout")
+        self.assertEqual(event.bytes_received, 0)
+
+    @patch("exchange_rate_api_client._client.requests.Session.get")
+    def test_codes_check_of_a_failed_call_is_not_reported_later(self, mock_get: Mock):
+        mock_get.return_value = raw_response(
+            {
+                "result": "success",
+                "plan_quota": 30000,
+                "requests_remaining": 25623,
+                "refresh_day_of_month": 17,
+            }
+        )
+
+        with self.assertRaises(ValueError):
+            self.client.pair_conversion("USD", "EUR", -1)
+        self.client.fetch_quota_info()
+
+        (event,) = self.events
+        self.assertEqual(event.endpoint, "quota")
+        self.assertNotIn("codes_check", event.phases)
+
+    @patch("exchange_rate_api_client._client.requests.Session.get")
+    def test_failing_hooks_do_not_change_the_outcome(self, mock_get: Mock):
+        def failing_hook(event):
+            raise RuntimeError("hook bug")
+
+        later_events = []
+        self.client.add_request_hook(failing_hook)
+        self.client.add_request_hook(later_events.append)
+        mock_get.side_effect = [
+            raw_response(latest_data()),
+            raw_response(
+                {"result": "error", "error-type": "quota-reached"}, status_code=429
+            ),
+        ]
+
+        with self.assertLogs("exchange_rate_api_client", "WARNING"):
+            rates = self.client.fetch_exchange_rates("USD")
+        with self.assertLogs("exchange_rate_api_client", "WARNING"):
+            with self.assertRaises(QuotaReached):
+                self.client.fetch_exchange_rates("USD")
+
+        self.assertEqual(rates.base_code, "USD")
+        # Hooks registered after the failing one are still called
+        self.assertEqual([event.status for event in later_events], [200, 429])
+
+    @patch("exchange_rate_api_client._client.requests.Session.get")
+    def test_cache_hits_and_misses_are_reported(self, mock_get: Mock):
+        mock_get.return_value = raw_response(latest_data())
+        client = ExchangeRateApiV6Client(
+            "mock-api-key",
+            codes_snapshot=BUNDLED_CURRENCY_CODES,
+            codes_refresh_interval=None,
+            rates_cache=LatestRatesCache(),
+        )
+        client.add_request_hook(self.events.append)
+
+        client.fetch_exchange_rates("USD")
+        client.fetch_exchange_rates("USD")
+
+        miss, hit = self.events
+        self.assertIs(miss.cache_hit, False)
+        self.assertIs(hit.cache_hit, True)
+        self.assertIsNone(hit.status)
+        self.assertEqual(list(hit.phases), ["total"])
+
+    @patch("exchange_rate_api_client._client.requests.Session.get")
+    def test_strict_validation_decodes_while_validating(self, mock_get: Mock):
+        mock_get.return_value = raw_response(latest_data())
+        client = ExchangeRateApiV6Client(
+            "mock-api-key",
+            codes_snapshot=BUNDLED_CURRENCY_CODES,
+            codes_refresh_interval=None,
+            strict_validation=True,
+            request_hooks=[self.events.append],
+        )
+
+        client.fetch_exchange_rates("USD")
+
+        self.assertNotIn("decode", self.events[0].phases)
+        self.assertIn("validate", self.events[0].phases)
+
+    @patch("exchange_rate_api_client._client.requests.Session.get")
+    def test_removed_hooks_are_not_called(self, mock_get: Mock):
+        mock_get.return_value = raw_response(latest_data())
+
+        self.client.remove_request_hook(self.events.append)
+        self.client.fetch_exchange_rates("USD")
+
+        self.assertEqual(self.events, [])
+        with self.assertRaises(ValueError):
+            self.client.remove_request_hook(self.events.append)
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    def test_percentiles_are_bucket_upper_bounds(self):
+        histogram = LatencyHistogram(bounds=[0.01, 0.1, 1])
+
+        for total in [0.005] * 90 + [0.05] * 9 + [5]:
+            histogram(event(total=total))
+
+        self.assertEqual(histogram.count(), 100)
+        self.assertEqual(histogram.counts("latest"), [90, 9, 0, 1])
+        self.assertEqual(histogram.percentile(50), 0.01)
+        self.assertEqual(histogram.percentile(99), 0.1)
+        self.assertEqual(histogram.percentile(100), math.inf)
+
+    def test_endpoints_are_counted_apart(self):
+        histogram = LatencyHistogram(bounds=[0.01, 0.1])
+
+        histogram(event("latest", 0.005))
+        histogram(event("pair", 0.05))
+
+        self.assertEqual(histogram.endpoints(), ["latest", "pair"])
+        self.assertEqual(histogram.percentile(50, "pair"), 0.1)
+        self.assertIsNone(histogram.percentile(50, "quota"))
+        self.assertEqual(histogram.count("quota"), 0)
+
+    def test_cache_hits_are_skipped_by_default(self):
+        histogram = LatencyHistogram()
+        with_hits = LatencyHistogram(include_cache_hits=True)
+
+        for sink in (histogram, with_hits):
+            sink(event(cache_hit=True))
+
+        self.assertEqual(histogram.count(), 0)
+        self.assertEqual(with_hits.count(), 1)
+
+    def test_records_another_phase(self):
+        histogram = LatencyHistogram(phase="decode")
+
+        histogram(event())
+        histogram(event()._replace(phases={"decode": 0.001, "total": 0.002}))
+
+        self.assertEqual(histogram.count(), 1)
+
+    def test_reset(self):
+        histogram = LatencyHistogram()
+        histogram(event())
+
+        histogram.reset()
+
+        self.assertEqual(histogram.count(), 0)
+        self.assertEqual(histogram.endpoints(), [])
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            LatencyHistogram(phase="parse")
+
+        with self.assertRaises(ValueError):
+            LatencyHistogram(bounds=[0.1, 0.01])
+
+        with self.assertRaises(ValueError):
+            LatencyHistogram().percentile(101)
+
+
+if __name__ == "__main__":
+    unittest.main()
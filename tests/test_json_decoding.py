@@ -0,0 +1,80 @@
+import unittest
+
+from datetime import date
+
+from unittest.mock import patch, Mock
+
+from exchange_rate_api_client import _json
+
+from exchange_rate_api_client._client import ExchangeRateApiV6Client
+
+from exchange_rate_api_client._currencies import BUNDLED_CURRENCY_CODES
+
+from exchange_rate_api_client.commons import ExclusiveExchangeRates
+
+from exchange_rate_api_client.exceptions import NoDataAvailable
+
+from tests.helpers import LATEST_DATA, raw_response
+
+
+class TestJsonDecoding(unittest.TestCase):
+    def test_decode_response_uses_raw_body(self):
+        response = raw_response({"a": 1})
+
+        self.assertEqual(_json.raw_body(response), b'{"a": 1}')
+        self.assertEqual(_json.decode_response(response), {"a": 1})
+
+    def test_loads_without_orjson(self):
+        with patch.object(_json, "orjson", None):
+            self.assertEqual(_json.loads(b'{"a": [1, 2]}'), {"a": [1, 2]})
+
+
+class TestExchangeRateV6ClientDecoding(unittest.TestCase):
+    def _client(self, **kwargs):
+        return ExchangeRateApiV6Client(
+            "mock-api-key",
+            codes_snapshot=BUNDLED_CURRENCY_CODES,
+            codes_refresh_interval=None,
+            **kwargs,
+        )
+
+    @patch("exchange_rate_api_client._client.requests.Session.get")
+    def test_error_body_is_decoded_once(self, mock_get: Mock):
+        mock_get.return_value = raw_response(
+            {"result": "error", "error-type": "no-data-available"}, status_code=404
+        )
+
+        with patch.object(_json, "loads", wraps=_json.loads) as loads:
+            with self.assertRaises(NoDataAvailable):
+                self._client().fetch_historical_data("USD", date(1990, 1, 1), 1)
+
+        self.assertEqual(loads.call_count, 1)
+
+    @patch("exchange_rate_api_client._client.requests.Session.get")
+    def test_success_body_is_decoded_once(self, mock_get: Mock):
+        mock_get.return_value = raw_response(LATEST_DATA)
+
+        with patch.object(_json, "loads", wraps=_json.loads) as loads:
+            result = self._client().fetch_exchange_rates("USD")
+
+        self.assertEqual(loads.call_count, 1)
+        self.assertEqual(result.conversion_rates, {"USD": 1, "EUR": 0.9013})
+
+    @patch("exchange_rate_api_client._client.requests.Session.get")
+    def test_strict_validation_validates_the_raw_body(self, mock_get: Mock):
+        mock_get.return_value = raw_response(LATEST_DATA)
+
+        with patch.object(_json, "loads") as loads, patch.object(
+            ExclusiveExchangeRates,
+            "model_validate_json",
+            wraps=ExclusiveExchangeRates.model_validate_json,
+        ) as model_validate_json:
+            result = self._client(strict_validation=True).fetch_exchange_rates("USD")
+
+        loads.assert_not_called()
+        model_validate_json.assert_called_once()
+        self.assertEqual(result.base_code, "USD")
+
+
+if __name__ == "__main__":
+    unittest.main()
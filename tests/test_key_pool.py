@@ -0,0 +1,229 @@
+import unittest
+
+from datetime import date, datetime, timezone
+
+from unittest.mock import patch, Mock
+
+from exchange_rate_api_client._key_pool import (
+    MultiKeyExchangeRateApiV6Client,
+    next_refresh,
+)
+
+from exchange_rate_api_client._currencies import BUNDLED_CURRENCY_CODES
+
+from exchange_rate_api_client.exceptions import KeyPoolExhausted, InvalidKey
+
+from tests.helpers import LATEST_DATA, json_response
+
+
+def utc(*args) -> float:
+    return datetime(*args, tzinfo=timezone.utc).timestamp()
+
+
+class FakeApi:
+    """Answers requests per API key, from the key found in the URL."""
+
+    def __init__(self, remaining, errors=None, days_without_data=()):
+        self.remaining = dict(remaining)
+        self.errors = dict(errors or {})
+        self.days_without_data = set(days_without_data)
+        self.requests = []
+
+    def __call__(self, url, **kwargs):
+        api_key, endpoint, *args = url.split("/v6/")[1].split("/")
+        self.requests.append((api_key, endpoint))
+
+        error_type = self.errors.get(api_key)
+        if error_type:
+            return json_response({"result": "error", "error-type": error_type}, 403)
+
+        if endpoint == "quota":
+            return json_response(
+                {
+                    "result": "success",
+                    "plan_quota": 1000,
+                    "requests_remaining": self.remaining[api_key],
+                    "refresh_day_of_month": 17,
+                }
+            )
+
+        if endpoint == "history":
+            base_code, year, month, day, amount = args
+            if int(day) in self.days_without_data:
+                return json_response(
+                    {"result": "error", "error-type": "no-data-available"}, 404
+                )
+            return json_response(
+                {
+                    "result": "success",
+                    "year": int(year),
+                    "month": int(month),
+                    "day": int(day),
+                    "base_code": base_code,
+                    "requested_amount": int(amount),
+                    "conversion_amounts": {"EUR": 0.9 * int(amount)},
+                }
+            )
+
+        return json_response(dict(LATEST_DATA, base_code=args[0]))
+
+    def keys_used(self, endpoint):
+        return [api_key for api_key, used in self.requests if used == endpoint]
+
+    def latest_requests(self):
+        return self.keys_used("latest")
+
+
+class TestMultiKeyExchangeRateApiV6Client(unittest.TestCase):
+    def setUp(self):
+        self.now = utc(2024, 3, 20)
+
+    def create_client(self, keys=("key-a", "key-b")):
+        return MultiKeyExchangeRateApiV6Client(
+            keys,
+            clock=lambda: self.now,
+            codes_snapshot=BUNDLED_CURRENCY_CODES,
+            codes_refresh_interval=None,
+        )
+
+    @patch("exchange_rate_api_client._client.requests.Session.get")
+    def test_requests_are_spread_across_keys(self, mock_get: Mock):
+        api = mock_get.side_effect = FakeApi({"key-a": 100, "key-b": 100})
+        client = self.create_client()
+
+        for _ in range(4):
+            client.fetch_exchange_rates("USD")
+
+        self.assertEqual(api.latest_requests(), ["key-a", "key-b", "key-a", "key-b"])
+        statuses = client.key_statuses()
+        self.assertEqual(statuses["key-a"].requests_remaining, 98)
+        self.assertTrue(statuses["key-b"].active)
+
+    @patch("exchange_rate_api_client._client.requests.Session.get")
+    def test_exhausted_keys_are_evicted_until_refresh_day(self, mock_get: Mock):
+        api = mock_get.side_effect = FakeApi({"key-a": 1, "key-b": 100})
+        client = self.create_client()
+
+        for _ in range(4):
+            client.fetch_exchange_rates("USD")
+
+        self.assertEqual(api.latest_requests(), ["key-a", "key-b", "key-b", "key-b"])
+        status = client.key_statuses()["key-a"]
+        self.assertFalse(status.active)
+        self.assertEqual(status.readmit_at, utc(2024, 4, 17))
+
+        self.now = utc(2024, 4, 17)
+        api.remaining["key-a"] = 1000
+
+        client.fetch_exchange_rates("USD")
+        client.fetch_exchange_rates("USD")
+
+        self.assertIn("key-a", api.latest_requests()[4:])
+        self.assertEqual(client.key_statuses()["key-a"].requests_remaining, 999)
+
+    @patch("exchange_rate_api_client._client.requests.Session.get")
+    def test_inactive_and_quota_reached_keys_are_skipped(self, mock_get: Mock):
+        api = mock_get.side_effect = FakeApi(
+            {"key-a": 100, "key-b": 100, "key-c": 100},
+            errors={"key-a": "inactive-account", "key-b": "quota-reached"},
+        )
+        client = self.create_client(["key-a", "key-b", "key-c"])
+
+        client.fetch_exchange_rates("USD")
+
+        self.assertEqual(api.latest_requests(), ["key-c"])
+        statuses = client.key_statuses()
+        self.assertFalse(statuses["key-a"].active)
+        # Without a quota status, keys are tried again after the readmit interval
+        self.assertEqual(statuses["key-b"].readmit_at, self.now + 86400)
+
+    @patch("exchange_rate_api_client._client.requests.Session.get")
+    def test_raises_when_every_key_is_out_of_rotation(self, mock_get: Mock):
+        mock_get.side_effect = FakeApi(
+            {"key-a": 0, "key-b": 100}, errors={"key-b": "quota-reached"}
+        )
+        client = self.create_client()
+
+        with self.assertRaises(KeyPoolExhausted):
+            client.fetch_exchange_rates("USD")
+
+    @patch("exchange_rate_api_client._client.requests.Session.get")
+    def test_other_errors_are_raised(self, mock_get: Mock):
+        mock_get.side_effect = FakeApi({"key-a": 100}, errors={"key-a": "invalid-key"})
+        client = self.create_client(["key-a"])
+
+        with self.assertRaises(InvalidKey):
+            client.fetch_exchange_rates("USD")
+
+        self.assertTrue(client.key_statuses()["key-a"].active)
+
+    @patch("exchange_rate_api_client._client.requests.Session.get")
+    def test_historical_range_spreads_days_across_keys(self, mock_get: Mock):
+        api = mock_get.side_effect = FakeApi(
+            {"key-a": 100, "key-b": 2}, days_without_data={3}
+        )
+        client = self.create_client()
+
+        history = client.fetch_historical_range(
+            "USD", date(2020, 1, 1), date(2020, 1, 6), amount=10, max_in_flight=2
+        )
+
+        self.assertEqual([data.day for data in history.data], [1, 2, 4, 5, 6])
+        self.assertEqual(history.missing, [date(2020, 1, 3)])
+        # key-b is evicted once its quota of two requests is used
+        self.assertEqual(api.keys_used("history").count("key-b"), 2)
+        self.assertFalse(client.key_statuses()["key-b"].active)
+
+    @patch("exchange_rate_api_client._client.requests.Session.get")
+    def test_convert_many_spreads_tables_across_keys(self, mock_get: Mock):
+        api = mock_get.side_effect = FakeApi({"key-a": 100, "key-b": 100})
+        client = self.create_client()
+
+        batch = client.convert_many([10, 20], ["USD", "EUR"], "EUR")
+
+        self.assertEqual(api.latest_requests(), ["key-a", "key-b"])
+        self.assertEqual(set(batch.time_last_update_unix), {"USD", "EUR"})
+        self.assertAlmostEqual(batch.results[0], 9.013)
+
+    @patch("exchange_rate_api_client._client.requests.Session.get")
+    def test_fetch_quota_info_seeds_every_key(self, mock_get: Mock):
+        mock_get.side_effect = FakeApi({"key-a": 10, "key-b": 20})
+        client = self.create_client()
+
+        statuses = client.fetch_quota_info()
+
+        self.assertEqual(
+            {key: status.requests_remaining for key, status in statuses.items()},
+            {"key-a": 10, "key-b": 20},
+        )
+        self.assertEqual(client.key_statuses()["key-b"].requests_remaining, 20)
+
+    def test_keys_share_one_session(self):
+        client = self.create_client()
+
+        sessions = {key.client.session for key in client._keys.values()}
+
+        self.assertEqual(sessions, {client.session})
+
+    def test_on_invalid_arguments_raises_exception(self):
+        with self.assertRaises(ValueError):
+            MultiKeyExchangeRateApiV6Client([])
+
+        with self.assertRaises(ValueError):
+            MultiKeyExchangeRateApiV6Client(["key-a", "key-a"])
+
+        with self.assertRaises(ValueError):
+            MultiKeyExchangeRateApiV6Client(["key-a"], quota_governor=None)
+
+
+class TestNextRefresh(unittest.TestCase):
+    def test_next_refresh(self):
+        self.assertEqual(next_refresh(utc(2024, 3, 20), 17), utc(2024, 4, 17))
+        self.assertEqual(next_refresh(utc(2024, 3, 10), 17), utc(2024, 3, 17))
+        self.assertEqual(next_refresh(utc(2024, 12, 20), 1), utc(2025, 1, 1))
+        # Short months refresh on their last day
+        self.assertEqual(next_refresh(utc(2024, 2, 10), 31), utc(2024, 2, 29))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,247 @@
+import unittest
+
+from unittest.mock import patch, Mock, MagicMock
+
+from exchange_rate_api_client._cache import LatestRatesCache
+
+from exchange_rate_api_client._client import ExchangeRateApiV6Client
+
+from exchange_rate_api_client._currencies import BUNDLED_CURRENCY_CODES
+
+from exchange_rate_api_client.commons import ExclusiveExchangeRates
+
+from tests.helpers import FakeClock, raw_response
+
+
+def _snapshot(base_code="USD", time_next_update_unix=1000, time_last_update_unix=0):
+    return ExclusiveExchangeRates(
+        time_last_update_unix=time_last_update_unix,
+        time_last_update_utc="Thu, 01 Jan 1970 00:00:00 +0000",
+        time_next_update_unix=time_next_update_unix,
+        time_next_update_utc="Thu, 01 Jan 1970 00:16:40 +0000",
+        base_code=base_code,
+        conversion_rates={base_code: 1, "EUR": 0.9013},
+    )
+
+
+class TestLatestRatesCache(unittest.TestCase):
+    def test_serves_until_next_update(self):
+        clock = FakeClock(500)
+        cache = LatestRatesCache(clock=clock)
+        snapshot = _snapshot(time_next_update_unix=1000)
+
+        self.assertIsNone(cache.get("USD"))
+
+        cache.put(snapshot)
+
+        self.assertIs(cache.get("USD"), snapshot)
+
+        clock.now = 1000
+
+        self.assertIsNone(cache.get("USD"))
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+    def test_slack_extends_lifetime(self):
+        clock = FakeClock(1010)
+        cache = LatestRatesCache(slack=30, clock=clock)
+        cache.put(_snapshot(time_next_update_unix=1000))
+
+        self.assertIsNotNone(cache.get("USD"))
+
+        clock.now = 1030
+
+        self.assertIsNone(cache.get("USD"))
+
+    def test_invalidate(self):
+        cache = LatestRatesCache(clock=FakeClock(0))
+        cache.put(_snapshot("USD"))
+        cache.put(_snapshot("EUR"))
+
+        cache.invalidate("USD")
+
+        self.assertIsNone(cache.get("USD"))
+        self.assertIsNotNone(cache.get("EUR"))
+
+        cache.invalidate()
+
+        self.assertIsNone(cache.get("EUR"))
+
+    def test_on_invalid_slack_raises_exception(self):
+        with self.assertRaises(ValueError):
+            LatestRatesCache(slack=-1)
+
+        with self.assertRaises(ValueError):
+            LatestRatesCache(revalidate_interval=0)
+
+    def test_expired_tables_keep_their_validators(self):
+        clock = FakeClock(2000)
+        cache = LatestRatesCache(clock=clock)
+        snapshot = _snapshot(time_next_update_unix=1000)
+
+        cache.put(snapshot, etag='"v1"', last_modified="Fri, 27 Mar 2020 00:00:00 GMT")
+
+        self.assertIsNone(cache.get("USD"))
+        self.assertEqual(
+            cache.get_stale("USD"),
+            (snapshot, '"v1"', "Fri, 27 Mar 2020 00:00:00 GMT"),
+        )
+        self.assertIsNone(cache.get_stale("EUR"))
+
+    def test_revalidate_serves_for_the_revalidate_interval(self):
+        clock = FakeClock(2000)
+        cache = LatestRatesCache(revalidate_interval=60, clock=clock)
+        snapshot = _snapshot(time_next_update_unix=1000)
+        cache.put(snapshot)
+
+        cache.revalidate(snapshot)
+
+        self.assertIs(cache.get("USD"), snapshot)
+        self.assertEqual(cache.revalidations, 1)
+
+        clock.now = 2060
+
+        self.assertIsNone(cache.get("USD"))
+
+    def test_revalidate_ignores_replaced_tables(self):
+        cache = LatestRatesCache(clock=FakeClock(2000))
+        replaced = _snapshot(time_next_update_unix=1000)
+        cache.put(replaced)
+        cache.put(_snapshot(time_next_update_unix=1500))
+
+        cache.revalidate(replaced)
+
+        self.assertIsNone(cache.get("USD"))
+        self.assertEqual(cache.revalidations, 0)
+
+
+class TestExchangeRateV6ClientRatesCache(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock(500)
+        self.cache = LatestRatesCache(clock=self.clock)
+        self.client = ExchangeRateApiV6Client("mock-api-key", rates_cache=self.cache)
+
+        mock_supported_codes_response = MagicMock()
+        mock_supported_codes_response.status_code = 200
+        mock_supported_codes_response.json.return_value = {
+            "supported_codes": [["USD", "United States Dollar"]]
+        }
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = _snapshot().model_dump()
+
+        self.responses = [mock_supported_codes_response, mock_response, mock_response]
+
+    @patch("exchange_rate_api_client._client.requests.Session.get")
+    def test_fetch_exchange_rates_is_served_from_cache(self, mock_get: Mock):
+        mock_get.side_effect = self.responses
+
+        first = self.client.fetch_exchange_rates("USD")
+        second = self.client.fetch_exchange_rates("USD")
+
+        self.assertIs(first, second)
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    @patch("exchange_rate_api_client._client.requests.Session.get")
+    def test_fetch_exchange_rates_refetches_after_next_update(self, mock_get: Mock):
+        mock_get.side_effect = self.responses
+
+        self.client.fetch_exchange_rates("USD")
+
+        self.clock.now = 1000
+
+        self.client.fetch_exchange_rates("USD")
+
+        self.assertEqual(mock_get.call_count, 3)
+
+    @patch("exchange_rate_api_client._client.requests.Session.get")
+    def test_fetch_exchange_rates_force_refresh(self, mock_get: Mock):
+        mock_get.side_effect = self.responses
+
+        self.client.fetch_exchange_rates("USD")
+        self.client.fetch_exchange_rates("USD", force_refresh=True)
+
+        self.assertEqual(mock_get.call_count, 3)
+        self.assertEqual(self.cache.hits, 0)
+
+
+class TestExchangeRateV6ClientConditionalRequests(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock(500)
+        self.cache = LatestRatesCache(clock=self.clock)
+        self.client = ExchangeRateApiV6Client(
+            "mock-api-key",
+            rates_cache=self.cache,
+            codes_snapshot=BUNDLED_CURRENCY_CODES,
+            codes_refresh_interval=None,
+        )
+        self.validators = {
+            "ETag": '"v1"',
+            "Last-Modified": "Fri, 27 Mar 2020 00:00:00 GMT",
+        }
+
+    @patch("exchange_rate_api_client._client.requests.Session.get")
+    def test_not_modified_reuses_the_cached_table(self, mock_get: Mock):
+        mock_get.side_effect = [
+            raw_response(_snapshot().model_dump(), headers=self.validators),
+            raw_response(status_code=304),
+        ]
+
+        first = self.client.fetch_exchange_rates("USD")
+
+        self.clock.now = 1000
+
+        second = self.client.fetch_exchange_rates("USD")
+
+        self.assertIs(first, second)
+        self.assertEqual(
+            mock_get.call_args.kwargs["headers"],
+            {
+                "If-None-Match": '"v1"',
+                "If-Modified-Since": "Fri, 27 Mar 2020 00:00:00 GMT",
+            },
+        )
+        self.assertEqual(self.cache.revalidations, 1)
+        self.assertIs(self.client.fetch_exchange_rates("USD"), first)
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch("exchange_rate_api_client._client.requests.Session.get")
+    def test_unchanged_update_time_reuses_the_cached_table(self, mock_get: Mock):
+        mock_get.side_effect = [
+            raw_response(_snapshot().model_dump()),
+            raw_response(_snapshot().model_dump()),
+        ]
+
+        first = self.client.fetch_exchange_rates("USD")
+
+        self.clock.now = 1000
+
+        with patch.object(
+            ExclusiveExchangeRates, "model_construct"
+        ) as model_construct:
+            second = self.client.fetch_exchange_rates("USD")
+
+        self.assertIs(first, second)
+        model_construct.assert_not_called()
+        # Without validators, the request is not conditional
+        self.assertNotIn("headers", mock_get.call_args.kwargs)
+
+    @patch("exchange_rate_api_client._client.requests.Session.get")
+    def test_new_table_replaces_the_cached_one(self, mock_get: Mock):
+        newer = _snapshot(time_next_update_unix=2000, time_last_update_unix=1000)
+        mock_get.side_effect = [
+            raw_response(_snapshot().model_dump(), headers=self.validators),
+            raw_response(newer.model_dump(), headers={"ETag": '"v2"'}),
+        ]
+
+        first = self.client.fetch_exchange_rates("USD")
+
+        self.clock.now = 1000
+
+        second = self.client.fetch_exchange_rates("USD")
+
+        self.assertIsNot(first, second)
+        self.assertEqual(second.time_last_update_unix, 1000)
+        self.assertEqual(self.cache.get_stale("USD").etag, '"v2"')
+        self.assertEqual(self.cache.revalidations, 0)
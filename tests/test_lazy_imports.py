@@ -0,0 +1,57 @@
+import subprocess
+
+import sys
+
+import unittest
+
+import exchange_rate_api_client
+
+
+HEAVY_MODULES = ("requests", "pydantic", "httpx", "numpy")
+
+
+def loaded_heavy_modules(code: str):
+    # A fresh interpreter, since this one already imported everything
+    script = (
+        f"{code}\n"
+        "import sys\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    ).stdout.strip()
+    return set(output.split(",")) - {""}
+
+
+class TestLazyImports(unittest.TestCase):
+    def test_package_import_loads_no_heavy_dependency(self):
+        self.assertEqual(
+            loaded_heavy_modules(
+                "import exchange_rate_api_client\n"
+                "from exchange_rate_api_client import exceptions"
+            ),
+            set(),
+        )
+
+    def test_client_access_loads_only_its_dependencies(self):
+        self.assertEqual(
+            loaded_heavy_modules(
+                "from exchange_rate_api_client import ExchangeRateApiV6Client"
+            ),
+            {"requests", "pydantic"},
+        )
+
+    def test_every_exported_name_resolves(self):
+        for name in exchange_rate_api_client.__all__:
+            with self.subTest(name=name):
+                self.assertIsNotNone(getattr(exchange_rate_api_client, name))
+
+        self.assertIn("ExchangeRateApiV6Client", dir(exchange_rate_api_client))
+
+    def test_unknown_attribute_raises_attribute_error(self):
+        with self.assertRaises(AttributeError):
+            exchange_rate_api_client.DoesNotExist
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,17 +1,47 @@
+import time
+
 import unittest
 
 from unittest.mock import patch, Mock
 
-from exchange_rate_api_client._open import fetch_exchange_rates
+import requests
+
+from exchange_rate_api_client import _open
+
+from exchange_rate_api_client._open import fetch_exchange_rates, OpenExchangeRateClient
 
 from exchange_rate_api_client.commons import ExchangeRates
 
-from exchange_rate_api_client.exceptions import UnsupportedCode
+from exchange_rate_api_client.exceptions import (
+    UnsupportedCode,
+    RequestTimeout,
+    ServerError,
+)
+
+from tests.helpers import json_response
+
+
+def open_rates_data(time_next_update_unix=1585959987):
+    return {
+        "result": "success",
+        "time_last_update_unix": 1585872397,
+        "time_last_update_utc": "Fri, 02 Apr 2020 00:06:37 +0000",
+        "time_next_update_unix": time_next_update_unix,
+        "time_next_update_utc": "Sat, 03 Apr 2020 00:26:27 +0000",
+        "time_eol_unix": 0,
+        "base_code": "USD",
+        "rates": {"USD": 1, "EUR": 0.919},
+    }
 
 
 class TestFetchExchangeRates(unittest.TestCase):
-    @patch("exchange_rate_api_client._open.requests.get")
+    def setUp(self):
+        # Start every test with a new shared client and an empty cache
+        _open._default_client = None
+
+    @patch("exchange_rate_api_client._open.requests.Session.get")
     def test_fetch_exchange_rates(self, mock_get: Mock):
+        mock_get.return_value.status_code = 200
         mock_get.return_value.json.return_value = {
             "time_last_update_unix": 1585872397,
             "time_last_update_utc": "Fri, 02 Apr 2020 00:06:37 +0000",
@@ -73,9 +103,85 @@ class TestFetchExchangeRates(unittest.TestCase):
         with self.assertRaises(ValueError):
             fetch_exchange_rates(221323)  # Not str
 
-    @patch("exchange_rate_api_client._open.requests.get")
+    @patch("exchange_rate_api_client._open.requests.Session.get")
     def test_on_unsupported_code_raises_exception(self, mock_get: Mock):
+        mock_get.return_value.status_code = 404
         mock_get.return_value.json.return_value = {"error-type": "unsupported-code"}
 
         with self.assertRaises(UnsupportedCode):
             fetch_exchange_rates("USD")
+
+    @patch("exchange_rate_api_client._open.requests.Session.get")
+    def test_shares_a_default_client(self, mock_get: Mock):
+        mock_get.return_value = json_response(open_rates_data(int(time.time()) + 3600))
+
+        first = fetch_exchange_rates("USD")
+        second = fetch_exchange_rates("USD")
+
+        self.assertIs(first, second)
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertIs(_open._get_default_client(), _open._get_default_client())
+
+
+class TestOpenExchangeRateClient(unittest.TestCase):
+    @patch("exchange_rate_api_client._open.requests.Session.get")
+    def test_requests_are_sent_with_the_timeout(self, mock_get: Mock):
+        mock_get.return_value = json_response(open_rates_data())
+
+        with OpenExchangeRateClient(timeout=(3, 10)) as client:
+            client.fetch_exchange_rates("USD")
+
+        mock_get.assert_called_once_with(
+            "https://open.er-api.com/v6/latest/USD", timeout=(3, 10)
+        )
+
+    @patch("exchange_rate_api_client._open.requests.Session.get")
+    def test_tables_are_cached_until_next_update(self, mock_get: Mock):
+        mock_get.side_effect = [
+            json_response(open_rates_data(int(time.time()) + 3600)),
+            json_response(open_rates_data(int(time.time()) - 1)),
+            json_response(open_rates_data(int(time.time()) - 1)),
+        ]
+        client = OpenExchangeRateClient()
+
+        first = client.fetch_exchange_rates("USD")
+
+        self.assertIs(client.fetch_exchange_rates("USD"), first)
+        self.assertIsNot(client.fetch_exchange_rates("USD", force_refresh=True), first)
+        # Expired tables are fetched again
+        client.fetch_exchange_rates("USD")
+        self.assertEqual(mock_get.call_count, 3)
+        self.assertEqual(client.rates_cache.hits, 1)
+
+    @patch("exchange_rate_api_client._open.requests.Session.get")
+    def test_cache_can_be_disabled(self, mock_get: Mock):
+        mock_get.return_value = json_response(open_rates_data(int(time.time()) + 3600))
+        client = OpenExchangeRateClient(cache=False)
+
+        client.fetch_exchange_rates("USD")
+        client.fetch_exchange_rates("USD")
+
+        self.assertIsNone(client.rates_cache)
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch("exchange_rate_api_client._open.requests.Session.get")
+    def test_transport_and_server_errors(self, mock_get: Mock):
+        client = OpenExchangeRateClient()
+
+        mock_get.side_effect = requests.exceptions.Timeout()
+        with self.assertRaises(RequestTimeout):
+            client.fetch_exchange_rates("USD")
+
+        mock_get.side_effect = None
+        mock_get.return_value = json_response({}, status_code=503)
+        with self.assertRaises(ServerError):
+            client.fetch_exchange_rates("USD")
+
+    def test_shared_sessions_are_left_open(self):
+        session = requests.Session()
+
+        with patch.object(session, "close") as close:
+            with OpenExchangeRateClient(session=session) as client:
+                self.assertIs(client.session, session)
+
+        close.assert_not_called()
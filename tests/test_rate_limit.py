@@ -0,0 +1,175 @@
+import threading
+
+import time
+
+import unittest
+
+from unittest.mock import patch, Mock
+
+from exchange_rate_api_client._client import ExchangeRateApiV6Client
+
+from exchange_rate_api_client._rate_limit import TokenBucket, QuotaGovernor
+
+from exchange_rate_api_client._currencies import BUNDLED_CURRENCY_CODES
+
+from exchange_rate_api_client.commons import APIQuotaStatus
+
+from exchange_rate_api_client.exceptions import QuotaReached, QuotaBudgetExhausted
+
+from tests.helpers import LATEST_DATA, FakeClock, json_response
+
+
+def quota_status(requests_remaining):
+    return APIQuotaStatus(
+        plan_quota=1000,
+        requests_remaining=requests_remaining,
+        refresh_day_of_month=17,
+    )
+
+
+QUOTA_DATA = {"plan_quota": 1000, "requests_remaining": 3, "refresh_day_of_month": 17}
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_burst_then_paced(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2, burst=3, clock=clock, sleep=clock.sleep)
+
+        for _ in range(3):
+            self.assertTrue(bucket.acquire())
+        self.assertEqual(clock.now, 0)
+
+        self.assertTrue(bucket.acquire())
+        self.assertAlmostEqual(clock.now, 0.5)
+
+    def test_non_blocking_and_timeout(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=1, burst=1, clock=clock, sleep=clock.sleep)
+
+        self.assertTrue(bucket.acquire(blocking=False))
+        self.assertFalse(bucket.acquire(blocking=False))
+        self.assertFalse(bucket.acquire(timeout=0.25))
+        self.assertAlmostEqual(clock.now, 0.25)
+
+    def test_invalid_arguments_raise_value_error(self):
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=0)
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=1, burst=0)
+
+
+class TestQuotaGovernor(unittest.TestCase):
+    def test_low_priority_is_refused_at_the_reserve(self):
+        governor = QuotaGovernor(reserve=2)
+        governor.seed(quota_status(3))
+
+        governor.acquire(low_priority=True)
+        with self.assertRaises(QuotaBudgetExhausted):
+            governor.acquire(low_priority=True)
+
+        governor.acquire()
+        governor.acquire()
+        self.assertEqual(governor.remaining, 0)
+        with self.assertRaises(QuotaReached):
+            governor.acquire()
+
+    def test_needs_seed_after_reseed_interval(self):
+        clock = FakeClock()
+        governor = QuotaGovernor(reseed_interval=60, clock=clock)
+        self.assertTrue(governor.needs_seed())
+        self.assertIsNone(governor.remaining)
+
+        governor.seed(quota_status(10))
+        self.assertFalse(governor.needs_seed())
+
+        clock.now = 61
+        self.assertTrue(governor.needs_seed())
+
+    def test_concurrent_cold_start_seeds_once(self):
+        governor = QuotaGovernor()
+        calls = []
+        start = threading.Barrier(8)
+
+        def fetch_status():
+            calls.append(1)
+            time.sleep(0.05)
+            return quota_status(100)
+
+        def call():
+            start.wait()
+            governor.ensure_seeded(fetch_status)
+            governor.acquire()
+
+        threads = [threading.Thread(target=call) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(governor.remaining, 92)
+
+    def test_requests_sent_during_a_reseed_are_deducted(self):
+        clock = FakeClock()
+        governor = QuotaGovernor(reseed_interval=60, clock=clock)
+        governor.seed(quota_status(10))
+        clock.now = 61
+
+        def fetch_status():
+            # Another thread keeps counting against the previous status meanwhile
+            governor.ensure_seeded(self.fail)
+            governor.acquire()
+            return quota_status(50)
+
+        governor.ensure_seeded(fetch_status)
+
+        self.assertEqual(governor.remaining, 49)
+        self.assertFalse(governor.needs_seed())
+
+
+class TestExchangeRateV6ClientQuotaGovernor(unittest.TestCase):
+    def _client(self, governor, low_priority=False):
+        return ExchangeRateApiV6Client(
+            "mock-api-key",
+            codes_snapshot=BUNDLED_CURRENCY_CODES,
+            codes_refresh_interval=None,
+            quota_governor=governor,
+            low_priority=low_priority,
+        )
+
+    @patch("exchange_rate_api_client._client.requests.Session.get")
+    def test_seeds_from_quota_endpoint_and_counts_locally(self, mock_get: Mock):
+        mock_get.side_effect = lambda url, timeout: json_response(
+            QUOTA_DATA if url.endswith("/quota") else LATEST_DATA
+        )
+        governor = QuotaGovernor(reserve=1)
+        client = self._client(governor, low_priority=True)
+
+        client.fetch_exchange_rates("USD")
+        client.fetch_exchange_rates("USD")
+
+        with self.assertRaises(QuotaBudgetExhausted):
+            client.fetch_exchange_rates("USD")
+
+        # One quota request and two counted requests
+        self.assertEqual(mock_get.call_count, 3)
+        self.assertEqual(governor.remaining, 1)
+        self.assertEqual(governor.status.plan_quota, 1000)
+
+    @patch("exchange_rate_api_client._client.requests.Session.get")
+    def test_upstream_quota_reached_exhausts_the_budget(self, mock_get: Mock):
+        mock_get.return_value = json_response(
+            {"result": "error", "error-type": "quota-reached"}, status_code=429
+        )
+        governor = QuotaGovernor()
+        governor.seed(quota_status(50))
+        client = self._client(governor)
+
+        with self.assertRaises(QuotaReached):
+            client.fetch_exchange_rates("USD")
+
+        self.assertEqual(governor.remaining, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
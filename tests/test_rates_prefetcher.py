@@ -0,0 +1,141 @@
+import threading
+
+import time
+
+import unittest
+
+from unittest.mock import patch, Mock, MagicMock
+
+from exchange_rate_api_client._client import ExchangeRateApiV6Client
+
+from exchange_rate_api_client._prefetch import RatesPrefetcher
+
+from exchange_rate_api_client._currencies import BUNDLED_CURRENCY_CODES
+
+from exchange_rate_api_client.commons import ExclusiveExchangeRates
+
+from tests.helpers import FakeClock
+
+
+def latest_rates(base_code, time_next_update_unix, eur_rate=0.9):
+    return ExclusiveExchangeRates(
+        time_last_update_unix=time_next_update_unix - 86400,
+        time_last_update_utc="",
+        time_next_update_unix=time_next_update_unix,
+        time_next_update_utc="",
+        base_code=base_code,
+        conversion_rates={base_code: 1, "EUR": eur_rate},
+    )
+
+
+class TestRatesPrefetcher(unittest.TestCase):
+    def test_configured_bases_are_refreshed_right_away(self):
+        refreshed = threading.Event()
+        calls = []
+
+        def refresh(code):
+            calls.append(code)
+            refreshed.set()
+            return latest_rates(code, int(time.time()) + 3600)
+
+        prefetcher = RatesPrefetcher(refresh, base_codes=["USD"]).start()
+        try:
+            self.assertTrue(refreshed.wait(1))
+        finally:
+            prefetcher.stop(1)
+
+        self.assertEqual(calls, ["USD"])
+        self.assertFalse(prefetcher.running)
+        self.assertAlmostEqual(prefetcher.schedule["USD"], time.time() + 3605, delta=5)
+
+    def test_observed_bases_are_scheduled_after_next_update(self):
+        prefetcher = RatesPrefetcher(lambda code: None, delay=5, clock=lambda: 100)
+
+        prefetcher.observe(latest_rates("USD", 1000))
+        prefetcher.observe(latest_rates("USD", 2000))
+        # Upstream has not updated yet, so the refresh is retried later
+        prefetcher.observe(latest_rates("EUR", 50))
+
+        self.assertEqual(prefetcher.schedule, {"USD": 1005, "EUR": 160})
+
+    def test_observe_can_be_disabled(self):
+        prefetcher = RatesPrefetcher(lambda code: None, observe=False)
+
+        prefetcher.observe(latest_rates("USD", 1000))
+
+        self.assertEqual(prefetcher.schedule, {})
+
+    def test_failed_refresh_is_retried_later(self):
+        prefetcher = RatesPrefetcher(
+            Mock(side_effect=Exception("boom")), retry_interval=30, clock=lambda: 100
+        )
+
+        with self.assertLogs("exchange_rate_api_client._prefetch", "WARNING"):
+            prefetcher._refresh_base("USD")
+
+        self.assertEqual(prefetcher.failures, 1)
+        self.assertEqual(prefetcher.schedule, {"USD": 130})
+
+    def test_bases_not_read_since_their_last_refresh_are_dropped(self):
+        clock = FakeClock()
+        refresh = Mock(side_effect=lambda code: latest_rates(code, clock.now + 1000))
+        prefetcher = RatesPrefetcher(refresh, base_codes=["EUR"], clock=clock)
+
+        prefetcher.observe(latest_rates("USD", 1000))
+        clock.now = 10
+        prefetcher._refresh_base("USD")
+        clock.now = 20
+        prefetcher.observe(latest_rates("USD", 1000))
+        clock.now = 30
+        prefetcher._refresh_base("USD")
+        clock.now = 40
+        prefetcher._refresh_base("USD")
+        # Configured bases are refreshed whether or not they are read
+        prefetcher._refresh_base("EUR")
+        prefetcher._refresh_base("EUR")
+
+        self.assertEqual(
+            [call.args[0] for call in refresh.call_args_list],
+            ["USD", "USD", "EUR", "EUR"],
+        )
+        self.assertEqual(set(prefetcher.schedule), {"EUR"})
+
+        prefetcher.observe(latest_rates("USD", 2000))
+
+        self.assertIn("USD", prefetcher.schedule)
+
+
+class TestExchangeRateV6ClientPrefetching(unittest.TestCase):
+    @patch("exchange_rate_api_client._client.requests.Session.get")
+    def test_prefetched_table_is_served_from_memory(self, mock_get: Mock):
+        response = MagicMock()
+        response.status_code = 200
+        response.json.return_value = latest_rates(
+            "USD", int(time.time()) + 3600
+        ).model_dump()
+        mock_get.return_value = response
+
+        client = ExchangeRateApiV6Client(
+            "mock-api-key",
+            codes_snapshot=BUNDLED_CURRENCY_CODES,
+            codes_refresh_interval=None,
+        )
+        with client:
+            prefetcher = client.start_prefetching(["USD"])
+            deadline = time.time() + 1
+            while prefetcher.refreshes == 0 and time.time() < deadline:
+                time.sleep(0.01)
+
+            client.fetch_exchange_rates("USD")
+            client.fetch_exchange_rates("USD")
+
+            with self.assertRaises(ValueError):
+                client.start_prefetching()
+
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(client.rates_cache.hits, 2)
+        self.assertFalse(prefetcher.running)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,225 @@
+import asyncio
+
+import threading
+
+import time
+
+import unittest
+
+from unittest.mock import patch, Mock
+
+from exchange_rate_api_client._client import ExchangeRateApiV6Client
+
+from exchange_rate_api_client._cache import LatestRatesCache
+
+from exchange_rate_api_client._coalesce import RequestCoalescer, AsyncRequestCoalescer
+
+from exchange_rate_api_client.commons import ExclusiveExchangeRates
+
+from exchange_rate_api_client._currencies import BUNDLED_CURRENCY_CODES
+
+from exchange_rate_api_client.exceptions import QuotaReached
+
+from tests.helpers import LATEST_DATA, json_response
+
+
+class TestRequestCoalescer(unittest.TestCase):
+    def _run_concurrently(self, coalescer, func, n=8):
+        results = []
+        errors = []
+        start = threading.Barrier(n)
+
+        def call():
+            start.wait()
+            try:
+                results.append(coalescer.run("key", func))
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=call) for _ in range(n)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        return results, errors
+
+    def test_identical_calls_share_one_result(self):
+        coalescer = RequestCoalescer()
+        calls = []
+
+        def func():
+            calls.append(1)
+            time.sleep(0.05)
+            return object()
+
+        results, _ = self._run_concurrently(coalescer, func)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len(set(map(id, results))), 1)
+        self.assertEqual((coalescer.calls, coalescer.coalesced), (8, 7))
+
+    def test_exception_is_fanned_out(self):
+        coalescer = RequestCoalescer()
+
+        def func():
+            time.sleep(0.05)
+            raise QuotaReached("quota")
+
+        results, errors = self._run_concurrently(coalescer, func)
+
+        self.assertEqual(results, [])
+        self.assertEqual(len(errors), 8)
+        self.assertTrue(all(isinstance(e, QuotaReached) for e in errors))
+
+    def test_sequential_calls_are_not_coalesced(self):
+        coalescer = RequestCoalescer()
+
+        coalescer.run("key", lambda: 1)
+        coalescer.run("key", lambda: 2)
+
+        self.assertEqual((coalescer.calls, coalescer.coalesced), (2, 0))
+
+
+class TestAsyncRequestCoalescer(unittest.IsolatedAsyncioTestCase):
+    async def test_identical_tasks_share_one_result(self):
+        coalescer = AsyncRequestCoalescer()
+        calls = []
+
+        async def func():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "result"
+
+        results = await asyncio.gather(*(coalescer.run("key", func) for _ in range(5)))
+
+        self.assertEqual(results, ["result"] * 5)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual((coalescer.calls, coalescer.coalesced), (5, 4))
+
+    async def test_exception_is_fanned_out(self):
+        coalescer = AsyncRequestCoalescer()
+
+        async def func():
+            await asyncio.sleep(0.01)
+            raise QuotaReached("quota")
+
+        results = await asyncio.gather(
+            *(coalescer.run("key", func) for _ in range(3)), return_exceptions=True
+        )
+
+        self.assertTrue(all(isinstance(result, QuotaReached) for result in results))
+
+    async def test_cancelling_the_first_task_does_not_cancel_the_others(self):
+        coalescer = AsyncRequestCoalescer()
+        calls = []
+
+        async def func():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "result"
+
+        leader = asyncio.ensure_future(coalescer.run("key", func))
+        await asyncio.sleep(0)
+        waiter = asyncio.ensure_future(coalescer.run("key", func))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+
+        self.assertEqual(await waiter, "result")
+        with self.assertRaises(asyncio.CancelledError):
+            await leader
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(await coalescer.run("key", func), "result")
+        self.assertEqual(len(calls), 2)
+
+
+class TestExchangeRateV6ClientCoalescing(unittest.TestCase):
+    @patch("exchange_rate_api_client._client.requests.Session.get")
+    def test_concurrent_fetch_exchange_rates_make_one_request(self, mock_get: Mock):
+        def fake_get(url, timeout):
+            time.sleep(0.05)
+            return json_response(LATEST_DATA)
+
+        mock_get.side_effect = fake_get
+        coalescer = RequestCoalescer()
+        client = ExchangeRateApiV6Client(
+            "mock-api-key",
+            codes_snapshot=BUNDLED_CURRENCY_CODES,
+            codes_refresh_interval=None,
+            coalescer=coalescer,
+        )
+        start = threading.Barrier(6)
+
+        def call():
+            start.wait()
+            client.fetch_exchange_rates("USD")
+
+        threads = [threading.Thread(target=call) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(coalescer.coalesced, 5)
+
+    @patch("exchange_rate_api_client._client.requests.Session.get")
+    def test_clients_with_and_without_rates_cache_share_a_coalescer(
+        self, mock_get: Mock
+    ):
+        requested = threading.Event()
+        release = threading.Event()
+
+        def fake_get(url, timeout):
+            requested.set()
+            release.wait(1)
+            return json_response(
+                dict(LATEST_DATA, time_next_update_unix=int(time.time()) + 3600)
+            )
+
+        mock_get.side_effect = fake_get
+        coalescer = RequestCoalescer()
+
+        def create_client(rates_cache):
+            return ExchangeRateApiV6Client(
+                "mock-api-key",
+                codes_snapshot=BUNDLED_CURRENCY_CODES,
+                codes_refresh_interval=None,
+                coalescer=coalescer,
+                rates_cache=rates_cache,
+            )
+
+        # Either client can lead the shared request
+        for leader_cached in (True, False):
+            with self.subTest(leader_cached=leader_cached):
+                requested.clear()
+                release.clear()
+                cache = LatestRatesCache()
+                cached, uncached = create_client(cache), create_client(None)
+                leader, follower = (
+                    (cached, uncached) if leader_cached else (uncached, cached)
+                )
+                results = {}
+
+                def call(client):
+                    results[client] = client.fetch_exchange_rates("USD")
+
+                leading = threading.Thread(target=call, args=(leader,))
+                leading.start()
+                requested.wait(1)
+                following = threading.Thread(target=call, args=(follower,))
+                following.start()
+                # Let the follower join the in-flight call before it completes
+                time.sleep(0.05)
+                release.set()
+                leading.join()
+                following.join()
+
+                self.assertEqual(len(results), 2)
+                for result in results.values():
+                    self.assertIsInstance(result, ExclusiveExchangeRates)
+                self.assertIs(cache.get("USD"), results[cached])
+
+        self.assertEqual(coalescer.coalesced, 2)
+
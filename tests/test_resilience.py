@@ -0,0 +1,222 @@
+import unittest
+
+from unittest.mock import patch, Mock, AsyncMock
+
+import httpx
+
+import requests
+
+from exchange_rate_api_client._client import ExchangeRateApiV6Client
+
+from exchange_rate_api_client._async_client import AsyncExchangeRateApiV6Client
+
+from exchange_rate_api_client._resilience import RetryPolicy, CircuitBreaker
+
+from exchange_rate_api_client._currencies import BUNDLED_CURRENCY_CODES
+
+from exchange_rate_api_client.exceptions import (
+    QuotaReached,
+    RequestTimeout,
+    ServerError,
+    ConnectionFailed,
+    CircuitOpen,
+)
+
+from tests.helpers import LATEST_DATA, FakeClock, json_response
+
+
+QUOTA_REACHED_DATA = {"result": "error", "error-type": "quota-reached"}
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_exponential_backoff_with_jitter(self):
+        policy = RetryPolicy(backoff=0.1, max_backoff=0.3, random=lambda: 0.5)
+
+        self.assertAlmostEqual(policy.delay(1), 0.05)
+        self.assertAlmostEqual(policy.delay(2), 0.1)
+        self.assertAlmostEqual(policy.delay(3), 0.15)
+
+    def test_retries_only_transient_errors(self):
+        policy = RetryPolicy(max_attempts=3)
+
+        self.assertTrue(policy.should_retry(RequestTimeout(), 1))
+        self.assertTrue(policy.should_retry(ServerError(), 2))
+        self.assertFalse(policy.should_retry(ServerError(), 3))
+        self.assertFalse(policy.should_retry(QuotaReached(), 1))
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    def test_opens_after_threshold_and_recovers_after_trial(self):
+        clock = FakeClock()
+        changes = []
+        breaker = CircuitBreaker(
+            failure_threshold=2,
+            recovery_timeout=10,
+            on_state_change=lambda *change: changes.append(change),
+            clock=clock,
+        )
+
+        def fail():
+            raise ServerError("boom")
+
+        for _ in range(2):
+            with self.assertRaises(ServerError):
+                breaker.call("latest", fail)
+
+        self.assertEqual(breaker.state("latest"), CircuitBreaker.OPEN)
+        self.assertEqual(breaker.state("pair"), CircuitBreaker.CLOSED)
+        with self.assertRaises(CircuitOpen):
+            breaker.call("latest", lambda: "never called")
+
+        clock.now = 10
+        self.assertEqual(breaker.call("latest", lambda: "ok"), "ok")
+
+        self.assertEqual(
+            changes,
+            [
+                ("latest", "closed", "open"),
+                ("latest", "open", "half-open"),
+                ("latest", "half-open", "closed"),
+            ],
+        )
+
+    def test_failed_trial_reopens_and_typed_errors_count_as_success(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=5, clock=clock)
+
+        def timeout():
+            raise RequestTimeout("slow")
+
+        with self.assertRaises(RequestTimeout):
+            breaker.call("latest", timeout)
+
+        clock.now = 5
+        with self.assertRaises(RequestTimeout):
+            breaker.call("latest", timeout)
+        self.assertEqual(breaker.state("latest"), CircuitBreaker.OPEN)
+
+        def quota_reached():
+            raise QuotaReached("quota")
+
+        clock.now = 10
+        with self.assertRaises(QuotaReached):
+            breaker.call("latest", quota_reached)
+        self.assertEqual(breaker.state("latest"), CircuitBreaker.CLOSED)
+
+
+class TestExchangeRateV6ClientResilience(unittest.TestCase):
+    def _client(self, **kwargs):
+        return ExchangeRateApiV6Client(
+            "mock-api-key",
+            codes_snapshot=BUNDLED_CURRENCY_CODES,
+            codes_refresh_interval=None,
+            **kwargs,
+        )
+
+    @patch("exchange_rate_api_client._client.requests.Session.get")
+    def test_transient_errors_are_retried(self, mock_get: Mock):
+        mock_get.side_effect = [
+            requests.exceptions.ReadTimeout(),
+            requests.exceptions.ConnectionError(),
+            json_response({}, status_code=503),
+            json_response(LATEST_DATA),
+        ]
+        sleeps = []
+        client = self._client(
+            retry_policy=RetryPolicy(max_attempts=4, sleep=sleeps.append)
+        )
+
+        result = client.fetch_exchange_rates("USD")
+
+        self.assertEqual(result.base_code, "USD")
+        self.assertEqual(mock_get.call_count, 4)
+        self.assertEqual(len(sleeps), 3)
+
+    @patch("exchange_rate_api_client._client.requests.Session.get")
+    def test_typed_errors_are_not_retried(self, mock_get: Mock):
+        mock_get.return_value = json_response(QUOTA_REACHED_DATA, status_code=429)
+        client = self._client(retry_policy=RetryPolicy(sleep=lambda _: None))
+
+        with self.assertRaises(QuotaReached):
+            client.fetch_exchange_rates("USD")
+
+        self.assertEqual(mock_get.call_count, 1)
+
+    @patch("exchange_rate_api_client._client.requests.Session.get")
+    def test_timeout_raises_request_timeout(self, mock_get: Mock):
+        mock_get.side_effect = requests.exceptions.ConnectTimeout()
+        client = self._client()
+
+        with self.assertRaises(RequestTimeout) as context:
+            client.fetch_exchange_rates("USD")
+
+        self.assertEqual(
+            str(context.exception), "The request to the Exchange Rate API timed out"
+        )
+
+    @patch("exchange_rate_api_client._client.requests.Session.get")
+    def test_connection_failed_is_a_requests_connection_error(self, mock_get: Mock):
+        mock_get.side_effect = requests.exceptions.ConnectionError()
+        client = self._client()
+
+        with self.assertRaises(requests.exceptions.ConnectionError) as context:
+            client.fetch_exchange_rates("USD")
+
+        self.assertIsInstance(context.exception, ConnectionFailed)
+
+    @patch("exchange_rate_api_client._client.requests.Session.get")
+    def test_open_circuit_fails_fast(self, mock_get: Mock):
+        mock_get.side_effect = requests.exceptions.ConnectionError()
+        breaker = CircuitBreaker(failure_threshold=2)
+        client = self._client(
+            retry_policy=RetryPolicy(max_attempts=5, sleep=lambda _: None),
+            circuit_breaker=breaker,
+        )
+
+        with self.assertRaises(CircuitOpen):
+            client.fetch_exchange_rates("USD")
+
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(breaker.state("latest"), CircuitBreaker.OPEN)
+
+
+class TestAsyncExchangeRateV6ClientResilience(unittest.IsolatedAsyncioTestCase):
+    @patch(
+        "exchange_rate_api_client._async_client.httpx.AsyncClient.get",
+        new_callable=AsyncMock,
+    )
+    async def test_server_errors_are_retried(self, mock_get: AsyncMock):
+        mock_get.side_effect = [
+            json_response(
+                {"supported_codes": [["USD", "United States Dollar"]]}
+            ),
+            json_response({}, status_code=502),
+            json_response(LATEST_DATA),
+        ]
+
+        async with AsyncExchangeRateApiV6Client(
+            "mock-api-key", retry_policy=RetryPolicy(backoff=0)
+        ) as client:
+            result = await client.fetch_exchange_rates("USD")
+
+        self.assertEqual(result.base_code, "USD")
+        self.assertEqual(mock_get.call_count, 3)
+
+    @patch(
+        "exchange_rate_api_client._async_client.httpx.AsyncClient.get",
+        new_callable=AsyncMock,
+    )
+    async def test_connection_error_raises_connection_failed(
+        self, mock_get: AsyncMock
+    ):
+        mock_get.side_effect = httpx.ConnectError("refused")
+
+        async with AsyncExchangeRateApiV6Client("mock-api-key") as client:
+            with self.assertRaises(ConnectionFailed) as context:
+                await client.fetch_quota_info()
+
+        self.assertIsInstance(context.exception, httpx.TransportError)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+import math
+
+import threading
+
+import time
+
+import unittest
+
+from unittest.mock import patch, Mock, MagicMock
+
+from exchange_rate_api_client._client import ExchangeRateApiV6Client
+
+from exchange_rate_api_client._codes_cache import SupportedCodesCache
+
+from exchange_rate_api_client._currencies import (
+    BUNDLED_CURRENCIES,
+    BUNDLED_CURRENCY_CODES,
+)
+
+from exchange_rate_api_client.exceptions import InvalidKey
+
+from tests.helpers import FakeClock
+
+
+class TestSupportedCodesCache(unittest.TestCase):
+    def test_first_load_is_single_flight(self):
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            time.sleep(0.05)
+            return ["USD", "EUR"]
+
+        cache = SupportedCodesCache(fetch, timeout=3600)
+        results = []
+
+        threads = [
+            threading.Thread(target=lambda: results.append("USD" in cache))
+            for _ in range(10)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [True] * 10)
+
+    def test_first_load_failure_raises(self):
+        cache = SupportedCodesCache(Mock(side_effect=InvalidKey("bad key")), 3600)
+
+        with self.assertRaises(InvalidKey):
+            cache.get()
+
+    def test_expired_codes_are_served_while_refreshing(self):
+        clock = FakeClock()
+        release = threading.Event()
+        fetch = Mock(side_effect=[["USD"], ["USD", "EUR"]])
+
+        def slow_fetch():
+            if fetch.call_count == 1:
+                release.wait(1)
+            return fetch()
+
+        cache = SupportedCodesCache(slow_fetch, timeout=10, clock=clock)
+        cache.get()
+
+        clock.now = 11
+
+        self.assertEqual(cache.get(), frozenset({"USD"}))
+        self.assertEqual(cache.get(), frozenset({"USD"}))
+
+        release.set()
+        cache.wait_for_refresh(1)
+
+        self.assertEqual(fetch.call_count, 2)
+        self.assertEqual(cache.get(), frozenset({"USD", "EUR"}))
+
+    def test_failed_refresh_keeps_previous_codes(self):
+        clock = FakeClock()
+        fetch = Mock(side_effect=[["USD"], InvalidKey("bad key"), ["USD", "EUR"]])
+        cache = SupportedCodesCache(fetch, timeout=10, retry_interval=5, clock=clock)
+        cache.get()
+
+        clock.now = 11
+
+        with self.assertLogs("exchange_rate_api_client._codes_cache", "WARNING"):
+            cache.get()
+            cache.wait_for_refresh(1)
+
+        self.assertEqual(cache.get(), frozenset({"USD"}))
+        self.assertEqual(fetch.call_count, 2)
+
+        # The failed refresh is retried after the retry interval
+        clock.now = 17
+        cache.get()
+        cache.wait_for_refresh(1)
+
+        self.assertEqual(fetch.call_count, 3)
+        self.assertEqual(cache.get(), frozenset({"USD", "EUR"}))
+
+
+class TestSupportedCodesCacheSeed(unittest.TestCase):
+    def test_seed_is_served_while_live_codes_load_in_background(self):
+        release = threading.Event()
+
+        def fetch():
+            release.wait(1)
+            return ["USD", "EUR", "XYZ"]
+
+        cache = SupportedCodesCache(fetch, timeout=3600, seed=["USD", "EUR"])
+
+        self.assertNotIn("XYZ", cache)
+
+        release.set()
+        cache.wait_for_refresh(1)
+
+        self.assertIn("XYZ", cache)
+
+    def test_seed_without_refresh(self):
+        fetch = Mock()
+        cache = SupportedCodesCache(fetch, timeout=math.inf, seed=["USD"])
+
+        self.assertIn("USD", cache)
+        fetch.assert_not_called()
+
+
+class TestExchangeRateV6ClientCodesSnapshot(unittest.TestCase):
+    @patch("exchange_rate_api_client._client.requests.Session.get")
+    def test_first_request_does_not_wait_for_codes(self, mock_get: Mock):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "base_code": "USD",
+            "target_code": "EUR",
+            "conversion_rate": 0.9,
+        }
+        mock_get.return_value = mock_response
+
+        client = ExchangeRateApiV6Client(
+            "mock-api-key",
+            codes_snapshot=BUNDLED_CURRENCY_CODES,
+            codes_refresh_interval=None,
+        )
+
+        client.pair_conversion("USD", "EUR")
+
+        mock_get.assert_called_once_with(
+            "https://v6.exchangerate-api.com/v6/mock-api-key/pair/USD/EUR", timeout=10
+        )
+
+    def test_bundled_currencies(self):
+        self.assertEqual(BUNDLED_CURRENCIES["EUR"], "Euro")
+        self.assertIn("USD", BUNDLED_CURRENCY_CODES)
+
+    def test_on_missing_snapshot_without_refresh_raises_exception(self):
+        with self.assertRaises(ValueError):
+            ExchangeRateApiV6Client("mock-api-key", codes_refresh_interval=None)
@@ -0,0 +1,126 @@
+import unittest
+
+from unittest.mock import patch, Mock
+
+from pydantic import ValidationError
+
+from exchange_rate_api_client._base import construct_trusted
+
+from exchange_rate_api_client._client import ExchangeRateApiV6Client
+
+from exchange_rate_api_client._currencies import BUNDLED_CURRENCY_CODES
+
+from exchange_rate_api_client.commons import (
+    ExclusiveExchangeRates,
+    HistoricalData,
+    PairConversion,
+    EnrichedData,
+    TargetData,
+)
+
+from tests.helpers import LATEST_DATA
+
+
+ENRICHED_DATA = {
+    "base_code": "USD",
+    "target_code": "JPY",
+    "conversion_rate": 151.2,
+    "target_data": {
+        "locale": "Japan",
+        "two_letter_code": "JP",
+        "currency_name": "Japanese Yen",
+        "currency_name_short": "Yen",
+        "display_symbol": "00A5",
+        "flag_url": "https://www.exchangerate-api.com/img/docs/JP.gif",
+    },
+}
+
+
+class TestConstructTrusted(unittest.TestCase):
+    def test_matches_validated_model(self):
+        trusted = construct_trusted(ExclusiveExchangeRates, LATEST_DATA)
+        validated = ExclusiveExchangeRates.model_validate(LATEST_DATA)
+
+        self.assertEqual(trusted.model_dump(), validated.model_dump())
+        self.assertFalse(hasattr(trusted, "result"))
+
+    def test_whole_floats_are_coerced_to_int(self):
+        trusted = construct_trusted(
+            HistoricalData,
+            {
+                "year": 2015.0,
+                "month": 2,
+                "day": 22,
+                "base_code": "USD",
+                "requested_amount": 4,
+                "conversion_amounts": {"EUR": 3.52},
+            },
+        )
+
+        self.assertIs(type(trusted.year), int)
+
+    def test_optional_fields_keep_their_defaults(self):
+        trusted = construct_trusted(
+            PairConversion,
+            {"base_code": "USD", "target_code": "EUR", "conversion_rate": 0.9},
+        )
+
+        self.assertIsNone(trusted.conversion_result)
+
+    def test_missing_required_field_is_validated(self):
+        data = {key: value for key, value in LATEST_DATA.items() if key != "base_code"}
+
+        with self.assertRaises(ValidationError):
+            construct_trusted(ExclusiveExchangeRates, data)
+
+    def test_mistyped_scalar_field_is_validated(self):
+        with self.assertRaises(ValidationError):
+            construct_trusted(
+                ExclusiveExchangeRates, dict(LATEST_DATA, time_next_update_unix=None)
+            )
+
+        validated = construct_trusted(
+            ExclusiveExchangeRates,
+            dict(LATEST_DATA, time_next_update_unix="1585353700"),
+        )
+        self.assertEqual(validated.time_next_update_unix, 1585353700)
+
+
+class TestExchangeRateV6ClientValidation(unittest.TestCase):
+    def _client(self, **kwargs):
+        return ExchangeRateApiV6Client(
+            "mock-api-key",
+            codes_snapshot=BUNDLED_CURRENCY_CODES,
+            codes_refresh_interval=None,
+            **kwargs,
+        )
+
+    @patch("exchange_rate_api_client._client.requests.Session.get")
+    def test_trusted_responses_skip_value_validation(self, mock_get: Mock):
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = dict(
+            LATEST_DATA, conversion_rates={"EUR": "not a rate"}
+        )
+
+        result = self._client().fetch_exchange_rates("USD")
+
+        self.assertEqual(result.conversion_rates, {"EUR": "not a rate"})
+
+        with self.assertRaises(ValidationError):
+            self._client(strict_validation=True).fetch_exchange_rates("USD")
+
+    @patch("exchange_rate_api_client._client.requests.Session.get")
+    def test_enriched_data_is_built_in_both_modes(self, mock_get: Mock):
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = ENRICHED_DATA
+
+        trusted = self._client().fetch_enriched_data("USD", "JPY")
+        strict = self._client(strict_validation=True).fetch_enriched_data("USD", "JPY")
+
+        self.assertIsInstance(trusted, EnrichedData)
+        self.assertIsInstance(trusted.target_data, TargetData)
+        self.assertEqual(trusted.model_dump(), strict.model_dump())
+
+
+if __name__ == "__main__":
+    unittest.main()